@@ -0,0 +1,276 @@
+"""Benchmarks of the mix design hot paths.
+
+Every case runs over a matrix of grades and exposure conditions and reports
+the best time per operation (``timeit``, best of several repeats) and the peak
+memory allocated by one operation (``tracemalloc``). Results are written as
+JSON and can be compared against a stored baseline; a case regresses when its
+time or peak memory exceeds the baseline by more than the tolerance.
+
+Usage:
+    python benchmarks/bench_mix_design.py                       # run, compare with baseline.json
+    python benchmarks/bench_mix_design.py -o results.json --tolerance 0.5
+    python benchmarks/bench_mix_design.py --update-baseline     # store the current results
+
+The stored baseline is machine specific; regenerate it on the machine that
+runs the comparison.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+import warnings
+from itertools import product
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.batch import compute_mix_designs
+from civilutils.indian_standards.cache import MixDesignCache
+from civilutils.indian_standards.concrete import (
+    ChemicalAdmixture,
+    ConcreteGrade,
+    ConcreteMixDesign,
+    ExposureCondition,
+    Materials,
+    MineralAdmixture,
+    SpecificGravity,
+    compute_mix,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+GRADES = (ConcreteGrade.M20, ConcreteGrade.M30, ConcreteGrade.M40, ConcreteGrade.M50)
+EXPOSURES = (ExposureCondition.MILD, ExposureCondition.MODERATE, ExposureCondition.SEVERE, ExposureCondition.EXTREME)
+MATRIX = tuple(product(GRADES, EXPOSURES))
+
+SPECIFIC_GRAVITIES = [
+    SpecificGravity(Materials.CEMENT, 3.15),
+    SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+    SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+    SpecificGravity(Materials.WATER, 1.00),
+    SpecificGravity(Materials.ADMIXTURE, 1.145),
+]
+
+BATCH_SPECS = {
+    "concrete_grade": [grade for grade, _ in MATRIX],
+    "exposure_condition": [exposure for _, exposure in MATRIX],
+    "cement_specific_gravity": 3.15,
+    "fine_aggregate_specific_gravity": 2.60,
+    "coarse_aggregate_specific_gravity": 2.70,
+    "water_specific_gravity": 1.00,
+    "admixture_specific_gravity": 1.145,
+}
+
+
+def _designs(**kwargs) -> list:
+    return [
+        ConcreteMixDesign(concrete_grade=grade, exposure_condition=exposure,
+                          specific_gravities=SPECIFIC_GRAVITIES, **kwargs)
+        for grade, exposure in MATRIX
+    ]
+
+
+def _fresh(**kwargs):
+    """Full computation of new designs over the matrix."""
+    def run():
+        for design in _designs(**kwargs):
+            design.compute_mix_design()
+    return run
+
+
+def _volume():
+    def run():
+        for design in _designs():
+            design.compute_mix_design_for_volume(6.5)
+    return run
+
+
+def _display():
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for design in _designs():
+                design.compute_mix_design(display_result=True)
+    return run
+
+
+def _cached():
+    cache = MixDesignCache(maxsize=len(MATRIX))
+    designs = _designs(result_cache=cache)
+    for design in designs:
+        design.compute_mix_design()
+
+    def run():
+        for design in designs:
+            design.compute_mix_design()
+    return run
+
+
+def _moisture_update():
+    designs = _designs()
+    for design in designs:
+        design.compute_mix_design()
+    state = {"moisture": 0.0}
+
+    def run():
+        state["moisture"] = 2.0 - state["moisture"]
+        for design in designs:
+            design.set_inputs(fine_aggregate_surface_moisture=state["moisture"])
+            design.compute_mix_design()
+    return run
+
+
+def _threaded(workers: int = 4):
+    """Pure-core computation of the matrix fanned out over a thread pool."""
+    specs = [design.to_spec() for design in _designs()]
+    executor = ThreadPoolExecutor(max_workers=workers)
+
+    def run():
+        for _ in executor.map(compute_mix, specs):
+            pass
+    return run
+
+
+def _batch():
+    def run():
+        compute_mix_designs(BATCH_SPECS)
+    return run
+
+
+# name -> factory returning a zero-argument callable running one operation
+CASES = {
+    "scalar": _fresh,
+    "fly_ash": lambda: _fresh(mineral_admixture=MineralAdmixture.FLY_ASH),
+    "superplasticizer": lambda: _fresh(chemical_admixture=ChemicalAdmixture.SUPERPLASTICIZER),
+    "volume": _volume,
+    "display": _display,
+    "cached": _cached,
+    "moisture_update": _moisture_update,
+    "threaded": _threaded,
+    "batch": _batch,
+}
+
+
+def measure(operation, number: int, repeat: int) -> dict:
+    """Time and memory profile of one operation.
+
+    Args:
+        operation (callable): Zero-argument callable.
+        number (int): Calls per timing sample.
+        repeat (int): Number of timing samples; the best is kept.
+
+    Returns:
+        dict: seconds_per_op (best sample) and peak_bytes (tracemalloc peak of one call).
+    """
+    operation()  # warm up lazy tables and caches
+    best = min(timeit.Timer(operation).repeat(repeat=repeat, number=number)) / number
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds_per_op": best, "peak_bytes": peak}
+
+
+def run_benchmarks(cases=None, number: int = 20, repeat: int = 5) -> dict:
+    """Run benchmark cases.
+
+    Args:
+        cases (iterable[str] | None, optional): Names in CASES. Defaults to None (all cases).
+        number (int, optional): Calls per timing sample. Defaults to 20.
+        repeat (int, optional): Timing samples per case. Defaults to 5.
+
+    Raises:
+        ValueError: If a case name is unknown.
+
+    Returns:
+        dict: Run metadata and a "cases" dict of measurements keyed by case name.
+    """
+    names = list(CASES) if cases is None else list(cases)
+    unknown = set(names) - set(CASES)
+    if unknown:
+        raise ValueError(f"unknown benchmark cases: {sorted(unknown)}")
+    results = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for name in names:
+            results[name] = dict(measure(CASES[name](), number, repeat), designs_per_op=len(MATRIX))
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "cases": results,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.25) -> list:
+    """Compare results with a baseline.
+
+    Args:
+        results (dict): Output of run_benchmarks().
+        baseline (dict): A previous output of run_benchmarks().
+        tolerance (float, optional): Allowed relative increase (0.25 == 25%). Defaults to 0.25.
+
+    Returns:
+        list[str]: One message per regressed metric; empty when nothing regressed.
+    """
+    regressions = []
+    for name, current in results["cases"].items():
+        reference = baseline.get("cases", {}).get(name)
+        if reference is None:
+            continue
+        for metric in ("seconds_per_op", "peak_bytes"):
+            if reference[metric] > 0 and current[metric] > reference[metric] * (1.0 + tolerance):
+                ratio = current[metric] / reference[metric]
+                regressions.append(f"{name}: {metric} {current[metric]:.6g} is {ratio:.2f}x baseline {reference[metric]:.6g}")
+    return regressions
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the mix design hot paths.")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file ('-' for stdout)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON (default benchmarks/baseline.json)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown (default 0.25)")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--case", action="append", choices=sorted(CASES), help="run only this case (repeatable)")
+    parser.add_argument("--number", type=int, default=20, help="calls per timing sample (default 20)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing samples per case (default 5)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.case, number=args.number, repeat=args.repeat)
+    for name, case in results["cases"].items():
+        print(f"{name:<18} {case['seconds_per_op'] * 1e3:10.3f} ms/op {case['peak_bytes'] / 1024:10.1f} KiB peak",
+              file=sys.stderr)
+
+    if args.output == "-":
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    elif args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as handle:
+            json.dump(results, handle, indent=2)
+            handle.write("\n")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --update-baseline to create one", file=sys.stderr)
+        return 0
+    with open(args.baseline) as handle:
+        regressions = compare(results, json.load(handle), args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Command line interface for civilutils.
+
+Example:
+    civilutils batch orders.csv -o designs.jsonl \\
+        --set cement_specific_gravity=3.15 --set fine_aggregate_specific_gravity=2.6 \\
+        --set coarse_aggregate_specific_gravity=2.7 --set water_specific_gravity=1.0 \\
+        --set admixture_specific_gravity=1.145 --progress
+    civilutils serve --port 8080
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from civilutils.indian_standards.concrete import DEFAULT_TABLE_VERSION, TABLE_SETS
+from civilutils.indian_standards.orders import (
+    OrderResultWriter,
+    iter_order_designs,
+    parse_order,
+    read_order_rows,
+)
+from civilutils.server import MixDesignServer
+
+
+def _detect_format(path: str, fmt: str | None) -> str:
+    if fmt:
+        return fmt
+    return "jsonl" if os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson") else "csv"
+
+
+def _parse_defaults(assignments: list) -> dict:
+    raw = {}
+    for assignment in assignments:
+        name, sep, value = assignment.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got {assignment!r}")
+        raw[name.strip()] = value.strip()
+    defaults, _ = parse_order(raw)
+    return defaults
+
+
+def _open(path: str, mode: str, std):
+    if path == "-":
+        return std
+    return open(path, mode, newline="")
+
+
+def run_batch(args) -> int:
+    """Run the ``batch`` command: stream order rows through the mix design engine."""
+    defaults = _parse_defaults(args.set)
+    in_fmt = _detect_format(args.input, args.input_format)
+    out_fmt = _detect_format(args.output, args.output_format)
+
+    source = _open(args.input, "r", sys.stdin)
+    target = _open(args.output, "w", sys.stdout)
+    writer = OrderResultWriter(target, out_fmt)
+    started = last_report = time.perf_counter()
+    try:
+        rows = read_order_rows(source, in_fmt)
+        for row in iter_order_designs(rows, defaults=defaults, chunk_size=args.chunk_size,
+                                      table_version=args.table_version):
+            writer.write(row)
+            if args.progress and writer.rows_written % args.chunk_size == 0:
+                now = time.perf_counter()
+                if now - last_report >= 1.0:
+                    last_report = now
+                    rate = writer.rows_written / (now - started)
+                    print(f"{writer.rows_written} rows ({rate:,.0f} rows/s)", file=sys.stderr)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+        else:
+            target.flush()
+
+    if args.progress:
+        elapsed = time.perf_counter() - started
+        rate = writer.rows_written / elapsed if elapsed > 0 else 0.0
+        print(f"done: {writer.rows_written} rows in {elapsed:.2f} s ({rate:,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+def run_serve(args) -> int:
+    """Run the ``serve`` command: the HTTP/JSON mix design service."""
+    server = MixDesignServer(args.host, args.port, batch_window=args.batch_window_ms / 1000.0,
+                             max_batch_size=args.max_batch_size, table_version=args.table_version)
+
+    async def serve():
+        await server.start()
+        print(f"serving mix designs on http://{server.host}:{server.port}", file=sys.stderr)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the top-level argument parser."""
+    parser = argparse.ArgumentParser(prog="civilutils", description="Civil engineering utilities.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="compute IS 10262 mix designs for a CSV/JSONL order file")
+    batch.add_argument("input", help="order file (CSV or JSON lines), '-' for stdin")
+    batch.add_argument("-o", "--output", default="-", help="result file, '-' for stdout (default)")
+    batch.add_argument("--input-format", choices=("csv", "jsonl"), help="defaults to the input file extension")
+    batch.add_argument("--output-format", choices=("csv", "jsonl"), help="defaults to the output file extension")
+    batch.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                       help="default for a field missing from the orders, e.g. cement_specific_gravity=3.15")
+    batch.add_argument("--chunk-size", type=int, default=4096, help="rows evaluated together (default 4096)")
+    batch.add_argument("--table-version", choices=sorted(TABLE_SETS), default=DEFAULT_TABLE_VERSION,
+                       help=f"edition of the IS 10262 tables (default {DEFAULT_TABLE_VERSION!r})")
+    batch.add_argument("--progress", action="store_true", help="report rows/s on stderr")
+    batch.set_defaults(handler=run_batch)
+
+    serve = commands.add_parser("serve", help="serve mix designs over HTTP/JSON")
+    serve.add_argument("--host", default="127.0.0.1", help="interface to bind (default 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8080, help="TCP port (default 8080)")
+    serve.add_argument("--batch-window-ms", type=float, default=2.0,
+                       help="milliseconds to collect requests into one batch evaluation (default 2)")
+    serve.add_argument("--max-batch-size", type=int, default=512,
+                       help="distinct designs that trigger an immediate evaluation (default 512)")
+    serve.add_argument("--table-version", choices=sorted(TABLE_SETS), default=DEFAULT_TABLE_VERSION,
+                       help=f"edition of the IS 10262 tables (default {DEFAULT_TABLE_VERSION!r})")
+    serve.set_defaults(handler=run_serve)
+    return parser
+
+
+def main(argv: list | None = None) -> int:
+    """Entry point of the ``civilutils`` console script."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (ValueError, argparse.ArgumentTypeError) as exc:
+        parser.error(str(exc))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""Streaming IS 456 acceptance checks for cube test results.
+
+IS 456 (Table 11) accepts concrete of a grade when
+
+* the mean of every group of 4 non-overlapping consecutive results is at
+  least the greater of f_ck + 0.825 x the established standard deviation
+  (rounded off to the nearest 0.5 N/mm^2) and f_ck + 3 N/mm^2 (M15) or
+  f_ck + 4 N/mm^2 (M20 and above), and
+* every individual result is at least f_ck - 3 N/mm^2 (M15) or
+  f_ck - 4 N/mm^2 (M20 and above).
+
+Without an established standard deviation the assumed value of the clause
+tables (IS 456 Table 8) is used. M10 is checked with the M15 tolerances.
+
+An ``AcceptanceChecker`` keeps, per source (pour, plant, ...) and grade, only
+the open group and a bounded reorder buffer, so it runs over feeds of any
+length in constant memory and emits a ``NonCompliance`` event as soon as a
+result or a group fails. Feeds need not be sorted: with ``reorder_window=n``
+up to n results of a source and grade are held and released in sequence
+order. A result older than one already released is late; it is checked on its
+own but joins no group.
+
+Example:
+    checker = AcceptanceChecker(reorder_window=16)
+    for event in checker.stream(lab_feed):      # SampleResult(source, grade, sequence, strength)
+        alert(event)
+    for event in checker.flush():
+        alert(event)
+"""
+from collections import namedtuple
+import heapq
+import math
+
+from civilutils.indian_standards.batch import ENUM_LOOKUPS
+from civilutils.indian_standards.concrete import DEFAULT_TABLE_VERSION, get_table_set
+from civilutils.indian_standards.strength import StandardDeviationEstimator
+
+GROUP_SIZE = 4
+
+SampleResult = namedtuple("SampleResult", ("source", "concrete_grade", "sequence", "strength"))
+SampleResult.__doc__ = """One test result (mean strength of a sample's cubes, N/mm^2) of a
+source and grade. sequence orders the results of a source (e.g. casting time
+or sample number)."""
+
+AcceptanceLimits = namedtuple("AcceptanceLimits", ("group_mean", "individual"))
+AcceptanceLimits.__doc__ = """Lowest acceptable mean of a group of 4 results and lowest
+acceptable individual result, in N/mm^2."""
+
+NonCompliance = namedtuple("NonCompliance", ("criterion", "source", "concrete_grade", "sequences", "value", "limit"))
+NonCompliance.__doc__ = """A failed check: criterion is "individual" or "group_mean",
+sequences the results involved, value the result or group mean and limit the
+value it fell short of."""
+
+
+def _grade(value):
+    try:
+        return ENUM_LOOKUPS["concrete_grade"][value]
+    except (KeyError, TypeError):
+        raise ValueError(f"invalid concrete_grade: {value!r}")
+
+
+def acceptance_limits(concrete_grade, standard_deviation: float | None = None,
+                      table_version: str = DEFAULT_TABLE_VERSION) -> AcceptanceLimits:
+    """IS 456 Table 11 acceptance limits of a grade.
+
+    Args:
+        concrete_grade (ConcreteGrade | str): The grade.
+        standard_deviation (float | None, optional): Established standard deviation (N/mm^2). Defaults to None (the assumed value of the clause tables).
+        table_version (str, optional): Edition of the clause tables (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+
+    Raises:
+        ValueError: If the grade, standard deviation or table version is invalid.
+
+    Returns:
+        AcceptanceLimits: The limits.
+    """
+    concrete_grade = _grade(concrete_grade)
+    if standard_deviation is None:
+        standard_deviation = get_table_set(table_version).get_standard_deviation(concrete_grade)
+    elif not 0 < standard_deviation < math.inf:
+        raise ValueError("standard_deviation must be a positive number")
+    fck = int(concrete_grade.value.lstrip("M"))
+    tolerance = 3.0 if fck < 20 else 4.0
+    margin = math.floor(0.825 * standard_deviation * 2 + 0.5) / 2
+    return AcceptanceLimits(fck + max(margin, tolerance), fck - tolerance)
+
+
+class _SeriesState:
+    """Open group and reorder buffer of one source and grade."""
+    __slots__ = ("group", "pending", "released", "arrivals")
+
+    def __init__(self):
+        self.group = []
+        self.pending = []
+        self.released = None
+        self.arrivals = 0
+
+
+class AcceptanceChecker:
+    """Incremental IS 456 acceptance of result feeds, keyed by source and grade."""
+    def __init__(self, standard_deviation=None, reorder_window: int = 0,
+                 table_version: str = DEFAULT_TABLE_VERSION):
+        """Create a checker.
+
+        Args:
+            standard_deviation (dict | StandardDeviationEstimator | None, optional): Established standard deviations, per grade or estimated per source and grade; grades without one use the table value. Defaults to None.
+            reorder_window (int, optional): Results held per source and grade to restore sequence order. Defaults to 0 (feeds are in order).
+            table_version (str, optional): Edition of the clause tables (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+
+        Raises:
+            ValueError: If reorder_window is negative or the table version is unknown.
+        """
+        if reorder_window < 0:
+            raise ValueError("reorder_window must not be negative")
+        self.tables = get_table_set(table_version)
+        self.table_version = table_version
+        self.reorder_window = reorder_window
+        if isinstance(standard_deviation, StandardDeviationEstimator):
+            self.estimator, fixed = standard_deviation, {}
+        else:
+            self.estimator = None
+            fixed = {_grade(grade): value for grade, value in (standard_deviation or {}).items()}
+        self._limits = {grade: acceptance_limits(grade, fixed.get(grade), table_version)
+                        for grade in ENUM_LOOKUPS["concrete_grade"].values()}
+        self._series = {}
+        self.results = 0
+        self.groups = 0
+        self.late = 0
+        self.non_compliances = 0
+
+    def limits(self, source, concrete_grade) -> AcceptanceLimits:
+        """Limits currently applied to a source and grade (table limits while the estimate is missing or 0)."""
+        concrete_grade = _grade(concrete_grade)
+        if self.estimator is not None:
+            established = self.estimator.standard_deviation(source, concrete_grade)
+            if established:
+                return acceptance_limits(concrete_grade, established, self.table_version)
+        return self._limits[concrete_grade]
+
+    def check(self, result) -> list:
+        """Check one result.
+
+        Args:
+            result (SampleResult | tuple): (source, concrete_grade, sequence, strength).
+
+        Raises:
+            ValueError: If the grade or strength is invalid.
+
+        Returns:
+            list[NonCompliance]: Events raised by this result (possibly for earlier held results).
+        """
+        source, concrete_grade, sequence, strength = result
+        concrete_grade = _grade(concrete_grade)
+        try:
+            strength = float(strength)
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid strength: {strength!r}")
+        if math.isnan(strength):
+            raise ValueError(f"invalid strength: {strength!r}")
+        self.results += 1
+        events = []
+        limit = self._limits[concrete_grade].individual
+        if strength < limit:
+            events.append(NonCompliance("individual", source, concrete_grade, (sequence,), strength, limit))
+
+        key = (source, concrete_grade)
+        state = self._series.get(key)
+        if state is None:
+            state = self._series[key] = _SeriesState()
+        if self.reorder_window == 0:
+            self._release(key, state, sequence, strength, events)
+        elif state.released is not None and sequence < state.released:
+            self.late += 1
+        else:
+            state.arrivals += 1
+            heapq.heappush(state.pending, (sequence, state.arrivals, strength))
+            if len(state.pending) > self.reorder_window:
+                sequence, _, strength = heapq.heappop(state.pending)
+                self._release(key, state, sequence, strength, events)
+        self.non_compliances += len(events)
+        return events
+
+    def _release(self, key, state, sequence, strength, events):
+        state.released = sequence
+        group = state.group
+        group.append((sequence, strength))
+        if len(group) < GROUP_SIZE:
+            return
+        state.group = []
+        self.groups += 1
+        mean = sum(value for _, value in group) / GROUP_SIZE
+        limit = self.limits(*key).group_mean
+        if mean < limit:
+            events.append(NonCompliance("group_mean", key[0], key[1],
+                                        tuple(seq for seq, _ in group), mean, limit))
+
+    def stream(self, results):
+        """Lazily yield NonCompliance events for an iterable of results."""
+        check = self.check
+        for result in results:
+            yield from check(result)
+
+    async def astream(self, results):
+        """Asynchronously yield NonCompliance events for an async iterable of results."""
+        check = self.check
+        async for result in results:
+            for event in check(result):
+                yield event
+
+    def flush(self, source=None) -> list:
+        """Release every held result and forget the series (of one source, or all).
+
+        Incomplete trailing groups are discarded unjudged.
+
+        Returns:
+            list[NonCompliance]: Events raised by the released results.
+        """
+        events = []
+        for key in [key for key in self._series if source is None or key[0] == source]:
+            state = self._series.pop(key)
+            while state.pending:
+                sequence, _, strength = heapq.heappop(state.pending)
+                self._release(key, state, sequence, strength, events)
+        self.non_compliances += len(events)
+        return events
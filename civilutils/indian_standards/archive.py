@@ -0,0 +1,251 @@
+"""Indexed SQLite archive of issued mix designs.
+
+Every archived design is one row of the ``designs`` table holding its inputs
+(enum inputs as member names, e.g. ``"VERY_SEVERE"``), its results (named as
+``batch.RESULT_COLUMNS``) and its provenance: when it was issued, by whom,
+under which reference and with which edition of the clause tables. The
+database runs in WAL mode, so readers are not blocked by an insert, and
+inserts are bulk ``executemany`` calls in a single transaction. Indexes cover
+grade, exposure, aggregate size and zone, the admixtures and the issue time.
+
+Example:
+    archive = SQLiteArchive("designs.sqlite")
+    archive.insert_designs(designs, issued_by="QA", reference="PO-1042")
+    rows = archive.query(concrete_grade="M35", exposure_condition="Very Severe",
+                         mineral_admixture="Fly Ash", mineral_admixture_percentage=(25, None),
+                         issued_from="2026-07-01", issued_to="2026-10-01")
+    for row in rows:
+        print(row.id, row.issued_at, row.cement_mass_kg)
+"""
+from collections import namedtuple
+from datetime import date, datetime, timezone
+import sqlite3
+import warnings
+
+from civilutils.indian_standards.batch import (
+    ENUM_COLUMNS,
+    ENUM_LOOKUPS,
+    RESULT_COLUMNS,
+    compute_mix_designs,
+    design_spec,
+    normalize_specs,
+    resolve_percentage,
+)
+from civilutils.indian_standards.concrete import DEFAULT_TABLE_VERSION, get_table_set
+from civilutils.indian_standards.design_space import CONTINUOUS_INPUTS
+
+SCHEMA_VERSION = 1
+
+PROVENANCE_COLUMNS = ("issued_at", "issued_by", "reference", "table_version")
+NUMERIC_COLUMNS = ("is_pumpable",) + CONTINUOUS_INPUTS + RESULT_COLUMNS
+# every column of the designs table except the id, in insert order
+ARCHIVE_COLUMNS = PROVENANCE_COLUMNS + tuple(ENUM_COLUMNS) + NUMERIC_COLUMNS
+
+_INDEXES = {
+    "designs_grade_exposure": ("concrete_grade", "exposure_condition", "issued_at"),
+    "designs_size_zone": ("maximum_nominal_size", "fine_aggregate_zone"),
+    "designs_chemical_admixture": ("chemical_admixture",),
+    "designs_mineral_admixture": ("mineral_admixture", "mineral_admixture_percentage"),
+    "designs_issued_at": ("issued_at",),
+}
+
+_ROW_TYPES = {}
+
+
+def _timestamp(value) -> str | None:
+    """ISO-8601 UTC text (sortable) for a datetime, date or ISO string."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat(timespec="seconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    raise ValueError(f"invalid timestamp: {value!r}")
+
+
+def _enum_name(name: str, value):
+    if value is None:
+        return None
+    try:
+        return ENUM_LOOKUPS[name][value].name
+    except (KeyError, TypeError):
+        raise ValueError(f"invalid {name}: {value!r}")
+
+
+def _row_type(columns: tuple):
+    row_type = _ROW_TYPES.get(columns)
+    if row_type is None:
+        row_type = _ROW_TYPES[columns] = namedtuple("ArchivedDesign", columns)
+    return row_type
+
+
+class SQLiteArchive:
+    """SQLite-backed archive of issued designs with indexed point queries."""
+    def __init__(self, path: str, table_version: str = DEFAULT_TABLE_VERSION):
+        """Open (or create) an archive.
+
+        Args:
+            path (str): Database file (":memory:" for a private in-memory archive).
+            table_version (str, optional): Edition of the clause tables used to compute inserted designs. Defaults to DEFAULT_TABLE_VERSION.
+
+        Raises:
+            ValueError: If the table version is unknown or the database holds a newer schema.
+        """
+        get_table_set(table_version)
+        self.table_version = table_version
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"archive schema {version} is newer than supported ({SCHEMA_VERSION})")
+        if version < SCHEMA_VERSION:
+            self._create_schema()
+
+    def _create_schema(self):
+        definitions = ", ".join(
+            [f"{name} TEXT" for name in PROVENANCE_COLUMNS + tuple(ENUM_COLUMNS)]
+            + [f"{name} REAL" for name in NUMERIC_COLUMNS])
+        with self.connection:
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS designs (id INTEGER PRIMARY KEY, {definitions})")
+            for index, columns in _INDEXES.items():
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS {index} ON designs ({', '.join(columns)})")
+            self.connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def insert(self, specs: dict, issued_at=None, issued_by: str | None = None, reference: str | None = None) -> int:
+        """Compute designs for spec columns and archive them in one transaction.
+
+        Args:
+            specs (dict): Input columns as for batch.compute_mix_designs().
+            issued_at (datetime | date | str | None, optional): Issue time. Defaults to None (now, UTC).
+            issued_by (str | None, optional): Who issued the designs. Defaults to None.
+            reference (str | None, optional): Order or project reference. Defaults to None.
+
+        Raises:
+            ValueError: If the specs or the timestamp are invalid.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        n_rows, columns = normalize_specs(specs)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = compute_mix_designs(columns, self.table_version)
+        for kind in ("chemical", "mineral"):
+            name = f"{kind}_admixture_percentage"
+            columns[name] = [resolve_percentage(admixture, percentage)
+                             for admixture, percentage in zip(columns[f"{kind}_admixture"], columns[name])]
+        issued_at = _timestamp(issued_at) or _timestamp(datetime.now(timezone.utc))
+        provenance = (issued_at, issued_by, reference, self.table_version)
+        data = (
+            [[member.name if member is not None else None for member in columns[name]] for name in ENUM_COLUMNS]
+            + [[1 if value else 0 for value in columns["is_pumpable"]]]
+            + [columns[name] for name in CONTINUOUS_INPUTS]
+            + [results[name] for name in RESULT_COLUMNS]
+        )
+        statement = (f"INSERT INTO designs ({', '.join(ARCHIVE_COLUMNS)}) "
+                     f"VALUES ({', '.join('?' * len(ARCHIVE_COLUMNS))})")
+        with self.connection:
+            self.connection.executemany(statement, (provenance + row for row in zip(*data)))
+        return n_rows
+
+    def insert_designs(self, designs, issued_at=None, issued_by: str | None = None, reference: str | None = None) -> int:
+        """Archive ConcreteMixDesign instances (see insert()).
+
+        Raises:
+            ValueError: If a design uses another table version than the archive.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        designs = list(designs)
+        if any(design.table_version != self.table_version for design in designs):
+            raise ValueError(f"every design must use {self.table_version!r}")
+        if not designs:
+            return 0
+        specs = [design_spec(design) for design in designs]
+        return self.insert({name: [spec[name] for spec in specs] for name in specs[0]},
+                           issued_at, issued_by, reference)
+
+    def _where(self, issued_from, issued_to, filters: dict) -> tuple:
+        clauses, parameters = [], []
+        for name, value in filters.items():
+            if name in ENUM_COLUMNS:
+                values = value if isinstance(value, (list, tuple, set, frozenset)) else (value,)
+                names = [_enum_name(name, v) for v in values]
+                if None in names:
+                    names.remove(None)
+                    clauses.append(f"({name} IS NULL"
+                                   + (f" OR {name} IN ({', '.join('?' * len(names))}))" if names else ")"))
+                else:
+                    clauses.append(f"{name} IN ({', '.join('?' * len(names))})")
+                parameters.extend(names)
+            elif name in NUMERIC_COLUMNS:
+                low, high = value if isinstance(value, (list, tuple)) else (value, value)
+                if low is not None:
+                    clauses.append(f"{name} >= ?")
+                    parameters.append(low)
+                if high is not None:
+                    clauses.append(f"{name} <= ?")
+                    parameters.append(high)
+            elif name in ("issued_by", "reference", "table_version"):
+                clauses.append(f"{name} = ?")
+                parameters.append(value)
+            else:
+                raise ValueError(f"cannot filter on {name!r}")
+        if issued_from is not None:
+            clauses.append("issued_at >= ?")
+            parameters.append(_timestamp(issued_from))
+        if issued_to is not None:
+            clauses.append("issued_at < ?")
+            parameters.append(_timestamp(issued_to))
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), parameters
+
+    def query(self, columns=None, issued_from=None, issued_to=None, limit: int | None = None, **filters) -> list:
+        """Find archived designs.
+
+        Filters on enum inputs take a value or a list of values (members, names or values;
+        None matches designs without that admixture). Filters on numeric columns take a
+        value or inclusive (low, high) bounds, either of which may be None. issued_by,
+        reference and table_version match exactly.
+
+        Args:
+            columns (iterable[str] | None, optional): Columns to return. Defaults to None (id and ARCHIVE_COLUMNS).
+            issued_from (datetime | date | str | None, optional): Earliest issue time (inclusive). Defaults to None.
+            issued_to (datetime | date | str | None, optional): Latest issue time (exclusive). Defaults to None.
+            limit (int | None, optional): Maximum number of rows. Defaults to None.
+            **filters: Column filters, see above.
+
+        Raises:
+            ValueError: If a column, filter or value is invalid.
+
+        Returns:
+            list[ArchivedDesign]: Namedtuple rows in issue order (enum inputs as member names).
+        """
+        columns = ("id",) + ARCHIVE_COLUMNS if columns is None else tuple(columns)
+        unknown = set(columns) - set(("id",) + ARCHIVE_COLUMNS)
+        if unknown:
+            raise ValueError(f"unknown columns: {sorted(unknown)}")
+        where, parameters = self._where(issued_from, issued_to, filters)
+        sql = f"SELECT {', '.join(columns)} FROM designs{where} ORDER BY issued_at, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(int(limit))
+        row_type = _row_type(columns)
+        return [row_type._make(row) for row in self.connection.execute(sql, parameters)]
+
+    def count(self, issued_from=None, issued_to=None, **filters) -> int:
+        """Number of archived designs matching the filters of query()."""
+        where, parameters = self._where(issued_from, issued_to, filters)
+        return self.connection.execute(f"SELECT COUNT(*) FROM designs{where}", parameters).fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
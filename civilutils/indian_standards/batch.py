@@ -0,0 +1,366 @@
+"""Columnar batch evaluation of IS 10262 concrete mix designs.
+
+The batch engine runs the same pipeline as
+:meth:`civilutils.indian_standards.concrete.ConcreteMixDesign.compute_mix_design`
+over columns of inputs, without building a ``ConcreteMixDesign`` per row.
+Results are returned as ``array('d')`` columns whose values are identical to
+the ones produced by the scalar path.
+"""
+from array import array
+import warnings
+
+from civilutils.indian_standards.concrete import (
+    ChemicalAdmixture,
+    ConcreteGrade,
+    ExposureCondition,
+    FineAggregateZone,
+    Materials,
+    MaximumNominalSize,
+    MineralAdmixture,
+    DEFAULT_TABLE_VERSION,
+)
+from civilutils.indian_standards.design_space import design_index, evaluate_binder, evaluate_entry, get_design_space
+from civilutils.indian_standards.diagnostics import diagnose
+
+# Input columns with their defaults (mirrors ConcreteMixDesign.__init__).
+# Columns without a default are mandatory.
+SPEC_COLUMNS = {
+    "concrete_grade": None,
+    "exposure_condition": None,
+    "maximum_nominal_size": MaximumNominalSize.SIZE_20,
+    "fine_aggregate_zone": FineAggregateZone.ZONE_II,
+    "is_pumpable": True,
+    "chemical_admixture": None,
+    "chemical_admixture_percentage": None,
+    "mineral_admixture": None,
+    "mineral_admixture_percentage": None,
+    "slump_mm": 50.0,
+    "coarse_aggregate_water_absorption": 0.0,
+    "coarse_aggregate_surface_moisture": 0.0,
+    "fine_aggregate_water_absorption": 0.0,
+    "fine_aggregate_surface_moisture": 0.0,
+    "cement_specific_gravity": None,
+    "fine_aggregate_specific_gravity": None,
+    "coarse_aggregate_specific_gravity": None,
+    "water_specific_gravity": None,
+    "admixture_specific_gravity": None,
+    # ConcreteMixDesign falls back to 1.0 for fly ash
+    "fly_ash_specific_gravity": 1.0,
+    # None uses the standard deviation of the clause tables
+    "site_standard_deviation": None,
+    # fraction of water added per 25 mm of slump above 50 mm
+    "slump_adjustment_pct_per_25mm": 0.03,
+}
+
+MANDATORY_COLUMNS = ("concrete_grade", "exposure_condition")
+
+SPECIFIC_GRAVITY_COLUMNS = (
+    "cement_specific_gravity",
+    "fine_aggregate_specific_gravity",
+    "coarse_aggregate_specific_gravity",
+    "water_specific_gravity",
+    "admixture_specific_gravity",
+)
+
+# Output columns, named after the keys of the compute_mix_design() result.
+RESULT_COLUMNS = (
+    "target_mean_strength_N_per_mm2",
+    "water_cement_ratio",
+    "cement_mass_kg",
+    "cement_volume_m3",
+    "fly_ash_mass_kg",
+    "fly_ash_volume_m3",
+    "water_mass_kg",
+    "water_volume_m3",
+    "admixture_mass_kg",
+    "admixture_volume_m3",
+    "coarse_aggregate_mass_kg",
+    "coarse_aggregate_volume_m3",
+    "coarse_aggregate_volume_proportion",
+    "fine_aggregate_mass_kg",
+    "fine_aggregate_volume_m3",
+    "fine_aggregate_volume_proportion",
+    "coarse_absorbed_water",
+    "fine_absorbed_water",
+    "coarse_surface_moisture",
+    "fine_surface_moisture",
+    "free_water_after_correction",
+)
+
+ENUM_COLUMNS = {
+    "concrete_grade": ConcreteGrade,
+    "exposure_condition": ExposureCondition,
+    "maximum_nominal_size": MaximumNominalSize,
+    "fine_aggregate_zone": FineAggregateZone,
+    "chemical_admixture": ChemicalAdmixture,
+    "mineral_admixture": MineralAdmixture,
+}
+
+
+def _enum_lookup(enum_cls):
+    """Build a lookup accepting enum members, their names and their values."""
+    lookup = {}
+    for member in enum_cls:
+        lookup[member] = member
+        lookup[member.name] = member
+        value = member.value[0] if isinstance(member.value, tuple) else member.value
+        lookup[value] = member
+        lookup[str(value)] = member
+    return lookup
+
+
+ENUM_LOOKUPS = {name: _enum_lookup(enum_cls) for name, enum_cls in ENUM_COLUMNS.items()}
+
+
+# columns whose None entries fall back to the column default (slump_mm=None
+# means no slump adjustment, as in ConcreteMixDesign)
+DEFAULTED_COLUMNS = tuple(name for name, default in SPEC_COLUMNS.items()
+                          if default is not None and name != "slump_mm")
+
+
+def _broadcast(specs: dict, name: str, n_rows: int) -> list:
+    default = SPEC_COLUMNS[name]
+    value = specs.get(name, default)
+    if value is None and name in DEFAULTED_COLUMNS:
+        value = default
+    if isinstance(value, (list, tuple, array)):
+        if name in DEFAULTED_COLUMNS and None in value:
+            return [default if v is None else v for v in value]
+        return value
+    return [value] * n_rows
+
+
+def _coerce_enum_column(name: str, column) -> list:
+    lookup = ENUM_LOOKUPS[name]
+    coerced = []
+    for value in column:
+        if value is None and name not in MANDATORY_COLUMNS:
+            coerced.append(None)
+            continue
+        try:
+            coerced.append(lookup[value])
+        except (KeyError, TypeError):
+            raise ValueError(f"invalid {name}: {value!r}")
+    return coerced
+
+
+def _column_length(specs: dict) -> int:
+    lengths = {len(v) for v in specs.values() if isinstance(v, (list, tuple, array))}
+    if len(lengths) > 1:
+        raise ValueError("all spec columns must have the same length")
+    return lengths.pop() if lengths else 1
+
+
+def normalize_specs(specs: dict) -> tuple:
+    """Validate spec columns, broadcast scalars and coerce enum columns.
+
+    Args:
+        specs (dict): Input columns keyed by the names in SPEC_COLUMNS.
+
+    None entries of columns with a default (see DEFAULTED_COLUMNS) are
+    replaced by that default.
+
+    Raises:
+        ValueError: If mandatory columns or entries are missing, lengths differ or an enum value is invalid.
+
+    Returns:
+        tuple: The number of rows and a dict holding one column per name in SPEC_COLUMNS.
+    """
+    unknown = set(specs) - set(SPEC_COLUMNS)
+    if unknown:
+        raise ValueError(f"unknown spec columns: {sorted(unknown)}")
+    for name in MANDATORY_COLUMNS:
+        if specs.get(name) is None:
+            raise ValueError(f"{name} column is required")
+    if any(specs.get(name) is None for name in SPECIFIC_GRAVITY_COLUMNS):
+        raise ValueError("Missing mandatory specific gravities.")
+
+    n_rows = _column_length(specs)
+    columns = {name: _broadcast(specs, name, n_rows) for name in SPEC_COLUMNS}
+    for name in SPECIFIC_GRAVITY_COLUMNS:
+        if None in columns[name]:
+            raise ValueError(f"Missing mandatory specific gravities: {name} in row {columns[name].index(None)}")
+    site_sd = columns["site_standard_deviation"]
+    if site_sd.count(None) != n_rows:
+        for i, value in enumerate(site_sd):
+            if value is not None and not (isinstance(value, (int, float)) and 0 < value < float("inf")):
+                raise ValueError(f"site_standard_deviation must be a positive number (row {i})")
+    for name in ENUM_COLUMNS:
+        columns[name] = _coerce_enum_column(name, columns[name])
+    return n_rows, columns
+
+
+def design_spec(design) -> dict:
+    """Express the inputs of a ConcreteMixDesign as a batch spec.
+
+    Args:
+        design (ConcreteMixDesign): The design to convert.
+
+    Returns:
+        dict: Scalar values keyed by the names in SPEC_COLUMNS.
+    """
+    spec = {name: getattr(design, name) for name in SPEC_COLUMNS if hasattr(design, name)}
+    for name in SPECIFIC_GRAVITY_COLUMNS:
+        material = Materials[name[:-len("_specific_gravity")].upper()]
+        sg = design.specific_gravities.get(material)
+        spec[name] = float(sg.value) if sg is not None else None
+    fly_ash = design.specific_gravities.get(MineralAdmixture.FLY_ASH)
+    spec["fly_ash_specific_gravity"] = float(fly_ash.value) if fly_ash is not None else 1.0
+    return spec
+
+
+def resolve_percentage(admixture, percentage) -> float:
+    """Resolve an admixture percentage the way ConcreteMixDesign does.
+
+    Args:
+        admixture (ChemicalAdmixture | MineralAdmixture | None): The admixture type.
+        percentage (float | None): The user-provided percentage.
+
+    Returns:
+        float: 0.0 without admixture, the enum default when no percentage was given.
+    """
+    if admixture is None:
+        return 0.0
+    if percentage is None:
+        return admixture.default_percentage
+    return percentage
+
+
+def resolve_design_entry(spec: dict, table_version: str = DEFAULT_TABLE_VERSION) -> tuple:
+    """Resolve the inputs of a single design and its DESIGN_SPACE entry.
+
+    Args:
+        spec (dict): Scalar inputs keyed by the names in SPEC_COLUMNS.
+        table_version (str, optional): Edition of the clause tables (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+
+    Raises:
+        ValueError: If the spec is invalid or holds more than one design.
+
+    Returns:
+        tuple: The normalized inputs (admixture percentages resolved) keyed by SPEC_COLUMNS names, and the DesignSpaceEntry.
+    """
+    n_rows, columns = normalize_specs(spec)
+    if n_rows != 1:
+        raise ValueError("expected the inputs of a single design")
+    inputs = {name: column[0] for name, column in columns.items()}
+    for kind in ("chemical", "mineral"):
+        inputs[f"{kind}_admixture_percentage"] = resolve_percentage(
+            inputs[f"{kind}_admixture"], inputs[f"{kind}_admixture_percentage"])
+    entry = get_design_space(table_version)[design_index(
+        inputs["concrete_grade"], inputs["exposure_condition"], inputs["maximum_nominal_size"],
+        inputs["fine_aggregate_zone"], inputs["is_pumpable"], inputs["chemical_admixture"],
+        inputs["mineral_admixture"])]
+    return inputs, entry
+
+
+def _maximum_cement_column(maximum_cement_content, n_rows: int):
+    if isinstance(maximum_cement_content, (list, tuple, array)):
+        if len(maximum_cement_content) != n_rows:
+            raise ValueError("all spec columns must have the same length")
+        return maximum_cement_content
+    return [maximum_cement_content] * n_rows
+
+
+def validate_mix_designs(specs: dict, table_version: str = DEFAULT_TABLE_VERSION,
+                         maximum_cement_content=450.0) -> array:
+    """Check columns of inputs against the cement and w/c rules without computing the designs.
+
+    Only the water and binder contents are evaluated, so a whole batch can be
+    screened before it is computed.
+
+    Args:
+        specs (dict): Input columns keyed by the names in SPEC_COLUMNS.
+        table_version (str, optional): Edition of the clause tables (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+        maximum_cement_content (float | list[float] | None, optional): Maximum cement content (kg/m^3), scalar or column; None skips the check. Defaults to 450.0.
+
+    Raises:
+        ValueError: If the specs or the table version are invalid.
+
+    Returns:
+        array: ``array('B')`` of diagnostics codes (see diagnostics.DIAGNOSTICS), one per row.
+    """
+    n_rows, columns = normalize_specs(specs)
+    maximum = _maximum_cement_column(maximum_cement_content, n_rows)
+    space = get_design_space(table_version)
+    codes = array("B", bytes(n_rows))
+    rows = zip(columns["concrete_grade"], columns["exposure_condition"], columns["maximum_nominal_size"],
+               columns["fine_aggregate_zone"], columns["is_pumpable"], columns["chemical_admixture"],
+               columns["chemical_admixture_percentage"], columns["mineral_admixture"],
+               columns["mineral_admixture_percentage"], columns["slump_mm"],
+               columns["slump_adjustment_pct_per_25mm"], maximum)
+    for i, (grade, exposure, size, zone, pumpable, chemical, chemical_pct,
+            mineral, mineral_pct, slump, slump_adjustment, maximum_cement) in enumerate(rows):
+        entry = space[design_index(grade, exposure, size, zone, pumpable, chemical, mineral)]
+        water, computed_cement, cement, fly_ash = evaluate_binder(
+            entry, slump, resolve_percentage(chemical, chemical_pct), resolve_percentage(mineral, mineral_pct),
+            slump_adjustment)
+        codes[i] = diagnose(computed_cement < entry.minimum_cement_content, cement, fly_ash, water,
+                            maximum_cement, entry.maximum_water_cement_ratio)
+    return codes
+
+
+def compute_mix_designs(specs: dict, table_version: str = DEFAULT_TABLE_VERSION,
+                        diagnostics: bool = False, maximum_cement_content=450.0) -> dict:
+    """Compute IS 10262 mix designs for columns of inputs.
+
+    ``specs`` maps input names to columns (lists, tuples or arrays) or to a
+    scalar that is broadcast over every row. Input names follow the
+    ``ConcreteMixDesign`` constructor, with specific gravities given as
+    ``<material>_specific_gravity`` columns. Enum columns accept members,
+    member names or member values (e.g. ``ConcreteGrade.M25``, ``"M25"``).
+
+    By default a single warning reports the rows whose calculated cement
+    content is below the exposure minimum. With diagnostics, no warning is
+    emitted; instead every violated rule of every row is returned in a
+    "diagnostics" column (see diagnostics.DIAGNOSTICS).
+
+    Args:
+        specs (dict): Input columns keyed by the names in SPEC_COLUMNS.
+        table_version (str, optional): Edition of the clause tables (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+        diagnostics (bool, optional): Whether to return diagnostics codes instead of warning. Defaults to False.
+        maximum_cement_content (float | list[float] | None, optional): Maximum cement content (kg/m^3) checked in diagnostics mode, scalar or column. Defaults to 450.0.
+
+    Raises:
+        ValueError: If mandatory columns are missing, lengths differ, an enum value or the table version is invalid.
+
+    Returns:
+        dict: ``array('d')`` result columns keyed by the names in RESULT_COLUMNS, plus an
+        ``array('B')`` "diagnostics" column in diagnostics mode.
+    """
+    n_rows, columns = normalize_specs(specs)
+    results = {name: array("d", bytes(8 * n_rows)) for name in RESULT_COLUMNS}
+    out = [results[name] for name in RESULT_COLUMNS]
+
+    space = get_design_space(table_version)
+    low_cement_rows = 0
+    if diagnostics:
+        codes = results["diagnostics"] = array("B", bytes(n_rows))
+        maximum = _maximum_cement_column(maximum_cement_content, n_rows)
+
+    rows = zip(*(columns[name] for name in SPEC_COLUMNS))
+    for i, (grade, exposure, size, zone, pumpable, chemical, chemical_pct,
+            mineral, mineral_pct, slump, ca_absorption, ca_moisture,
+            fa_absorption, fa_moisture, sg_cement, sg_fine, sg_coarse,
+            sg_water, sg_admixture, sg_fly_ash, site_sd, slump_adjustment) in enumerate(rows):
+        chemical_pct = resolve_percentage(chemical, chemical_pct)
+        mineral_pct = resolve_percentage(mineral, mineral_pct)
+        entry = space[design_index(grade, exposure, size, zone, pumpable, chemical, mineral)]
+        values = evaluate_entry(
+            entry, slump, chemical_pct, mineral_pct, sg_cement, sg_fine,
+            sg_coarse, sg_water, sg_admixture, sg_fly_ash,
+            ca_absorption, ca_moisture, fa_absorption, fa_moisture, site_sd, slump_adjustment)
+        for column, value in zip(out, values):
+            column[i] = value
+        if diagnostics:
+            # cement, fly ash and water are result columns 2, 4 and 6
+            codes[i] = diagnose(values[-1], values[2], values[4], values[6], maximum[i],
+                                entry.maximum_water_cement_ratio)
+        else:
+            low_cement_rows += values[-1]
+
+    if low_cement_rows:
+        warnings.warn(
+            f"Calculated cement content is less than minimum required for exposure condition in {low_cement_rows} of {n_rows} designs",
+            UserWarning
+        )
+    return results
@@ -0,0 +1,136 @@
+"""Bounded LRU cache for concrete mix design results."""
+from collections import OrderedDict
+import threading
+import time
+from types import MappingProxyType
+
+from civilutils.indian_standards.results import MixResult
+
+
+def copy_result(value):
+    """Copy a (nested) mix design result dict so callers cannot mutate shared state.
+
+    Args:
+        value: A result dict, MixResult or read-only mapping of derived values, or any leaf value inside them.
+
+    Returns:
+        A copy where every nested dict, read-only mapping (and MixResult array) is a new object.
+    """
+    if isinstance(value, dict):
+        return {k: copy_result(v) for k, v in value.items()}
+    if isinstance(value, MappingProxyType):
+        return MappingProxyType({k: copy_result(v) for k, v in value.items()})
+    if isinstance(value, MixResult):
+        return value.copy()
+    return value
+
+
+class MixDesignCache:
+    """Bounded least-recently-used cache of compute_mix_design results.
+
+    Entries are keyed on ConcreteMixDesign.fingerprint(), so any change to a
+    design input (including specific gravity values) produces a new entry.
+    Results are copied on the way in and on the way out.
+
+    Example:
+        cache = MixDesignCache(maxsize=256, ttl=3600)
+        design = ConcreteMixDesign(..., result_cache=cache)
+        design.compute_mix_design()   # miss, computed and stored
+        design.compute_mix_design()   # hit
+    """
+    def __init__(self, maxsize: int = 128, ttl: float | None = None, clock=time.monotonic):
+        """Initialize the cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of cached designs. Defaults to 128.
+            ttl (float | None, optional): Time to live of an entry in seconds. Defaults to None (no expiry).
+            clock (callable, optional): Monotonic time source. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If maxsize is not positive or ttl is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than zero")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than zero")
+        self.maxsize = int(maxsize)
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, design, compute):
+        """Return the cached result for design, computing and storing it on a miss.
+
+        On a hit the derived attributes that compute_mix_design() would have
+        set (water_cement_ratio, minimum_cement_content, ...) are restored on
+        the design as well.
+
+        Args:
+            design (ConcreteMixDesign): The design to look up.
+            compute (callable): Zero-argument callable returning the result on a miss.
+
+        Returns:
+            MixResult: A private copy of the mix design result.
+        """
+        key = design.fingerprint()
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result, state = entry
+                if expires_at is not None and now >= expires_at:
+                    del self._entries[key]
+                    self.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    design.__dict__.update(copy_result(state))
+                    return copy_result(result)
+            self.misses += 1
+
+        result = compute()
+        skip = design.INPUT_ATTRIBUTES + design.RUNTIME_ATTRIBUTES
+        state = {k: v for k, v in vars(design).items() if k not in skip}
+        expires_at = None if self.ttl is None else now + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, copy_result(result), copy_result(state))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def stats(self) -> dict:
+        """Return the cache counters.
+
+        Returns:
+            dict: hits, misses, evictions, expirations, current size and maxsize.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self, reset_stats: bool = False):
+        """Remove every entry, optionally resetting the counters.
+
+        Args:
+            reset_stats (bool, optional): Whether to reset hit/miss/eviction counters. Defaults to False.
+        """
+        with self._lock:
+            self._entries.clear()
+            if reset_stats:
+                self.hits = self.misses = self.evictions = self.expirations = 0
@@ -0,0 +1,317 @@
+"""Fixed-schema columnar store for large archives of computed designs.
+
+An archive is a directory holding one raw binary file per column plus a
+``schema.json`` describing it::
+
+    archive/
+        schema.json                 format version, table version, byte order, row count, columns
+        concrete_grade.bin          enum codes (uint8; 0 is None, then members in schema order)
+        ...
+        slump_mm.bin                inputs (float64)
+        ...
+        cement_mass_kg.bin          results (float64, named as batch.RESULT_COLUMNS)
+        ...
+
+Rows are appended in chunks through ``ColumnarWriter``. The data of every
+column is written first and the new row count is committed to the schema
+last (atomic rename), so a crash mid-append leaves the archive at its
+previous state. ``ColumnarReader`` memory-maps the column files and exposes
+every column as a zero-copy ``memoryview``; ``numpy.frombuffer(view)`` turns
+one into a NumPy array without copying.
+
+Example:
+    with ColumnarWriter("designs.cols") as writer:
+        writer.append(specs)                   # spec columns as for compute_mix_designs()
+    with ColumnarReader("designs.cols") as reader:
+        cement = reader.column("cement_mass_kg")
+        print(reader.rows, sum(cement) / reader.rows)
+"""
+from array import array
+import json
+import mmap
+import os
+import sys
+import warnings
+
+from civilutils.indian_standards.batch import (
+    ENUM_COLUMNS,
+    RESULT_COLUMNS,
+    compute_mix_designs,
+    design_spec,
+    normalize_specs,
+    resolve_percentage,
+)
+from civilutils.indian_standards.concrete import DEFAULT_TABLE_VERSION, get_table_set
+from civilutils.indian_standards.design_space import CONTINUOUS_INPUTS
+
+FORMAT_NAME = "civilutils-columnar"
+FORMAT_VERSION = 1
+SCHEMA_FILE = "schema.json"
+
+CODE_COLUMNS = tuple(ENUM_COLUMNS) + ("is_pumpable",)
+
+# (column name, array typecode) of every stored column, in schema order
+STORE_COLUMNS = (
+    tuple((name, "B") for name in CODE_COLUMNS)
+    + tuple((name, "d") for name in CONTINUOUS_INPUTS)
+    + tuple((name, "d") for name in RESULT_COLUMNS)
+)
+
+
+def _enum_names(name: str) -> list:
+    return [member.name for member in ENUM_COLUMNS[name]]
+
+
+def _column_path(path: str, name: str) -> str:
+    return os.path.join(path, f"{name}.bin")
+
+
+def _read_schema(path: str) -> dict:
+    try:
+        with open(os.path.join(path, SCHEMA_FILE)) as handle:
+            schema = json.load(handle)
+    except FileNotFoundError:
+        raise ValueError(f"{path} is not a columnar archive (no {SCHEMA_FILE})")
+    if schema.get("format") != FORMAT_NAME or schema.get("version") != FORMAT_VERSION:
+        raise ValueError(f"unsupported archive format in {path}")
+    if schema["byteorder"] != sys.byteorder:
+        raise ValueError(f"archive byte order {schema['byteorder']!r} differs from this machine's")
+    return schema
+
+
+def _write_schema(path: str, schema: dict):
+    temporary = os.path.join(path, SCHEMA_FILE + ".tmp")
+    with open(temporary, "w") as handle:
+        json.dump(schema, handle, indent=2)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, os.path.join(path, SCHEMA_FILE))
+
+
+class ColumnarWriter:
+    """Append computed designs to a columnar archive, creating it if needed."""
+    def __init__(self, path: str, table_version: str = DEFAULT_TABLE_VERSION):
+        """Open (or create) an archive for appending.
+
+        Args:
+            path (str): Archive directory.
+            table_version (str, optional): Edition of the clause tables used for new archives (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+
+        Raises:
+            ValueError: If the directory holds an incompatible archive, or the table version differs from the archive's.
+        """
+        get_table_set(table_version)
+        self.path = path
+        if os.path.exists(os.path.join(path, SCHEMA_FILE)):
+            self.schema = _read_schema(path)
+            if self.schema["table_version"] != table_version:
+                raise ValueError(f"archive uses {self.schema['table_version']!r}, not {table_version!r}")
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.schema = {
+                "format": FORMAT_NAME,
+                "version": FORMAT_VERSION,
+                "table_version": table_version,
+                "byteorder": sys.byteorder,
+                "rows": 0,
+                "columns": [{"name": name, "type": typecode} for name, typecode in STORE_COLUMNS],
+                "enums": {name: _enum_names(name) for name in ENUM_COLUMNS},
+            }
+            _write_schema(path, self.schema)
+        self._codes = {name: {member: code for code, member in enumerate(ENUM_COLUMNS[name], start=1)}
+                       for name in ENUM_COLUMNS}
+        self._files = {name: open(_column_path(path, name), "ab") for name, _ in STORE_COLUMNS}
+        self._rollback()
+
+    def _rollback(self):
+        """Cut every column file back to the committed row count."""
+        for name, typecode in STORE_COLUMNS:
+            handle = self._files[name]
+            try:
+                handle.flush()
+            except OSError:
+                pass
+            handle.truncate(self.schema["rows"] * array(typecode).itemsize)
+
+    @property
+    def rows(self) -> int:
+        """Committed row count."""
+        return self.schema["rows"]
+
+    def append(self, specs: dict) -> int:
+        """Compute designs for spec columns and append them.
+
+        Args:
+            specs (dict): Input columns as for batch.compute_mix_designs().
+
+        Raises:
+            ValueError: If the specs are invalid.
+
+        Returns:
+            int: Number of rows appended.
+        """
+        n_rows, columns = normalize_specs(specs)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = compute_mix_designs(columns, self.schema["table_version"])
+        data = {}
+        for name in ENUM_COLUMNS:
+            codes = self._codes[name]
+            data[name] = array("B", [0 if value is None else codes[value] for value in columns[name]])
+        data["is_pumpable"] = array("B", [1 if value else 0 for value in columns["is_pumpable"]])
+        for kind in ("chemical", "mineral"):
+            name = f"{kind}_admixture_percentage"
+            columns[name] = [resolve_percentage(admixture, percentage)
+                             for admixture, percentage in zip(columns[f"{kind}_admixture"], columns[name])]
+        for name in CONTINUOUS_INPUTS:
+            data[name] = array("d", [float("nan") if value is None else value for value in columns[name]])
+        data.update(results)
+
+        try:
+            for name, _ in STORE_COLUMNS:
+                data[name].tofile(self._files[name])
+            for handle in self._files.values():
+                handle.flush()
+                os.fsync(handle.fileno())
+            _write_schema(self.path, dict(self.schema, rows=self.schema["rows"] + n_rows))
+        except BaseException:
+            self._rollback()
+            raise
+        self.schema["rows"] += n_rows
+        return n_rows
+
+    def append_designs(self, designs) -> int:
+        """Append ConcreteMixDesign instances (computed with the archive's table version).
+
+        Raises:
+            ValueError: If a design uses another table version.
+
+        Returns:
+            int: Number of rows appended.
+        """
+        designs = list(designs)
+        if any(design.table_version != self.schema["table_version"] for design in designs):
+            raise ValueError(f"every design must use {self.schema['table_version']!r}")
+        if not designs:
+            return 0
+        specs = [design_spec(design) for design in designs]
+        return self.append({name: [spec[name] for spec in specs] for name in specs[0]})
+
+    def close(self):
+        for handle in self._files.values():
+            handle.close()
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ColumnarReader:
+    """Memory-mapped, read-only view of a columnar archive.
+
+    The reader sees the rows committed when it was opened. Column views stay
+    valid until close(). Views the caller still holds (including slices) must
+    be released first, or the columns read with ``column(name, copy=True)``.
+    """
+    def __init__(self, path: str):
+        """Open an archive.
+
+        Raises:
+            ValueError: If the directory does not hold a compatible archive.
+        """
+        self.path = path
+        self.schema = _read_schema(path)
+        self.rows = self.schema["rows"]
+        self.table_version = self.schema["table_version"]
+        self.types = {column["name"]: column["type"] for column in self.schema["columns"]}
+        self._enums = {name: [None] + [ENUM_COLUMNS[name][member] for member in members]
+                       for name, members in self.schema["enums"].items()}
+        self._maps = {}
+        self._views = {}
+
+    @property
+    def columns(self) -> tuple:
+        """Names of the stored columns."""
+        return tuple(self.types)
+
+    def column(self, name: str, copy: bool = False) -> memoryview | array:
+        """Zero-copy view of a column (format "B" for enum codes, "d" otherwise).
+
+        Args:
+            name (str): Column name.
+            copy (bool, optional): Whether to return an ``array`` copy that outlives close(). Defaults to False.
+
+        Raises:
+            ValueError: If the column is unknown.
+        """
+        view = self._views.get(name)
+        if view is None:
+            typecode = self.types.get(name)
+            if typecode is None:
+                raise ValueError(f"unknown column {name!r}")
+            size = self.rows * array(typecode).itemsize
+            if size == 0:
+                view = memoryview(array(typecode))
+            else:
+                with open(_column_path(self.path, name), "rb") as handle:
+                    mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps[name] = mapped
+                with memoryview(mapped) as whole, whole[:size] as part:
+                    view = part.cast(typecode)
+            self._views[name] = view
+        return array(view.format, view) if copy else view
+
+    def decoded(self, name: str) -> list:
+        """Enum members of an enum column (None where no member was set).
+
+        Raises:
+            ValueError: If the column is not an enum column.
+        """
+        members = self._enums.get(name)
+        if members is None:
+            raise ValueError(f"{name!r} is not an enum column")
+        return [members[code] for code in self.column(name)]
+
+    def row(self, index: int) -> dict:
+        """Every column of one row, enum columns decoded."""
+        if not -self.rows <= index < self.rows:
+            raise IndexError("row index out of range")
+        row = {}
+        for name in self.types:
+            value = self.column(name)[index]
+            if name in self._enums:
+                value = self._enums[name][value]
+            elif name == "is_pumpable":
+                value = bool(value)
+            row[name] = value
+        return row
+
+    def close(self):
+        """Release the column views and unmap the column files.
+
+        Raises:
+            BufferError: If views of a column (e.g. slices) are still held; the
+                other columns are closed, and close() can be called again once
+                those views are released.
+        """
+        for view in self._views.values():
+            view.release()
+        in_use = {}
+        for name, mapped in self._maps.items():
+            try:
+                mapped.close()
+            except BufferError:
+                in_use[name] = mapped
+        self._views, self._maps = {}, in_use
+        if in_use:
+            raise BufferError(f"views of {sorted(in_use)} are still in use; release them before close(), "
+                              "or read the columns with column(name, copy=True)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,8 +1,20 @@
 """Concrete Mix Design using IS 456 and 10262"""
+from collections import namedtuple
 from enum import Enum
 import math
+import operator
+import threading
+import time
+from types import MappingProxyType
 import warnings
 
+from civilutils.indian_standards.diagnostics import diagnose
+from civilutils.indian_standards.metrics import LOW_CEMENT_CONTENT_WARNING, active_registry
+from civilutils.indian_standards.results import MixResult
+from civilutils.indian_standards.trace import ConsoleRenderer, TraceEvent
+
+_CONSOLE = ConsoleRenderer()
+
 class ConcreteGrade(Enum):
     """Concrete grades as per IS 456.
 
@@ -145,9 +157,354 @@ class SpecificGravity:
         self.material = material
         self.value = value
 
+# Clause tables, keyed by enum member. They are the source data of the
+# compiled ISTableSet registry below; designs read tables through the registry.
+
+# IS 456 Table 5: maximum free water-cement ratio for plain concrete
+PLAIN_WATER_CEMENT_RATIO_BY_EXPOSURE = {
+    ExposureCondition.MILD: 0.60,
+    ExposureCondition.MODERATE: 0.60,
+    ExposureCondition.SEVERE: 0.50,
+    ExposureCondition.VERY_SEVERE: 0.45,
+    ExposureCondition.EXTREME: 0.40,
+}
+
+# IS 456 Table 5: maximum free water-cement ratio for reinforced concrete
+REINFORCED_WATER_CEMENT_RATIO_BY_EXPOSURE = {
+    ExposureCondition.MILD: 0.55,
+    ExposureCondition.MODERATE: 0.50,
+    ExposureCondition.SEVERE: 0.45,
+    ExposureCondition.VERY_SEVERE: 0.45,
+    ExposureCondition.EXTREME: 0.40,
+}
+
+# IS 10262:2009 Table 2 (IS 10262:2019 Table 4): maximum water content (kg/m^3) for 50 mm slump
+WATER_CONTENT_BY_NOMINAL_SIZE = {
+    MaximumNominalSize.SIZE_10: 208.0,
+    MaximumNominalSize.SIZE_20: 186.0,
+    MaximumNominalSize.SIZE_40: 165.0,
+}
+
+# IS 10262:2009 Table 1 (IS 10262:2019 Table 2): assumed standard deviation (N/mm^2)
+STANDARD_DEVIATION_BY_GRADE = {
+    ConcreteGrade.M10: 3.5,
+    ConcreteGrade.M15: 3.5,
+    ConcreteGrade.M20: 4.0,
+    ConcreteGrade.M25: 4.0,
+    ConcreteGrade.M30: 5.0,
+    ConcreteGrade.M35: 5.0,
+    ConcreteGrade.M40: 5.0,
+    ConcreteGrade.M45: 5.0,
+    ConcreteGrade.M50: 5.0,
+    ConcreteGrade.M55: 5.0,
+}
+
+# IS 456 Table 5: minimum cement content (kg/m^3) for reinforced concrete
+MINIMUM_CEMENT_CONTENT_BY_EXPOSURE = {
+    ExposureCondition.MILD: 300.0,
+    ExposureCondition.MODERATE: 300.0,
+    ExposureCondition.SEVERE: 320.0,
+    ExposureCondition.VERY_SEVERE: 340.0,
+    ExposureCondition.EXTREME: 360.0,
+}
+
+# IS 10262:2009 Table 3: volume of coarse aggregate per unit volume of total
+# aggregate for a water-cement ratio of 0.50
+COARSE_AGGREGATE_PROPORTION_BY_SIZE_AND_ZONE = {
+    MaximumNominalSize.SIZE_10: {
+        FineAggregateZone.ZONE_IV: 0.50,
+        FineAggregateZone.ZONE_III: 0.48,
+        FineAggregateZone.ZONE_II: 0.46,
+        FineAggregateZone.ZONE_I: 0.44,
+    },
+    MaximumNominalSize.SIZE_20: {
+        FineAggregateZone.ZONE_IV: 0.66,
+        FineAggregateZone.ZONE_III: 0.64,
+        FineAggregateZone.ZONE_II: 0.62,
+        FineAggregateZone.ZONE_I: 0.60,
+    },
+    MaximumNominalSize.SIZE_40: {
+        FineAggregateZone.ZONE_IV: 0.75,
+        FineAggregateZone.ZONE_III: 0.73,
+        FineAggregateZone.ZONE_II: 0.71,
+        FineAggregateZone.ZONE_I: 0.69,
+    },
+}
+
+# IS 10262:2019 Table 5: volume of coarse aggregate per unit volume of total
+# aggregate for a water-cement ratio of 0.50
+COARSE_AGGREGATE_PROPORTION_BY_SIZE_AND_ZONE_2019 = {
+    MaximumNominalSize.SIZE_10: {
+        FineAggregateZone.ZONE_IV: 0.54,
+        FineAggregateZone.ZONE_III: 0.52,
+        FineAggregateZone.ZONE_II: 0.50,
+        FineAggregateZone.ZONE_I: 0.48,
+    },
+    MaximumNominalSize.SIZE_20: {
+        FineAggregateZone.ZONE_IV: 0.66,
+        FineAggregateZone.ZONE_III: 0.64,
+        FineAggregateZone.ZONE_II: 0.62,
+        FineAggregateZone.ZONE_I: 0.60,
+    },
+    MaximumNominalSize.SIZE_40: {
+        FineAggregateZone.ZONE_IV: 0.73,
+        FineAggregateZone.ZONE_III: 0.72,
+        FineAggregateZone.ZONE_II: 0.71,
+        FineAggregateZone.ZONE_I: 0.69,
+    },
+}
+
+# IS 10262:2019 clause 4.2: target mean strength is the higher of
+# f_ck + 1.65 s and f_ck + X, with X (N/mm^2) from Table 1
+TARGET_STRENGTH_MARGIN_BY_GRADE_2019 = {
+    ConcreteGrade.M10: 5.0,
+    ConcreteGrade.M15: 5.0,
+    ConcreteGrade.M20: 5.5,
+    ConcreteGrade.M25: 5.5,
+    ConcreteGrade.M30: 6.5,
+    ConcreteGrade.M35: 6.5,
+    ConcreteGrade.M40: 6.5,
+    ConcreteGrade.M45: 6.5,
+    ConcreteGrade.M50: 6.5,
+    ConcreteGrade.M55: 6.5,
+}
+
+# position of every member within its enum, used to index compiled tables
+ENUM_POSITION = {
+    member: position
+    for enum_cls in (ConcreteGrade, ExposureCondition, MaximumNominalSize, FineAggregateZone)
+    for position, member in enumerate(enum_cls)
+}
+
+
+def _compile_table(table: dict, enum_cls) -> tuple:
+    return tuple(float(table[member]) for member in enum_cls)
+
+
+class ISTableSet:
+    """Clause tables of one edition of IS 10262 (with the IS 456 limits it uses),
+    compiled once into tuples indexed by enum position (see ENUM_POSITION).
+
+    Table sets are shared by every design, batch and cache that selects the
+    same version and must be treated as read-only.
+    """
+    __slots__ = (
+        "version",
+        "plain_water_cement_ratio",
+        "reinforced_water_cement_ratio",
+        "water_content",
+        "standard_deviation",
+        "target_strength_margin",
+        "minimum_cement_content",
+        "coarse_aggregate_proportion",
+    )
+
+    def __init__(self, version: str, plain_water_cement_ratio: dict, reinforced_water_cement_ratio: dict,
+                 water_content: dict, standard_deviation: dict, minimum_cement_content: dict,
+                 coarse_aggregate_proportion: dict, target_strength_margin: dict | None = None):
+        """Compile a table set.
+
+        Args:
+            version (str): Name of the code edition, e.g. "IS 10262:2009".
+            plain_water_cement_ratio (dict): Maximum w/c ratio of plain concrete per ExposureCondition.
+            reinforced_water_cement_ratio (dict): Maximum w/c ratio of reinforced concrete per ExposureCondition.
+            water_content (dict): Water content (kg/m^3) for 50 mm slump per MaximumNominalSize.
+            standard_deviation (dict): Assumed standard deviation (N/mm^2) per ConcreteGrade.
+            minimum_cement_content (dict): Minimum cement content (kg/m^3) per ExposureCondition.
+            coarse_aggregate_proportion (dict): Coarse aggregate volume fraction per MaximumNominalSize and FineAggregateZone.
+            target_strength_margin (dict | None, optional): Minimum margin X over f_ck per ConcreteGrade. Defaults to None (no margin rule).
+        """
+        self.version = version
+        self.plain_water_cement_ratio = _compile_table(plain_water_cement_ratio, ExposureCondition)
+        self.reinforced_water_cement_ratio = _compile_table(reinforced_water_cement_ratio, ExposureCondition)
+        self.water_content = _compile_table(water_content, MaximumNominalSize)
+        self.standard_deviation = _compile_table(standard_deviation, ConcreteGrade)
+        self.minimum_cement_content = _compile_table(minimum_cement_content, ExposureCondition)
+        self.coarse_aggregate_proportion = tuple(
+            _compile_table(coarse_aggregate_proportion[size], FineAggregateZone) for size in MaximumNominalSize
+        )
+        self.target_strength_margin = (
+            None if target_strength_margin is None else _compile_table(target_strength_margin, ConcreteGrade)
+        )
+
+    def get_water_cement_ratio(self, exposure_condition: ExposureCondition, reinforced: bool = True) -> float:
+        table = self.reinforced_water_cement_ratio if reinforced else self.plain_water_cement_ratio
+        return table[ENUM_POSITION[exposure_condition]]
+
+    def get_water_content(self, maximum_nominal_size: MaximumNominalSize) -> float:
+        return self.water_content[ENUM_POSITION[maximum_nominal_size]]
+
+    def get_standard_deviation(self, concrete_grade: ConcreteGrade) -> float:
+        return self.standard_deviation[ENUM_POSITION[concrete_grade]]
+
+    def get_target_strength_margin(self, concrete_grade: ConcreteGrade) -> float | None:
+        if self.target_strength_margin is None:
+            return None
+        return self.target_strength_margin[ENUM_POSITION[concrete_grade]]
+
+    def get_minimum_cement_content(self, exposure_condition: ExposureCondition) -> float:
+        return self.minimum_cement_content[ENUM_POSITION[exposure_condition]]
+
+    def get_coarse_aggregate_proportion(self, maximum_nominal_size: MaximumNominalSize,
+                                        fine_aggregate_zone: FineAggregateZone) -> float:
+        return self.coarse_aggregate_proportion[ENUM_POSITION[maximum_nominal_size]][ENUM_POSITION[fine_aggregate_zone]]
+
+    def __repr__(self):
+        return f"ISTableSet({self.version!r})"
+
+
+TABLE_SETS = {
+    "IS 10262:2009": ISTableSet(
+        "IS 10262:2009",
+        plain_water_cement_ratio=PLAIN_WATER_CEMENT_RATIO_BY_EXPOSURE,
+        reinforced_water_cement_ratio=REINFORCED_WATER_CEMENT_RATIO_BY_EXPOSURE,
+        water_content=WATER_CONTENT_BY_NOMINAL_SIZE,
+        standard_deviation=STANDARD_DEVIATION_BY_GRADE,
+        minimum_cement_content=MINIMUM_CEMENT_CONTENT_BY_EXPOSURE,
+        coarse_aggregate_proportion=COARSE_AGGREGATE_PROPORTION_BY_SIZE_AND_ZONE,
+    ),
+    "IS 10262:2019": ISTableSet(
+        "IS 10262:2019",
+        plain_water_cement_ratio=PLAIN_WATER_CEMENT_RATIO_BY_EXPOSURE,
+        reinforced_water_cement_ratio=REINFORCED_WATER_CEMENT_RATIO_BY_EXPOSURE,
+        water_content=WATER_CONTENT_BY_NOMINAL_SIZE,
+        standard_deviation=STANDARD_DEVIATION_BY_GRADE,
+        minimum_cement_content=MINIMUM_CEMENT_CONTENT_BY_EXPOSURE,
+        coarse_aggregate_proportion=COARSE_AGGREGATE_PROPORTION_BY_SIZE_AND_ZONE_2019,
+        target_strength_margin=TARGET_STRENGTH_MARGIN_BY_GRADE_2019,
+    ),
+}
+
+DEFAULT_TABLE_VERSION = "IS 10262:2009"
+
+
+def get_table_set(version: str = DEFAULT_TABLE_VERSION) -> ISTableSet:
+    """Return the compiled table set of a code edition.
+
+    Args:
+        version (str, optional): Key of TABLE_SETS. Defaults to DEFAULT_TABLE_VERSION.
+
+    Raises:
+        ValueError: If the version is not registered.
+
+    Returns:
+        ISTableSet: The shared, read-only table set.
+    """
+    try:
+        return TABLE_SETS[version]
+    except KeyError:
+        raise ValueError(f"unknown table version {version!r}; available: {sorted(TABLE_SETS)}")
+
+# Calculation stages of compute_mix_design() in evaluation order, with the
+# design inputs and the upstream stages each one reads.
+MIX_DESIGN_STAGES = (
+    "target_mean_strength",
+    "water_cement_ratio",
+    "water_content",
+    "cement_content",
+    "aggregate_proportions",
+    "mix_quantities",
+    "moisture_correction",
+)
+STAGE_INPUTS = {
+    "target_mean_strength": ("concrete_grade", "site_standard_deviation", "table_version"),
+    "water_cement_ratio": ("exposure_condition", "chemical_admixture", "table_version"),
+    "water_content": ("maximum_nominal_size", "slump_mm", "slump_adjustment_pct_per_25mm",
+                      "chemical_admixture", "chemical_admixture_percentage", "table_version"),
+    "cement_content": ("exposure_condition", "mineral_admixture", "mineral_admixture_percentage",
+                       "maximum_cement_content", "table_version"),
+    "aggregate_proportions": ("maximum_nominal_size", "fine_aggregate_zone", "is_pumpable", "table_version"),
+    "mix_quantities": ("specific_gravities",),
+    "moisture_correction": ("specific_gravities", "coarse_aggregate_water_absorption",
+                            "coarse_aggregate_surface_moisture", "fine_aggregate_water_absorption",
+                            "fine_aggregate_surface_moisture"),
+}
+STAGE_UPSTREAM = {
+    "target_mean_strength": (),
+    "water_cement_ratio": (),
+    "water_content": (),
+    "cement_content": ("water_cement_ratio", "water_content"),
+    "aggregate_proportions": ("water_cement_ratio",),
+    "mix_quantities": ("cement_content", "water_content", "aggregate_proportions"),
+    "moisture_correction": ("water_content", "mix_quantities"),
+}
+
+ALL_STAGES = frozenset(MIX_DESIGN_STAGES)
+
+
+def _downstream_stages(stage: str) -> frozenset:
+    stages = {stage}
+    for candidate in MIX_DESIGN_STAGES:
+        if any(upstream in stages for upstream in STAGE_UPSTREAM[candidate]):
+            stages.add(candidate)
+    return frozenset(stages)
+
+
+# stages to recompute when an input changes (the stages reading it and everything downstream)
+STAGES_AFFECTED_BY_INPUT = {}
+for _stage, _inputs in STAGE_INPUTS.items():
+    for _name in _inputs:
+        STAGES_AFFECTED_BY_INPUT[_name] = STAGES_AFFECTED_BY_INPUT.get(_name, frozenset()) | _downstream_stages(_stage)
+
+
+def _resolve_standard_deviation(value) -> float | None:
+    if value is None:
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid site_standard_deviation: {value!r}")
+    if not 0 < value < float("inf"):
+        raise ValueError("site_standard_deviation must be a positive number")
+    return value
+
+
+def _resolve_admixture_percentage(admixture, percentage) -> float:
+    if admixture is None:
+        return 0.0
+    if percentage is None:
+        return float(admixture.default_percentage)
+    return float(percentage)
+
+
 class ConcreteMixDesign:
     """Concrete mix design parameters as per IS 10262 and IS 456.
+
+    Results of every calculation stage are kept on the instance. Changing an
+    input (through set_inputs() or plain attribute assignment) invalidates
+    only the stages depending on it (see STAGE_INPUTS and STAGE_UPSTREAM), so
+    the next compute_mix_design() recomputes just those stages.
     """
+    # attributes holding design inputs; everything else on the instance is
+    # derived by compute_mix_design()
+    INPUT_ATTRIBUTES = (
+        "concrete_grade",
+        "exposure_condition",
+        "specific_gravities",
+        "maximum_nominal_size",
+        "maximum_cement_content",
+        "is_pumpable",
+        "chemical_admixture",
+        "chemical_admixture_percentage",
+        "coarse_aggregate_type",
+        "coarse_aggregate_water_absorption",
+        "coarse_aggregate_surface_moisture",
+        "fine_aggregate_zone",
+        "fine_aggregate_surface_moisture",
+        "fine_aggregate_water_absorption",
+        "slump_mm",
+        "slump_adjustment_pct_per_25mm",
+        "mineral_admixture",
+        "mineral_admixture_percentage",
+        "site_standard_deviation",
+        "table_version",
+    )
+    # attributes controlling how a design is computed, not what it computes
+    RUNTIME_ATTRIBUTES = ("result_cache", "trace_sink", "stage_recomputations", "last_recomputed_stages", "_lock",
+                          "_specific_gravity_pairs")
+    _input_values = operator.attrgetter(*INPUT_ATTRIBUTES)
+    _SPECIFIC_GRAVITIES_POSITION = INPUT_ATTRIBUTES.index("specific_gravities")
+
     def __init__(self, concrete_grade: ConcreteGrade,
                  exposure_condition: ExposureCondition,
                  specific_gravities: list[SpecificGravity],
@@ -164,7 +521,11 @@ class ConcreteMixDesign:
                  fine_aggregate_water_absorption: float = 0.0,
                  slump_mm: float  = 50.0,
                  mineral_admixture: MineralAdmixture | None = None,
-                 mineral_admixture_percentage: float | None = None):
+                 mineral_admixture_percentage: float | None = None,
+                 result_cache=None,
+                 trace_sink=None,
+                 table_version: str = DEFAULT_TABLE_VERSION,
+                 site_standard_deviation: float | None = None):
         """Initialize the concrete mix design parameters.
 
         Args:
@@ -185,10 +546,21 @@ class ConcreteMixDesign:
             slump_mm (float, optional): The slump of concrete (mm). Defaults to 50.0.
             mineral_admixture (MineralAdmixture | None, optional): The type of mineral admixture used. Defaults to None.
             mineral_admixture_percentage (float | None, optional): The percentage of mineral admixture used. Defaults to None.
+            result_cache (MixDesignCache | None, optional): Cache used to memoize compute_mix_design results. Defaults to None (no caching).
+            trace_sink (callable | None, optional): Callable receiving a TraceEvent for every calculation stage. Defaults to None (no tracing).
+            table_version (str, optional): Edition of the clause tables to use (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+            site_standard_deviation (float | None, optional): Site standard deviation of strength (N/mm^2), e.g. from strength.StandardDeviationEstimator. Defaults to None (the assumed value of the clause tables).
 
         Raises:
             ValueError: If any of the parameters are invalid.
         """
+        self._dirty_stages = ALL_STAGES
+        self._derived = MappingProxyType({})
+        # specific gravity values of the last run, to notice SpecificGravity objects changed in place
+        self._computed_specific_gravities = None
+        self._lock = threading.RLock()
+        self.stage_recomputations = dict.fromkeys(MIX_DESIGN_STAGES, 0)
+        self.last_recomputed_stages = ()
         self.concrete_grade = concrete_grade
         self.maximum_nominal_size = maximum_nominal_size
         
@@ -197,26 +569,13 @@ class ConcreteMixDesign:
         self.slump_mm = float(slump_mm) if slump_mm is not None else None
         # fraction change per 25 mm (e.g. 0.03 == 3% change per 25 mm)
         self.slump_adjustment_pct_per_25mm = 0.03
-        self.maximum_cement_content = maximum_cement_content #TODO : implement logic
+        # checked against the cement content (design.diagnostics), not enforced
+        self.maximum_cement_content = maximum_cement_content
         self.chemical_admixture = chemical_admixture
-        if self.chemical_admixture is None:
-            self.chemical_admixture_percentage = 0.0
-        else:
-            if chemical_admixture_percentage is None:
-                self.chemical_admixture_percentage = float(chemical_admixture.default_percentage)
-            else:
-                self.chemical_admixture_percentage = float(chemical_admixture_percentage)
+        self.chemical_admixture_percentage = _resolve_admixture_percentage(chemical_admixture, chemical_admixture_percentage)
 
 
-        mandatory_items = {Materials.CEMENT, Materials.COARSE_AGGREGATE, Materials.WATER, Materials.FINE_AGGREGATE}
-        # Accept either a list[SpecificGravity] or a dict[Materials, SpecificGravity]
-        if isinstance(specific_gravities, dict):
-            sg_map = specific_gravities
-        else:
-            sg_map = {sg.material: sg for sg in specific_gravities}
-        if not mandatory_items.issubset(set(sg_map.keys())):
-            raise ValueError("Missing mandatory specific gravities.")
-        self.specific_gravities = sg_map
+        self.specific_gravities = self.__specific_gravity_map(specific_gravities)
         self.is_pumpable = is_pumpable
         
         self.coarse_aggregate_type = coarse_aggregate_type
@@ -228,319 +587,194 @@ class ConcreteMixDesign:
 
         self.mineral_admixture = mineral_admixture #TODO : implement logic
         # resolved percentage: user-provided overrides enum default
-        if self.mineral_admixture is None:
-            self.mineral_admixture_percentage = 0.0
-        else:
-            if mineral_admixture_percentage is None:
-                self.mineral_admixture_percentage = float(mineral_admixture.default_percentage)
-            else:
-                self.mineral_admixture_percentage = float(mineral_admixture_percentage)
-        
+        self.mineral_admixture_percentage = _resolve_admixture_percentage(mineral_admixture, mineral_admixture_percentage)
+        self.site_standard_deviation = _resolve_standard_deviation(site_standard_deviation)
+        get_table_set(table_version)
+        self.table_version = table_version
+        self.result_cache = result_cache
+        self.trace_sink = trace_sink
+        self._display_flag = False
 
-    def __calculate_water_cement_ratio_by_is456(self, reinforced: bool = True) -> float:
-        """
-        Determine maximum water/cement ratio from IS456 Table 5 for
-        normal-weight aggregates of 20 mm nominal maximum size.
+    def __setattr__(self, name, value):
+        affected = STAGES_AFFECTED_BY_INPUT.get(name)
+        if affected is None or name not in self.__dict__:
+            # derived and runtime attributes, or an input set by the constructor (every stage is still dirty)
+            object.__setattr__(self, name, value)
+            return
+        # inputs only change between runs, so a running compute cannot drop the invalidation
+        with self._lock:
+            object.__setattr__(self, name, value)
+            object.__setattr__(self, "_dirty_stages", self._dirty_stages | affected)
+
+    @staticmethod
+    def __specific_gravity_map(specific_gravities) -> dict:
+        mandatory_items = {Materials.CEMENT, Materials.COARSE_AGGREGATE, Materials.WATER, Materials.FINE_AGGREGATE}
+        # Accept either a list[SpecificGravity] or a dict[Materials, SpecificGravity]
+        if isinstance(specific_gravities, dict):
+            sg_map = specific_gravities
+        else:
+            sg_map = {sg.material: sg for sg in specific_gravities}
+        if not mandatory_items.issubset(set(sg_map.keys())):
+            raise ValueError("Missing mandatory specific gravities.")
+        return sg_map
 
-        Returns and sets self.maximum_water_cement_ratio.
+    def set_inputs(self, **changes):
+        """Change design inputs, invalidating only the stages that depend on them.
 
-        Table values (maximum free water-cement ratio):
-        - Plain concrete:    Mild 0.60, Moderate 0.60, Severe 0.50, Very severe 0.45, Extreme 0.40
-        - Reinforced concrete:Mild 0.55, Moderate 0.50, Severe 0.45, Very severe 0.45, Extreme 0.40
-        """
-        if self.exposure_condition is None:
-            raise ValueError("exposure_condition must be set to determine water/cement ratio")
-
-        plain_map = {
-            ExposureCondition.MILD: 0.60,
-            ExposureCondition.MODERATE: 0.60,
-            ExposureCondition.SEVERE: 0.50,
-            ExposureCondition.VERY_SEVERE: 0.45,
-            ExposureCondition.EXTREME: 0.40,
-        }
-        reinforced_map = {
-            ExposureCondition.MILD: 0.55,
-            ExposureCondition.MODERATE: 0.50,
-            ExposureCondition.SEVERE: 0.45,
-            ExposureCondition.VERY_SEVERE: 0.45,
-            ExposureCondition.EXTREME: 0.40,
-        }
-        mapping = reinforced_map if reinforced else plain_map
-        wcr = mapping[self.exposure_condition]
-        self.initial_water_cement_ratio=wcr
-        if self.chemical_admixture == ChemicalAdmixture.SUPERPLASTICIZER:
-            wcr -= 0.05
-        self.water_cement_ratio = float(wcr)
-
-        if getattr(self, "_display_flag", False):
-            print("\n" + "-"*60)
-            print("Water / Cement Ratio (IS456 Table 5)")
-            print("-"*60)
-            print(f"Exposure condition : {self.exposure_condition.value}")
-            print(f"Reinforced member  : {'Yes' if reinforced else 'No'}")
-            print(f"Calculated W/C     : {self.water_cement_ratio:.3f}")
-            print("-"*60)
-
-        return self.water_cement_ratio
+        Values are normalized as in the constructor. Changing an admixture
+        without giving its percentage resolves the percentage from the new
+        admixture's default; giving only a percentage resolves it against the
+        current admixture.
 
-    def __calculate_water_content(self):
-        """
-        Determine reference water content (kg/m^3) based on nominal maximum
-        aggregate size (IS table).
-        10 mm -> 208, 20 mm -> 186, 40 mm -> 165
-        Stores and returns self.maximum_water_content.
+        Example:
+            design.compute_mix_design()
+            design.set_inputs(fine_aggregate_surface_moisture=2.5)
+            design.compute_mix_design()   # only the moisture correction is recomputed
 
-        Reference table values correspond to 50 mm slump. If self.slump_mm is
-        provided the water content is adjusted by slump_adjustment_pct_per_25mm
-        for every 25 mm difference from 50 mm.
+        Args:
+            **changes: New values keyed by constructor argument name (see INPUT_ATTRIBUTES).
 
-        If superplasticizer is used, the water content is reduced by 20%.
+        Raises:
+            ValueError: If a name is not a design input, or a value is invalid.
         """
-        if self.maximum_nominal_size is None:
-            raise ValueError("maximum_nominal_size must be set to determine water content")
+        unknown = set(changes) - set(self.INPUT_ATTRIBUTES)
+        if unknown:
+            raise ValueError(f"unknown design inputs: {sorted(unknown)}")
+        with self._lock:
+            if "specific_gravities" in changes:
+                changes["specific_gravities"] = self.__specific_gravity_map(changes["specific_gravities"])
+            if "table_version" in changes:
+                get_table_set(changes["table_version"])
+            if changes.get("slump_mm") is not None:
+                changes["slump_mm"] = float(changes["slump_mm"])
+            if "site_standard_deviation" in changes:
+                changes["site_standard_deviation"] = _resolve_standard_deviation(changes["site_standard_deviation"])
+            for kind in ("chemical", "mineral"):
+                admixture_name, percentage_name = f"{kind}_admixture", f"{kind}_admixture_percentage"
+                if admixture_name in changes or percentage_name in changes:
+                    changes[percentage_name] = _resolve_admixture_percentage(
+                        changes.get(admixture_name, getattr(self, admixture_name)),
+                        changes.get(percentage_name))
+            for name, value in changes.items():
+                if getattr(self, name) != value:
+                    setattr(self, name, value)
+
+    @property
+    def tables(self) -> ISTableSet:
+        """Clause tables of the design's table_version."""
+        return get_table_set(self.table_version)
+
+    def invalidate(self):
+        """Mark every stage stale (e.g. after changing the tables of the design's table version)."""
+        with self._lock:
+            self._dirty_stages = ALL_STAGES
+
+    def fingerprint(self) -> tuple:
+        """Return a canonical, hashable fingerprint of every design input.
+
+        Two designs with equal fingerprints produce identical results, so the
+        fingerprint can be used as a cache or deduplication key.
 
-        mapping = {
-            MaximumNominalSize.SIZE_10: 208.0,
-            MaximumNominalSize.SIZE_20: 186.0,
-            MaximumNominalSize.SIZE_40: 165.0,
-        }
+        Returns:
+            tuple: The design inputs, with specific gravities as sorted (material, value) pairs.
+        """
+        specific_gravities = tuple(sorted(
+            (f"{type(material).__name__}.{material.name}", float(sg.value))
+            for material, sg in self.specific_gravities.items()
+        ))
+        return tuple(
+            specific_gravities if name == "specific_gravities" else getattr(self, name)
+            for name in self.INPUT_ATTRIBUTES
+        )
 
-        base_water = float(mapping[self.maximum_nominal_size])
-        if self.slump_mm is not None:
-            steps = (self.slump_mm - 50.0) / 25.0  # positive if slump > 50, negative if < 50
-            adjusted_water = base_water * (1.0 + steps * self.slump_adjustment_pct_per_25mm)
-        else:
-            adjusted_water = base_water
-
-        if self.chemical_admixture == ChemicalAdmixture.SUPERPLASTICIZER:
-            adjusted_water *= (1 - self.chemical_admixture_percentage / 100)
-        adjusted_water = round(adjusted_water)
-        self.maximum_water_content = adjusted_water
-
-        if getattr(self, "_display_flag", False):
-            print("\n" + "-"*60)
-            print("Water Content Determination")
-            print("-"*60)
-            print(f"Maximum nominal aggregate size : {self.maximum_nominal_size.value} mm")
-            print(f"Base water content (50 mm slump): {base_water:.2f} litres")
-            if self.slump_mm is not None:
-                pct_change = (self.slump_adjustment_pct_per_25mm * 100.0)
-                print(f"Slump provided                 : {self.slump_mm:.1f} mm")
-                print(f"Adjustment per 25 mm           : {pct_change:.1f}%")
-                print(f"Adjusted water content         : {adjusted_water:.2f} litres")
-            if self.chemical_admixture == ChemicalAdmixture.SUPERPLASTICIZER:
-                print(f"Superplasticizer used: water reduced by {self.chemical_admixture_percentage}%")
-            print("-"*60)
-
-        return adjusted_water
+    def to_spec(self) -> "MixSpec":
+        """Return an immutable snapshot of the design inputs.
 
+        The spec can be passed to compute_mix() from any thread while the
+        design itself keeps changing.
 
-    def __calculate_target_mean_compressive_strength(self) -> float:
+        Returns:
+            MixSpec: The inputs, with specific gravities as sorted (material, value) pairs.
         """
-        Compute target mean compressive strength for the selected concrete grade.
-
-        Uses the standard deviations from the provided table:
-        - M10, M15 : 3.5 N/mm^2
-        - M20, M25 : 4.0 N/mm^2
-        - M30, M35, M40, M45, M50, M55 : 5.0 N/mm^2
-
-        Formula used: target_mean = f_ck + 1.65 * standard_deviation
-        (1.65 corresponds to approximately 95% probability / 5% risk)
+        values = list(self._input_values(self))
+        values[self._SPECIFIC_GRAVITIES_POSITION] = self.__specific_gravity_pairs()
+        return MixSpec._make(values)
+
+    def __specific_gravity_pairs(self) -> tuple:
+        """Sorted (material, value) pairs of the specific gravities, reused while their values are unchanged."""
+        current = tuple((material, float(sg.value)) for material, sg in self.specific_gravities.items())
+        cached = self.__dict__.get("_specific_gravity_pairs")
+        if cached is not None and cached[0] == current:
+            return cached[1]
+        pairs = tuple(sorted(current, key=lambda item: (type(item[0]).__name__, item[0].name)))
+        self._specific_gravity_pairs = (current, pairs)
+        return pairs
+
+    def __tracer(self, display: bool):
+        """Trace callback for the calculation core, or None when nobody listens."""
+        sink = self.trace_sink
+        if not display and sink is None:
+            return None
+
+        def trace(stage: str, **values):
+            event = TraceEvent(stage, values)
+            if sink is not None:
+                sink(event)
+            if display:
+                _CONSOLE(event)
+        return trace
+
+    def __publish(self, values: MappingProxyType):
+        """Keep derived values for attribute access and the next incremental run."""
+        self._derived = values
+
+    def __getattr__(self, name):
+        # derived values (water_cement_ratio, minimum_cement_content, ...) of the last run
+        derived = self.__dict__.get("_derived")
+        if derived is None or name not in derived:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return derived[name]
+
+    def __run_single_stage(self, stage: str, current: bool, function, *args):
+        """Run (part of) one stage on its own, keeping the dirty stages consistent.
+
+        The stage and everything downstream of it become dirty. The stage is
+        clean again only if it ran as compute_mix_design() runs it (current)
+        on clean upstream stages.
         """
-        std_dev_map = {
-            ConcreteGrade.M10: 3.5,
-            ConcreteGrade.M15: 3.5,
-            ConcreteGrade.M20: 4.0,
-            ConcreteGrade.M25: 4.0,
-            ConcreteGrade.M30: 5.0,
-            ConcreteGrade.M35: 5.0,
-            ConcreteGrade.M40: 5.0,
-            ConcreteGrade.M45: 5.0,
-            ConcreteGrade.M50: 5.0,
-            ConcreteGrade.M55: 5.0,
-        }
-
-        s = std_dev_map[self.concrete_grade]
-        try:
-            fck = int(str(self.concrete_grade.value).lstrip("M").strip())
-        except Exception:
-            fck = int(self.concrete_grade.name.lstrip("M"))
+        with self._lock:
+            values = dict(self._derived)
+            result = function(self.to_spec(), values, self.__tracer(self._display_flag), *args)
+            self.__publish(MappingProxyType(values))
+            dirty = self._dirty_stages
+            fresh = current and not dirty.intersection(STAGE_UPSTREAM[stage])
+            dirty |= _downstream_stages(stage)
+            self._dirty_stages = dirty - {stage} if fresh else dirty
+            return result
 
-        target_mean = fck + 1.65 * s
-        self.characteristic_strength = fck
-        self.standard_deviation = s
-        self.target_mean_compressive_strength = target_mean
+    def __calculate_water_cement_ratio_by_is456(self, reinforced: bool = True) -> float:
+        """Run the water/cement ratio stage on its own (see _water_cement_ratio_stage)."""
+        return self.__run_single_stage("water_cement_ratio", reinforced, _water_cement_ratio_stage, reinforced)
 
-        if getattr(self, "_display_flag", False):
-            print("\n" + "-"*60)
-            print("Target Mean Compressive Strength")
-            print("-"*60)
-            print(f"Concrete grade (f_ck) : {self.concrete_grade.value} => {fck} N/mm^2")
-            print(f"Standard deviation    : {s:.2f} N/mm^2")
-            print(f"Target mean strength  : {target_mean:.2f} N/mm^2")
-            print("-"*60)
+    def __calculate_water_content(self):
+        """Run the water content stage on its own (see _water_content_stage)."""
+        return self.__run_single_stage("water_content", True, _water_content_stage)
 
-        return target_mean
+    def __calculate_target_mean_compressive_strength(self) -> float:
+        """Run the target mean strength stage on its own (see _target_mean_strength_stage)."""
+        return self.__run_single_stage("target_mean_strength", True, _target_mean_strength_stage)
 
     def __calculate_cement_content(self, water_cement_ratio, water_content):
-        MINIMUM_CEMENT_CONTENT_BY_EXPOSURE = {
-            ExposureCondition.MILD: 300.0,
-            ExposureCondition.MODERATE: 300.0,
-            ExposureCondition.SEVERE: 320.0,
-            ExposureCondition.VERY_SEVERE: 340.0,
-            ExposureCondition.EXTREME: 360.0,
-        }
-        minimum_cement_content = MINIMUM_CEMENT_CONTENT_BY_EXPOSURE[self.exposure_condition]
-        cement_content= water_content / water_cement_ratio
-        if cement_content < minimum_cement_content:
-            warnings.warn(
-                f"Calculated cement content {cement_content:.2f} kg/m^3 is less than minimum required for exposure condition {minimum_cement_content:.2f} kg/m^3",
-                UserWarning
-            )
-        self.minimum_cement_content = max(cement_content, minimum_cement_content)
-
-        if getattr(self, "_display_flag", False):
-            print("\n" + "-"*60)
-            print("Cement Content Calculation")
-            print("-"*60)
-            print(f"Computed cement (water / w/c) : {cement_content:.2f} kg/m^3")
-            print(f"Minimum cement for exposure   : {minimum_cement_content:.2f} kg/m^3")
-            print(f"Final cement content selected : {self.minimum_cement_content:.2f} kg/m^3")
-            print("-"*60)
-
-        return self.minimum_cement_content
-    
-    def __calculate_cement_with_flyash_content(self, water_cement_ratio, water_content):
-        MINIMUM_CEMENT_CONTENT_BY_EXPOSURE = {
-            ExposureCondition.MILD: 300.0,
-            ExposureCondition.MODERATE: 300.0,
-            ExposureCondition.SEVERE: 320.0,
-            ExposureCondition.VERY_SEVERE: 340.0,
-            ExposureCondition.EXTREME: 360.0,
-        }
-        minimum_cement_content = MINIMUM_CEMENT_CONTENT_BY_EXPOSURE[self.exposure_condition]
-        cement_content = water_content / water_cement_ratio
-
-        if cement_content < minimum_cement_content:
-            warnings.warn(
-                f"Calculated cement content {cement_content:.2f} kg/m^3 is less than minimum required for exposure condition {minimum_cement_content:.2f} kg/m^3",
-                UserWarning
-            )
-
-        # initial minimum to compare with after using cementitious materials
-        initial_minimum_cement_content = max(cement_content, minimum_cement_content)
-
-        # assume cementitious material content increased by 10% to account for replacement chemistry
-        cementitious_material_content = cement_content * 1.10
-        # new effective water/cement_ratio based on total cementitious content
-        new_water_cement_ratio = water_content / cementitious_material_content
-
-        # determine fly ash replacement mass (use resolved mineral_admixture_percentage if provided)
-        replacement_fraction = (self.mineral_admixture_percentage / 100.0) if self.mineral_admixture_percentage > 0 else 0.30
-        fly_ash_content = math.floor(cementitious_material_content * replacement_fraction)
-
-        new_cement_content = cementitious_material_content - fly_ash_content
-        cement_savings = initial_minimum_cement_content - new_cement_content
-
-        # store computed values on the instance for later reporting
-        self.fly_ash_content = float(fly_ash_content)
-        self.cementitious_material_content = float(cementitious_material_content)
-        self.new_water_cement_ratio = float(new_water_cement_ratio)
-        self.new_cement_content = float(new_cement_content)
-        self.cement_savings = float(cement_savings)
-        # update the working minimum cement and water/cement ratio
-        self.minimum_cement_content = self.new_cement_content
-        #self.water_cement_ratio = self.new_water_cement_ratio
-
-        if getattr(self, "_display_flag", False):
-            print("\n" + "-"*60)
-            print("Cement + Fly Ash (Mineral Admixture) Calculation")
-            print("-"*60)
-            print(f"Computed cement (water / w/c)            : {cement_content:.2f} kg/m^3")
-            print(f"Minimum cement for exposure              : {minimum_cement_content:.2f} kg/m^3")
-            print(f"Initial cement selected (base)           : {initial_minimum_cement_content:.2f} kg/m^3")
-            print(f"Cementitious material (cement + others)  : {self.cementitious_material_content:.2f} kg/m^3")
-            print(f"Fly ash replacement (mass)               : {self.fly_ash_content:.2f} kg/m^3 ({replacement_fraction*100:.1f}%)")
-            print(f"Final cement content after replacement   : {self.new_cement_content:.2f} kg/m^3")
-            print(f"Cement savings                            : {self.cement_savings:.2f} kg/m^3")
-            print(f"Adjusted water/cement ratio (effective)  : {self.new_water_cement_ratio:.3f}")
-            print("-"*60)
-
-        return self.minimum_cement_content,self.fly_ash_content
+        return self.__run_single_stage("cement_content", False, _plain_cement_content,
+                                       water_cement_ratio, water_content)
 
+    def __calculate_cement_with_flyash_content(self, water_cement_ratio, water_content):
+        return self.__run_single_stage("cement_content", False, _cement_with_fly_ash_content,
+                                       water_cement_ratio, water_content)
 
     def __calculate_aggregate_content(self):
-        """Determine volume fraction of coarse aggregate per unit volume of
-        total aggregate from IS table (Table 3) depending on fine aggregate
-        zone and nominal maximum size.
-
-        Raises:
-            ValueError: If fine_aggregate_zone or maximum_nominal_size is not set.
-            ValueError: If unsupported combination of maximum_nominal_size and fine_aggregate_zone is used.
-
-        Returns:
-            float: Proportion of coarse aggregate.
-        """
-        if self.fine_aggregate_zone is None or self.maximum_nominal_size is None:
-            raise ValueError("fine_aggregate_zone and maximum_nominal_size must be set to determine coarse aggregate proportion")
-
-        table = {
-            MaximumNominalSize.SIZE_10: {
-                FineAggregateZone.ZONE_IV: 0.50,
-                FineAggregateZone.ZONE_III: 0.48,
-                FineAggregateZone.ZONE_II: 0.46,
-                FineAggregateZone.ZONE_I: 0.44,
-            },
-            MaximumNominalSize.SIZE_20: {
-                FineAggregateZone.ZONE_IV: 0.66,
-                FineAggregateZone.ZONE_III: 0.64,
-                FineAggregateZone.ZONE_II: 0.62,
-                FineAggregateZone.ZONE_I: 0.60,
-            },
-            MaximumNominalSize.SIZE_40: {
-                FineAggregateZone.ZONE_IV: 0.75,
-                FineAggregateZone.ZONE_III: 0.73,
-                FineAggregateZone.ZONE_II: 0.71,
-                FineAggregateZone.ZONE_I: 0.69,
-            },
-        }
-
-        try:
-            prop = table[self.maximum_nominal_size][self.fine_aggregate_zone]
-        except KeyError:
-            raise ValueError("unsupported combination of maximum_nominal_size and fine_aggregate_zone")
-
-        self.coarse_aggregate_proportion = float(prop)
-        
-        if self.water_cement_ratio == 0.5:
-            self.coarse_aggregate_proportion = float(prop)
-        elif self.water_cement_ratio < 0.5:
-            decrease = abs(round((0.5 - self.water_cement_ratio) / 0.05))
-            self.coarse_aggregate_proportion = float(prop) + decrease * 0.01
-        else:
-            increase = abs(round((self.water_cement_ratio - 0.5) / 0.05))
-            self.coarse_aggregate_proportion = float(prop) - increase * 0.01
-        if self.is_pumpable:
-            self.coarse_aggregate_proportion = round(self.coarse_aggregate_proportion * 0.9, 2)
-        
-        fine_aggregate_proportion = 1 - self.coarse_aggregate_proportion
-        self.fine_aggregate_proportion = float(fine_aggregate_proportion)
-
-        if getattr(self, "_display_flag", False):
-            print("\n" + "-"*60)
-            print("Aggregate Proportions (by volume)")
-            print("-"*60)
-            print(f"Fine aggregate zone            : {self.fine_aggregate_zone.value}")
-            print(f"Nominal max size (mm)         : {self.maximum_nominal_size.value}")
-            print(f"Base coarse proportion (table) : {prop:.3f}")
-            print(f"W/C ratio                      : {self.water_cement_ratio:.3f}")
-            print(f"Adjusted coarse proportion     : {self.coarse_aggregate_proportion:.3f}")
-            if self.is_pumpable:
-                print("Pumpable mix adjustment applied: coarse proportion reduced by 10%")
-            print(f"Fine aggregate proportion      : {self.fine_aggregate_proportion:.3f}")
-            print("-"*60)
-
-        return self.coarse_aggregate_proportion, self.fine_aggregate_proportion
+        """Run the aggregate proportion stage on its own (see _aggregate_proportions_stage)."""
+        return self.__run_single_stage("aggregate_proportions", True, _aggregate_proportions_stage)
 
     def calculate_volume_based_on_mass_and_specific_gravity(self,mass,specific_gravity,round_value=3):
         """Calculate the volume based on mass and specific gravity.
@@ -553,8 +787,7 @@ class ConcreteMixDesign:
         Returns:
             float: The volume of the material.
         """        
-        volume = (mass / specific_gravity) * (1/1000)
-        return round(volume, round_value)
+        return _volume(mass, specific_gravity, round_value)
 
     def __get_specific_gravity(self, material: Materials) -> float:
         """Return the numeric specific gravity for a given material (raises if missing)."""
@@ -563,178 +796,74 @@ class ConcreteMixDesign:
             raise ValueError(f"specific gravity for {material} not provided")
         return float(sg.value)
 
-    def compute_mix_design(self, display_result: bool = False):
+    def compute_mix_design(self, display_result: bool = False, compact: bool = False):
         """Compute the concrete mix design based on IS 456 and IS 10262.
 
+        If a result_cache was given, results are memoized on fingerprint() and
+        served from the cache unless display_result is requested or a
+        trace_sink is attached. Otherwise only the stages invalidated since
+        the previous call are recomputed (all of them when displaying or
+        tracing); last_recomputed_stages and stage_recomputations report them.
+
+        The calculation itself runs in the side-effect-free core (see
+        compute_mix()); its results are published on the design afterwards,
+        under a per-design lock, so concurrent calls on one design are safe.
+
         Args:
             display_result (bool, optional): Whether to display the calculation results. Defaults to False.
+            compact (bool, optional): Whether to return a MixResult instead of a nested dict. Defaults to False.
 
         Returns:
-            dict: A dictionary containing the mix design parameters.
-        """        
-        self._display_flag = bool(display_result)
-        if self._display_flag:
-            print("\n" + "="*60)
-            print("Concrete Mix Design - Calculation Summary")
-            print("="*60)
-
-        target_mean_strength = self.__calculate_target_mean_compressive_strength()
-        water_cement_ratio = self.__calculate_water_cement_ratio_by_is456()
-        water_content = self.__calculate_water_content()
-        if self.mineral_admixture == MineralAdmixture.FLY_ASH:
-            # call dedicated cement-with-flyash path which updates w/c and cement quantities
-            cement_content, fly_ash_content = self.__calculate_cement_with_flyash_content(water_cement_ratio, water_content)
-        else:
-            cement_content = self.__calculate_cement_content(water_cement_ratio, water_content)
-            fly_ash_content = 0.0
-        coarse_aggregate_proportion, fine_aggregate_proportion = self.__calculate_aggregate_content()
-
-        volume_of_concrete=1
-        volume_of_cement = self.calculate_volume_based_on_mass_and_specific_gravity(
-            cement_content, self.__get_specific_gravity(Materials.CEMENT)
-        )
-        # determine fly ash volume — Materials may not include FLY_ASH; default to 1.0 only for fly ash
-        fly_ash_member = getattr(MineralAdmixture, "FLY_ASH", None)
-        if fly_ash_member is not None:
-            try:
-                fly_ash_sg = self.__get_specific_gravity(fly_ash_member)
-            except Exception:
-                fly_ash_sg = 1.0
-        else:
-            fly_ash_sg = 1.0
-
-        volume_of_fly_ash = self.calculate_volume_based_on_mass_and_specific_gravity(
-            fly_ash_content, fly_ash_sg
-        )
-        volume_of_water = self.calculate_volume_based_on_mass_and_specific_gravity(
-            water_content, self.__get_specific_gravity(Materials.WATER)
-        )
-        # admixture content is percentage of cement content (use resolved percentage)
-        self.admixture_content = cement_content * 0.02
-        volume_of_admixture = self.calculate_volume_based_on_mass_and_specific_gravity(
-            self.admixture_content, self.__get_specific_gravity(Materials.ADMIXTURE)
-        )
-        if fly_ash_member is not None:
-            volume_of_all_in_aggregate = 1 - volume_of_cement - volume_of_fly_ash - volume_of_water - volume_of_admixture
-        else:
-            volume_of_all_in_aggregate = 1 - volume_of_cement - volume_of_water - volume_of_admixture
-        self.coarse_aggregate_content = volume_of_all_in_aggregate * coarse_aggregate_proportion \
-                                    * self.__get_specific_gravity(Materials.COARSE_AGGREGATE) * 1000
-        self.fine_aggregate_content = volume_of_all_in_aggregate * fine_aggregate_proportion \
-                                    * self.__get_specific_gravity(Materials.FINE_AGGREGATE) * 1000
-
-        coarse_aggregate_water_absorption = self.coarse_aggregate_content * self.coarse_aggregate_water_absorption * 0.01
-        fine_aggregate_water_absorption = self.fine_aggregate_content * self.fine_aggregate_water_absorption * 0.01
-        coarse_aggregate_surface_moisture = self.coarse_aggregate_content * self.coarse_aggregate_surface_moisture * 0.01
-        fine_aggregate_surface_moisture = self.fine_aggregate_content * self.fine_aggregate_surface_moisture * 0.01
-        free_water_after_correction = water_content + coarse_aggregate_water_absorption + fine_aggregate_water_absorption - coarse_aggregate_surface_moisture - fine_aggregate_surface_moisture
-        self.aggregate_absorbed_water = {"coarse": coarse_aggregate_water_absorption, "fine": fine_aggregate_water_absorption}
-        self.aggregate_surface_moisture = {"coarse": coarse_aggregate_surface_moisture, "fine": fine_aggregate_surface_moisture}
-        self.free_water_after_correction = float(free_water_after_correction)
-        volume_of_free_water = self.calculate_volume_based_on_mass_and_specific_gravity(
-            free_water_after_correction, self.__get_specific_gravity(Materials.WATER)
-        )
-        self.volume_of_free_water = float(volume_of_free_water)
-        self.coarse_aggregate_volume = self.calculate_volume_based_on_mass_and_specific_gravity(
-            self.coarse_aggregate_content, self.__get_specific_gravity(Materials.COARSE_AGGREGATE)
-        )
-        self.fine_aggregate_volume = self.calculate_volume_based_on_mass_and_specific_gravity(
-            self.fine_aggregate_content, self.__get_specific_gravity(Materials.FINE_AGGREGATE)
-        )
-
-        if self._display_flag:
-            print("\n" + "-"*60)
-            print("Final Mix Quantities (per m^3 of concrete)")
-            print("-"*60)
-            print(f"{'Component':<20} | {'Mass (kg/m^3)':>15} | {'Volume (m^3)':>12}")
-            print("-"*60)
-            # volumes were calculated earlier
-            print(f"{'Cement':<20} | {cement_content:15.2f} | {volume_of_cement:12.4f}")
-            if fly_ash_member is not None:
-                print(f"{'Fly Ash':<20} | {fly_ash_content:15.2f} | {volume_of_fly_ash:12.4f}")
-            print(f"{'Water':<20} | {water_content:15.2f} | {volume_of_water:12.4f}")
-            print(f"{'Admixture':<20} | {self.admixture_content:15.2f} | {volume_of_admixture:12.4f}")
-            print(f"{'Coarse aggregate':<20} | {self.coarse_aggregate_content:15.2f} | {self.coarse_aggregate_volume:12.4f}")
-            print(f"{'Fine aggregate':<20} | {self.fine_aggregate_content:15.2f} | {self.fine_aggregate_volume:12.4f}")
-            print("-"*60)
-            # reference only: free water after absorption/surface moisture corrections
-            print(f"After absorption and surface moisture adjustments, free water available: "
-                  f"{self.free_water_after_correction:.2f} kg "
-                  f"({self.volume_of_free_water:.4f} m^3)")
-            # additional reference: aggregate absorbed water and surface moisture (kg)
-            print(f"Coarse aggregate absorbed water : {coarse_aggregate_water_absorption:.2f} kg")
-            print(f"Fine   aggregate absorbed water : {fine_aggregate_water_absorption:.2f} kg")
-            print(f"Coarse aggregate surface moisture: {coarse_aggregate_surface_moisture:.2f} kg")
-            print(f"Fine   aggregate surface moisture: {fine_aggregate_surface_moisture:.2f} kg")
-            print("-"*60)
-
-        # clear display flag
-        self._display_flag = False
-
-        
-        return {
-            "summary": {
-                "target_mean_strength_N_per_mm2": "self.target_mean_compressive_strength", 
-                "water_cement_ratio": "self.water_cement_ratio"
-            },
-            "mix_per_m3": {
-                "components": {
-                    "cement": {
-                        "mass_kg": cement_content,
-                        "volume_m3": volume_of_cement,
-                        "specific_gravity": self.__get_specific_gravity(Materials.CEMENT)
-                    },
-                    "fly_ash": {
-                        "mass_kg": fly_ash_content,
-                        "volume_m3": volume_of_fly_ash,
-                        "specific_gravity": fly_ash_sg
-                    },
-                    "water": {
-                        "mass_kg": water_content,
-                        "volume_m3": volume_of_water,
-                        "specific_gravity": self.__get_specific_gravity(Materials.WATER)
-                    },
-                    "admixture": {
-                        "mass_kg": self.admixture_content,
-                        "volume_m3": volume_of_admixture,
-                        "specific_gravity": self.__get_specific_gravity(Materials.ADMIXTURE),
-                        "type": getattr(self.chemical_admixture, "name", None)
-                    },
-                    "coarse_aggregate": {
-                        "mass_kg": self.coarse_aggregate_content,
-                        "volume_m3": self.coarse_aggregate_volume,
-                        "specific_gravity": self.__get_specific_gravity(Materials.COARSE_AGGREGATE),
-                        "volume_proportion": self.coarse_aggregate_proportion
-                    },
-                    "fine_aggregate": {
-                        "mass_kg": self.fine_aggregate_content,
-                        "volume_m3": self.fine_aggregate_volume,
-                        "specific_gravity": self.__get_specific_gravity(Materials.FINE_AGGREGATE),
-                        "volume_proportion": self.fine_aggregate_proportion
-                    }
-                },
-                "total_concrete_volume_m3": 1.0
-            },
-            "aggregate_adjustments_kg": {
-                "coarse_absorbed_water": self.aggregate_absorbed_water['coarse'],
-                "fine_absorbed_water": self.aggregate_absorbed_water['fine'],
-                "coarse_surface_moisture": self.aggregate_surface_moisture['coarse'],
-                "fine_surface_moisture": self.aggregate_surface_moisture['fine'],
-                "free_water_after_correction": self.free_water_after_correction
-            },
-            "provenance": {
-                "maximum_nominal_size_mm": self.maximum_nominal_size.value,
-                "fine_aggregate_zone": self.fine_aggregate_zone.value,
-                "is_pumpable": self.is_pumpable,
-                "slump_mm": self.slump_mm,
-                "chemical_admixture": getattr(self.chemical_admixture, "value", None),
-                "chemical_admixture_percentage": self.chemical_admixture_percentage,
-                "mineral_admixture": getattr(self.mineral_admixture, "value", None),
-                "mineral_admixture_percentage": self.mineral_admixture_percentage
-            }
-        }
-
-    def compute_mix_design_for_volume(self, volume_m3: float, display_result: bool = False):
+            dict | MixResult: The mix design parameters (see MixResult.to_dict() for the dict layout).
+        """
+        with self._lock:
+            self.last_recomputed_stages = ()
+            registry = active_registry()
+            started = time.perf_counter() if registry is not None else 0.0
+            if self.result_cache is None or display_result or self.trace_sink is not None:
+                result = self.__compute_mix_design(display_result)
+            else:
+                result = self.result_cache.get_or_compute(self, self.__compute_mix_design)
+            if registry is not None:
+                registry.record_computation(time.perf_counter() - started)
+        return result if compact else result.to_dict()
+
+    def __compute_mix_design(self, display_result: bool = False):
+        trace = self.__tracer(bool(display_result))
+        # traced runs replay every stage so the trace is complete
+        dirty = ALL_STAGES if trace is not None else self._dirty_stages
+        if trace is not None:
+            trace("calculation_started")
+
+        spec = self.to_spec()
+        if spec.specific_gravities != self._computed_specific_gravities:
+            # a SpecificGravity was changed in place (or replaced) since the last run
+            dirty = dirty | STAGES_AFFECTED_BY_INPUT["specific_gravities"]
+        recomputed = tuple(stage for stage in MIX_DESIGN_STAGES if stage in dirty)
+        values = compute_stages(spec, recomputed, self._derived, trace)
+        if trace is not None:
+            _trace_mix_quantities(values, trace)
+
+        self.__publish(values)
+        for stage in recomputed:
+            self.stage_recomputations[stage] += 1
+        self.last_recomputed_stages = recomputed
+        self._computed_specific_gravities = spec.specific_gravities
+        self._dirty_stages -= frozenset(recomputed)
+        return mix_result(spec, values)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["_lock"]
+        state["_derived"] = dict(self._derived)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__["_derived"] = MappingProxyType(state["_derived"])
+        self.__dict__["_lock"] = threading.RLock()
+
+    def compute_mix_design_for_volume(self, volume_m3: float, display_result: bool = False, compact: bool = False):
         """Compute mix quantities for a specified volume (multiples of the 1 m^3 design).
 
         This method calls compute_mix_design() to obtain quantities per 1 m^3 and
@@ -743,70 +872,496 @@ class ConcreteMixDesign:
         Args:
             volume_m3 (float): Target concrete volume in m^3 (must be > 0).
             display_result (bool, optional): Whether to print a summary similar to compute_mix_design.
+            compact (bool, optional): Whether to return a MixResult view instead of a nested dict. Defaults to False.
         Returns:
-            dict: A dictionary containing scaled mix design parameters for the requested volume.
+            dict | MixResult: The mix design parameters scaled to the requested volume.
         """
         volume_m3 = float(volume_m3)
         if volume_m3 <= 0:
             raise ValueError("volume_m3 must be greater than zero")
 
         # obtain base design for 1 m^3 (suppress its display to control output here)
-        base = self.compute_mix_design(display_result=False)
-
-        scale = volume_m3
-
-        base_components = base["mix_per_m3"]["components"]
-        scaled_components = {}
-
-        for name, comp in base_components.items():
-            mass = comp.get("mass_kg", 0.0) or 0.0
-            vol = comp.get("volume_m3", 0.0) or 0.0
-            # copy and scale
-            comp_scaled = dict(comp)
-            comp_scaled["mass_kg"] = mass * scale
-            comp_scaled["volume_m3"] = vol * scale
-            scaled_components[name] = comp_scaled
-
-        # scale aggregate adjustments (kg)
-        agg_adj = base.get("aggregate_adjustments_kg", {})
-        scaled_agg_adj = {k: (v * scale if isinstance(v, (int, float)) else v) for k, v in agg_adj.items()}
-
-        result = {
-            "summary": base["summary"],
-            "mix_for_volume_m3": {
-                "components": scaled_components,
-                "total_concrete_volume_m3": scale
-            },
-            "aggregate_adjustments_kg": scaled_agg_adj,
-            "provenance": base["provenance"]
+        # and view it at the requested volume without copying the quantities
+        result = self.compute_mix_design(display_result=False, compact=True).scaled(volume_m3)
+        scale = result.scale
+
+        if display_result or self.trace_sink is not None:
+            free_water = result.free_water_after_correction
+            event = TraceEvent("volume_quantities", {
+                "volume_m3": scale,
+                "components": tuple((comp.name, comp.mass_kg, comp.volume_m3) for comp in result.components),
+                "free_water_after_correction": free_water,
+                "free_water_volume_m3": free_water / self.__get_specific_gravity(Materials.WATER) / 1000.0,
+                "coarse_absorbed_water": result.adjustment("coarse_absorbed_water"),
+                "fine_absorbed_water": result.adjustment("fine_absorbed_water"),
+                "coarse_surface_moisture": result.adjustment("coarse_surface_moisture"),
+                "fine_surface_moisture": result.adjustment("fine_surface_moisture"),
+            })
+            if self.trace_sink is not None:
+                self.trace_sink(event)
+            if display_result:
+                _CONSOLE(event)
+
+        return result if compact else result.to_dict()
+
+    def compute_mix_design_for_volumes(self, volumes) -> dict:
+        """Compute mix quantities for many concrete volumes from a single per m^3 design.
+
+        The base design is computed once (through compute_mix_design(), so the
+        result cache applies) and every mass, volume and aggregate adjustment
+        is scaled over the whole volume column.
+
+        Args:
+            volumes (iterable[float]): Concrete volumes in m^3 (each greater than zero).
+
+        Raises:
+            ValueError: If a volume is not greater than zero.
+
+        Returns:
+            dict: ``array('d')`` columns keyed by results.VOLUME_COLUMNS, in the order of volumes.
+        """
+        return self.compute_mix_design(compact=True).columns_for_volumes(volumes)
+
+
+# Side-effect-free calculation core. ConcreteMixDesign delegates every stage
+# to these functions; they read an immutable MixSpec and write only into the
+# working dict they are given, so specs can be computed from many threads at
+# once.
+
+MixSpec = namedtuple("MixSpec", ConcreteMixDesign.INPUT_ATTRIBUTES)
+MixSpec.__doc__ = """Immutable inputs of one mix design, named as ConcreteMixDesign.INPUT_ATTRIBUTES
+(specific_gravities as (material, value) pairs). Use ConcreteMixDesign.to_spec()
+to build one; MixSpec._replace() does not normalize values as set_inputs() does."""
+
+
+def _volume(mass, specific_gravity, round_value=3) -> float:
+    volume = (mass / specific_gravity) * (1/1000)
+    return round(volume, round_value)
+
+
+def _specific_gravity(specific_gravities: dict, material) -> float:
+    value = specific_gravities.get(material)
+    if value is None:
+        raise ValueError(f"specific gravity for {material} not provided")
+    return value
+
+
+def _target_mean_strength_stage(spec: MixSpec, values: dict, trace) -> float:
+    """
+    Compute target mean compressive strength for the selected concrete grade.
+
+    Uses the standard deviations from the provided table:
+    - M10, M15 : 3.5 N/mm^2
+    - M20, M25 : 4.0 N/mm^2
+    - M30, M35, M40, M45, M50, M55 : 5.0 N/mm^2
+
+    Formula used: target_mean = f_ck + 1.65 * standard_deviation
+    (1.65 corresponds to approximately 95% probability / 5% risk)
+
+    A site_standard_deviation input replaces the table value.
+
+    Table sets with a target strength margin (IS 10262:2019) use the
+    higher of that value and f_ck + margin.
+    """
+    tables = get_table_set(spec.table_version)
+    s = spec.site_standard_deviation
+    if s is None:
+        s = tables.get_standard_deviation(spec.concrete_grade)
+    try:
+        fck = int(str(spec.concrete_grade.value).lstrip("M").strip())
+    except Exception:
+        fck = int(spec.concrete_grade.name.lstrip("M"))
+
+    target_mean = fck + 1.65 * s
+    margin = tables.get_target_strength_margin(spec.concrete_grade)
+    if margin is not None:
+        target_mean = max(target_mean, fck + margin)
+    values["characteristic_strength"] = fck
+    values["standard_deviation"] = s
+    values["target_mean_compressive_strength"] = target_mean
+
+    if trace is not None:
+        trace("target_mean_strength",
+              concrete_grade=spec.concrete_grade.value,
+              characteristic_strength=fck,
+              standard_deviation=s,
+              target_mean_strength=target_mean)
+
+    return target_mean
+
+
+def _water_cement_ratio_stage(spec: MixSpec, values: dict, trace, reinforced: bool = True) -> float:
+    """
+    Determine maximum water/cement ratio from IS456 Table 5 for
+    normal-weight aggregates of 20 mm nominal maximum size.
+
+    Table values (maximum free water-cement ratio):
+    - Plain concrete:    Mild 0.60, Moderate 0.60, Severe 0.50, Very severe 0.45, Extreme 0.40
+    - Reinforced concrete:Mild 0.55, Moderate 0.50, Severe 0.45, Very severe 0.45, Extreme 0.40
+    """
+    if spec.exposure_condition is None:
+        raise ValueError("exposure_condition must be set to determine water/cement ratio")
+
+    initial = get_table_set(spec.table_version).get_water_cement_ratio(spec.exposure_condition, reinforced)
+    wcr = initial
+    if spec.chemical_admixture == ChemicalAdmixture.SUPERPLASTICIZER:
+        wcr -= 0.05
+    values["initial_water_cement_ratio"] = initial
+    values["water_cement_ratio"] = float(wcr)
+
+    if trace is not None:
+        trace("water_cement_ratio",
+              exposure_condition=spec.exposure_condition.value,
+              reinforced=reinforced,
+              initial_water_cement_ratio=initial,
+              water_cement_ratio=values["water_cement_ratio"])
+
+    return values["water_cement_ratio"]
+
+
+def _water_content_stage(spec: MixSpec, values: dict, trace):
+    """
+    Determine reference water content (kg/m^3) based on nominal maximum
+    aggregate size (IS table).
+    10 mm -> 208, 20 mm -> 186, 40 mm -> 165
+
+    Reference table values correspond to 50 mm slump. If slump_mm is
+    provided the water content is adjusted by slump_adjustment_pct_per_25mm
+    for every 25 mm difference from 50 mm.
+
+    If superplasticizer is used, the water content is reduced by 20%.
+    """
+    if spec.maximum_nominal_size is None:
+        raise ValueError("maximum_nominal_size must be set to determine water content")
+
+    base_water = get_table_set(spec.table_version).get_water_content(spec.maximum_nominal_size)
+    if spec.slump_mm is not None:
+        steps = (spec.slump_mm - 50.0) / 25.0  # positive if slump > 50, negative if < 50
+        adjusted_water = base_water * (1.0 + steps * spec.slump_adjustment_pct_per_25mm)
+    else:
+        adjusted_water = base_water
+
+    if spec.chemical_admixture == ChemicalAdmixture.SUPERPLASTICIZER:
+        adjusted_water *= (1 - spec.chemical_admixture_percentage / 100)
+    adjusted_water = round(adjusted_water)
+    values["maximum_water_content"] = adjusted_water
+
+    if trace is not None:
+        trace("water_content",
+              maximum_nominal_size_mm=spec.maximum_nominal_size.value,
+              base_water_content=base_water,
+              slump_mm=spec.slump_mm,
+              slump_adjustment_pct_per_25mm=spec.slump_adjustment_pct_per_25mm,
+              superplasticizer=spec.chemical_admixture == ChemicalAdmixture.SUPERPLASTICIZER,
+              chemical_admixture_percentage=spec.chemical_admixture_percentage,
+              water_content=adjusted_water)
+
+    return adjusted_water
+
+
+def _minimum_cement_check(spec: MixSpec, cement_content: float) -> float:
+    """Warn when the computed cement content is below the exposure minimum; return the minimum."""
+    minimum_cement_content = get_table_set(spec.table_version).get_minimum_cement_content(spec.exposure_condition)
+    if cement_content < minimum_cement_content:
+        warnings.warn(
+            f"Calculated cement content {cement_content:.2f} kg/m^3 is less than minimum required for exposure condition {minimum_cement_content:.2f} kg/m^3",
+            UserWarning
+        )
+        registry = active_registry()
+        if registry is not None:
+            registry.record_warning(LOW_CEMENT_CONTENT_WARNING)
+    return minimum_cement_content
+
+
+def _plain_cement_content(spec: MixSpec, values: dict, trace, water_cement_ratio, water_content):
+    cement_content = water_content / water_cement_ratio
+    minimum_cement_content = _minimum_cement_check(spec, cement_content)
+    values["minimum_cement_content"] = max(cement_content, minimum_cement_content)
+
+    if trace is not None:
+        trace("cement_content",
+              computed_cement_content=cement_content,
+              minimum_cement_content=minimum_cement_content,
+              cement_content=values["minimum_cement_content"])
+
+    return values["minimum_cement_content"]
+
+
+def _cement_with_fly_ash_content(spec: MixSpec, values: dict, trace, water_cement_ratio, water_content):
+    cement_content = water_content / water_cement_ratio
+    minimum_cement_content = _minimum_cement_check(spec, cement_content)
+
+    # initial minimum to compare with after using cementitious materials
+    initial_minimum_cement_content = max(cement_content, minimum_cement_content)
+
+    # assume cementitious material content increased by 10% to account for replacement chemistry
+    cementitious_material_content = cement_content * 1.10
+    # new effective water/cement_ratio based on total cementitious content
+    new_water_cement_ratio = water_content / cementitious_material_content
+
+    # determine fly ash replacement mass (use resolved mineral_admixture_percentage if provided)
+    replacement_fraction = (spec.mineral_admixture_percentage / 100.0) if spec.mineral_admixture_percentage > 0 else 0.30
+    fly_ash_content = math.floor(cementitious_material_content * replacement_fraction)
+
+    new_cement_content = cementitious_material_content - fly_ash_content
+    cement_savings = initial_minimum_cement_content - new_cement_content
+
+    values["fly_ash_content"] = float(fly_ash_content)
+    values["cementitious_material_content"] = float(cementitious_material_content)
+    values["new_water_cement_ratio"] = float(new_water_cement_ratio)
+    values["new_cement_content"] = float(new_cement_content)
+    values["cement_savings"] = float(cement_savings)
+    # the working cement content is the cement left after replacement
+    values["minimum_cement_content"] = values["new_cement_content"]
+
+    if trace is not None:
+        trace("cement_with_fly_ash",
+              computed_cement_content=cement_content,
+              minimum_cement_content=minimum_cement_content,
+              initial_cement_content=initial_minimum_cement_content,
+              cementitious_material_content=values["cementitious_material_content"],
+              replacement_fraction=replacement_fraction,
+              fly_ash_content=values["fly_ash_content"],
+              cement_content=values["new_cement_content"],
+              cement_savings=values["cement_savings"],
+              effective_water_cement_ratio=values["new_water_cement_ratio"])
+
+    return values["minimum_cement_content"], values["fly_ash_content"]
+
+
+def _cement_content_stage(spec: MixSpec, values: dict, trace):
+    water_cement_ratio, water_content = values["water_cement_ratio"], values["maximum_water_content"]
+    if spec.mineral_admixture == MineralAdmixture.FLY_ASH:
+        _cement_with_fly_ash_content(spec, values, trace, water_cement_ratio, water_content)
+    else:
+        _plain_cement_content(spec, values, trace, water_cement_ratio, water_content)
+        values["fly_ash_content"] = 0.0
+    tables = get_table_set(spec.table_version)
+    values["diagnostics"] = diagnose(
+        water_content / water_cement_ratio < tables.get_minimum_cement_content(spec.exposure_condition),
+        values["minimum_cement_content"], values["fly_ash_content"], water_content,
+        spec.maximum_cement_content, tables.get_water_cement_ratio(spec.exposure_condition))
+
+
+def _aggregate_proportions_stage(spec: MixSpec, values: dict, trace):
+    """Determine volume fraction of coarse aggregate per unit volume of
+    total aggregate from IS table (Table 3) depending on fine aggregate
+    zone and nominal maximum size.
+
+    Raises:
+        ValueError: If fine_aggregate_zone or maximum_nominal_size is not set.
+        ValueError: If unsupported combination of maximum_nominal_size and fine_aggregate_zone is used.
+
+    Returns:
+        tuple[float, float]: Proportions of coarse and fine aggregate.
+    """
+    if spec.fine_aggregate_zone is None or spec.maximum_nominal_size is None:
+        raise ValueError("fine_aggregate_zone and maximum_nominal_size must be set to determine coarse aggregate proportion")
+
+    try:
+        prop = get_table_set(spec.table_version).get_coarse_aggregate_proportion(
+            spec.maximum_nominal_size, spec.fine_aggregate_zone)
+    except KeyError:
+        raise ValueError("unsupported combination of maximum_nominal_size and fine_aggregate_zone")
+
+    water_cement_ratio = values["water_cement_ratio"]
+    if water_cement_ratio == 0.5:
+        coarse_aggregate_proportion = float(prop)
+    elif water_cement_ratio < 0.5:
+        decrease = abs(round((0.5 - water_cement_ratio) / 0.05))
+        coarse_aggregate_proportion = float(prop) + decrease * 0.01
+    else:
+        increase = abs(round((water_cement_ratio - 0.5) / 0.05))
+        coarse_aggregate_proportion = float(prop) - increase * 0.01
+    if spec.is_pumpable:
+        coarse_aggregate_proportion = round(coarse_aggregate_proportion * 0.9, 2)
+
+    values["coarse_aggregate_proportion"] = coarse_aggregate_proportion
+    values["fine_aggregate_proportion"] = float(1 - coarse_aggregate_proportion)
+
+    if trace is not None:
+        trace("aggregate_proportions",
+              fine_aggregate_zone=spec.fine_aggregate_zone.value,
+              maximum_nominal_size_mm=spec.maximum_nominal_size.value,
+              base_coarse_aggregate_proportion=prop,
+              water_cement_ratio=water_cement_ratio,
+              is_pumpable=bool(spec.is_pumpable),
+              coarse_aggregate_proportion=coarse_aggregate_proportion,
+              fine_aggregate_proportion=values["fine_aggregate_proportion"])
+
+    return coarse_aggregate_proportion, values["fine_aggregate_proportion"]
+
+
+def _mix_quantities_stage(spec: MixSpec, values: dict, trace):
+    """Compute the binder, water and admixture volumes and the aggregate
+    masses and volumes per m^3 of concrete."""
+    specific_gravities = dict(spec.specific_gravities)
+    cement_content = values["minimum_cement_content"]
+    cement_sg = _specific_gravity(specific_gravities, Materials.CEMENT)
+    cement_volume = _volume(cement_content, cement_sg)
+    # fly ash may be absent from the specific gravities; default to 1.0 only for fly ash
+    fly_ash_sg = specific_gravities.get(MineralAdmixture.FLY_ASH, 1.0)
+    fly_ash_volume = _volume(values["fly_ash_content"], fly_ash_sg)
+    water_sg = _specific_gravity(specific_gravities, Materials.WATER)
+    water_volume = _volume(values["maximum_water_content"], water_sg)
+    # admixture content is percentage of cement content (use resolved percentage)
+    admixture_content = cement_content * 0.02
+    admixture_sg = _specific_gravity(specific_gravities, Materials.ADMIXTURE)
+    admixture_volume = _volume(admixture_content, admixture_sg)
+    volume_of_all_in_aggregate = 1 - cement_volume - fly_ash_volume - water_volume - admixture_volume
+    coarse_sg = _specific_gravity(specific_gravities, Materials.COARSE_AGGREGATE)
+    fine_sg = _specific_gravity(specific_gravities, Materials.FINE_AGGREGATE)
+    coarse_aggregate_content = volume_of_all_in_aggregate * values["coarse_aggregate_proportion"] * coarse_sg * 1000
+    fine_aggregate_content = volume_of_all_in_aggregate * values["fine_aggregate_proportion"] * fine_sg * 1000
+
+    values["cement_volume"] = cement_volume
+    values["fly_ash_specific_gravity"] = fly_ash_sg
+    # in MixResult component order, so later stages need not look them up again
+    values["component_specific_gravities"] = (cement_sg, fly_ash_sg, water_sg, admixture_sg, coarse_sg, fine_sg)
+    values["fly_ash_volume"] = fly_ash_volume
+    values["water_volume"] = water_volume
+    values["admixture_content"] = admixture_content
+    values["admixture_volume"] = admixture_volume
+    values["coarse_aggregate_content"] = coarse_aggregate_content
+    values["fine_aggregate_content"] = fine_aggregate_content
+    values["coarse_aggregate_volume"] = _volume(coarse_aggregate_content, coarse_sg)
+    values["fine_aggregate_volume"] = _volume(fine_aggregate_content, fine_sg)
+
+
+def _moisture_correction_stage(spec: MixSpec, values: dict, trace):
+    """Correct the free water for aggregate absorption and surface moisture."""
+    coarse_aggregate_content = values["coarse_aggregate_content"]
+    fine_aggregate_content = values["fine_aggregate_content"]
+    coarse_aggregate_water_absorption = coarse_aggregate_content * spec.coarse_aggregate_water_absorption * 0.01
+    fine_aggregate_water_absorption = fine_aggregate_content * spec.fine_aggregate_water_absorption * 0.01
+    coarse_aggregate_surface_moisture = coarse_aggregate_content * spec.coarse_aggregate_surface_moisture * 0.01
+    fine_aggregate_surface_moisture = fine_aggregate_content * spec.fine_aggregate_surface_moisture * 0.01
+    free_water_after_correction = values["maximum_water_content"] + coarse_aggregate_water_absorption + fine_aggregate_water_absorption - coarse_aggregate_surface_moisture - fine_aggregate_surface_moisture
+    values["aggregate_absorbed_water"] = {"coarse": coarse_aggregate_water_absorption, "fine": fine_aggregate_water_absorption}
+    values["aggregate_surface_moisture"] = {"coarse": coarse_aggregate_surface_moisture, "fine": fine_aggregate_surface_moisture}
+    values["free_water_after_correction"] = float(free_water_after_correction)
+    volume_of_free_water = _volume(free_water_after_correction, values["component_specific_gravities"][2])
+    values["volume_of_free_water"] = float(volume_of_free_water)
+
+
+_STAGE_FUNCTIONS = {
+    "target_mean_strength": _target_mean_strength_stage,
+    "water_cement_ratio": _water_cement_ratio_stage,
+    "water_content": _water_content_stage,
+    "cement_content": _cement_content_stage,
+    "aggregate_proportions": _aggregate_proportions_stage,
+    "mix_quantities": _mix_quantities_stage,
+    "moisture_correction": _moisture_correction_stage,
+}
+
+
+def compute_stages(spec: MixSpec, stages=MIX_DESIGN_STAGES, previous=None, trace=None) -> MappingProxyType:
+    """Run calculation stages of a spec without touching any design instance.
+
+    Args:
+        spec (MixSpec): The design inputs.
+        stages (iterable[str], optional): Stages to run, in MIX_DESIGN_STAGES order. Defaults to every stage.
+        previous (Mapping | None, optional): Derived values of an earlier run, read by stages whose upstream stages are not run. Defaults to None.
+        trace (callable | None, optional): Called as trace(stage, **values) for every traced stage. Defaults to None.
+
+    Raises:
+        ValueError: If the spec is invalid.
+
+    Returns:
+        MappingProxyType: Read-only derived values (previous, updated by the stages run), keyed by ConcreteMixDesign attribute name.
+    """
+    values = {} if previous is None else dict(previous)
+    registry = active_registry()
+    for stage in stages:
+        run = _STAGE_FUNCTIONS[stage]
+        if registry is None:
+            run(spec, values, trace)
+        else:
+            started = time.perf_counter()
+            run(spec, values, trace)
+            registry.record_stage(stage, time.perf_counter() - started)
+    return MappingProxyType(values)
+
+
+def _trace_mix_quantities(values, trace):
+    trace("mix_quantities",
+          cement_mass_kg=values["minimum_cement_content"],
+          cement_volume_m3=values["cement_volume"],
+          fly_ash_mass_kg=values["fly_ash_content"],
+          fly_ash_volume_m3=values["fly_ash_volume"],
+          water_mass_kg=values["maximum_water_content"],
+          water_volume_m3=values["water_volume"],
+          admixture_mass_kg=values["admixture_content"],
+          admixture_volume_m3=values["admixture_volume"],
+          coarse_aggregate_mass_kg=values["coarse_aggregate_content"],
+          coarse_aggregate_volume_m3=values["coarse_aggregate_volume"],
+          fine_aggregate_mass_kg=values["fine_aggregate_content"],
+          fine_aggregate_volume_m3=values["fine_aggregate_volume"],
+          free_water_after_correction=values["free_water_after_correction"],
+          free_water_volume_m3=values["volume_of_free_water"],
+          coarse_absorbed_water=values["aggregate_absorbed_water"]["coarse"],
+          fine_absorbed_water=values["aggregate_absorbed_water"]["fine"],
+          coarse_surface_moisture=values["aggregate_surface_moisture"]["coarse"],
+          fine_surface_moisture=values["aggregate_surface_moisture"]["fine"])
+
+
+def mix_result(spec: MixSpec, values) -> MixResult:
+    """Assemble the MixResult of a spec from its derived values (see compute_stages())."""
+    return MixResult.from_quantities(
+        masses=(values["minimum_cement_content"], values["fly_ash_content"], values["maximum_water_content"],
+                values["admixture_content"], values["coarse_aggregate_content"], values["fine_aggregate_content"]),
+        volumes=(values["cement_volume"], values["fly_ash_volume"], values["water_volume"], values["admixture_volume"],
+                 values["coarse_aggregate_volume"], values["fine_aggregate_volume"]),
+        specific_gravities=values["component_specific_gravities"],
+        coarse_aggregate_proportion=values["coarse_aggregate_proportion"],
+        fine_aggregate_proportion=values["fine_aggregate_proportion"],
+        adjustments=(
+            values["aggregate_absorbed_water"]["coarse"],
+            values["aggregate_absorbed_water"]["fine"],
+            values["aggregate_surface_moisture"]["coarse"],
+            values["aggregate_surface_moisture"]["fine"],
+            values["free_water_after_correction"],
+        ),
+        target_mean_strength=values["target_mean_compressive_strength"],
+        water_cement_ratio=values["water_cement_ratio"],
+        admixture_type=getattr(spec.chemical_admixture, "name", None),
+        provenance={
+            "maximum_nominal_size_mm": spec.maximum_nominal_size.value,
+            "fine_aggregate_zone": spec.fine_aggregate_zone.value,
+            "is_pumpable": spec.is_pumpable,
+            "slump_mm": spec.slump_mm,
+            "chemical_admixture": getattr(spec.chemical_admixture, "value", None),
+            "chemical_admixture_percentage": spec.chemical_admixture_percentage,
+            "mineral_admixture": getattr(spec.mineral_admixture, "value", None),
+            "mineral_admixture_percentage": spec.mineral_admixture_percentage
         }
-        if display_result:
-            print("\n" + "=" * 60)
-            print(f"Concrete Mix Design - Quantities for {scale:.3f} m^3")
-            print("=" * 60)
-            print("\n" + "-" * 60)
-            print("Final Mix Quantities")
-            print("-" * 60)
-            print(f"{'Component':<20} | {'Mass (kg)':>15} | {'Volume (m^3)':>12}")
-            print("-" * 60)
-            for comp_name in ("cement", "fly_ash", "water", "admixture", "coarse_aggregate", "fine_aggregate"):
-                comp = scaled_components.get(comp_name)
-                if comp is None:
-                    continue
-                print(f"{comp_name.replace('_', ' ').title():<20} | {comp['mass_kg']:15.2f} | {comp['volume_m3']:12.4f}")
-            print("-" * 60)
-            free_water = scaled_agg_adj.get("free_water_after_correction")
-            if free_water is not None:
-                vol_free_water = free_water / self.__get_specific_gravity(Materials.WATER) / 1000.0
-                print(f"After absorption and surface moisture adjustments, free water available: "
-                      f"{free_water:.2f} kg ({vol_free_water:.4f} m^3) for {scale:.3f} m^3")
-            print(f"Coarse aggregate absorbed water : {scaled_agg_adj.get('coarse_absorbed_water', 0.0):.2f} kg")
-            print(f"Fine   aggregate absorbed water : {scaled_agg_adj.get('fine_absorbed_water', 0.0):.2f} kg")
-            print(f"Coarse aggregate surface moisture: {scaled_agg_adj.get('coarse_surface_moisture', 0.0):.2f} kg")
-            print(f"Fine   aggregate surface moisture: {scaled_agg_adj.get('fine_surface_moisture', 0.0):.2f} kg")
-            print("-" * 60)
-
-        return result
-
-    
+    )
+
+
+def compute_mix(spec: MixSpec, trace=None) -> MixResult:
+    """Compute a mix design from an immutable spec.
+
+    Pure apart from warnings and metrics: no design instance is read or
+    written, so specs can be fanned out over threads.
 
+    Example:
+        specs = [design.to_spec() for design in designs]
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(compute_mix, specs))
+
+    Args:
+        spec (MixSpec): The design inputs (see ConcreteMixDesign.to_spec()).
+        trace (callable | None, optional): Called as trace(stage, **values) for every stage, as in a traced compute_mix_design(). Defaults to None.
+
+    Raises:
+        ValueError: If the spec is invalid.
+
+    Returns:
+        MixResult: The mix design.
+    """
+    if trace is not None:
+        trace("calculation_started")
+    values = compute_stages(spec, MIX_DESIGN_STAGES, None, trace)
+    if trace is not None:
+        _trace_mix_quantities(values, trace)
+    return mix_result(spec, values)
@@ -0,0 +1,282 @@
+"""Precomputed IS 10262 design space over every discrete input combination.
+
+Every stage of the mix design up to the aggregate proportions depends only on
+the discrete enum inputs (grade, exposure, nominal size, zone, pumpability and
+admixture types). Those stages are evaluated once at import for every
+combination and stored in ``DESIGN_SPACE``, indexed by :func:`design_index`.
+Each registered table version gets its own space (see :func:`get_design_space`);
+``DESIGN_SPACE`` is the one of ``DEFAULT_TABLE_VERSION``.
+The remaining continuous stages (slump, admixture percentages, specific
+gravities and moisture corrections) and the design parameters (site standard
+deviation, slump water adjustment) are evaluated in closed form by :func:`evaluate_entry`.
+"""
+from collections import namedtuple
+from itertools import product
+import math
+
+from civilutils.indian_standards.concrete import (
+    ChemicalAdmixture,
+    ConcreteGrade,
+    ExposureCondition,
+    FineAggregateZone,
+    MaximumNominalSize,
+    MineralAdmixture,
+    DEFAULT_TABLE_VERSION,
+    get_table_set,
+)
+
+# Discrete axes of the design space, in index order.
+DESIGN_SPACE_AXES = (
+    ("concrete_grade", tuple(ConcreteGrade)),
+    ("exposure_condition", tuple(ExposureCondition)),
+    ("maximum_nominal_size", tuple(MaximumNominalSize)),
+    ("fine_aggregate_zone", tuple(FineAggregateZone)),
+    ("is_pumpable", (False, True)),
+    ("chemical_admixture", (None,) + tuple(ChemicalAdmixture)),
+    ("mineral_admixture", (None,) + tuple(MineralAdmixture)),
+)
+
+DesignSpaceEntry = namedtuple("DesignSpaceEntry", (
+    "target_mean_strength",
+    "water_cement_ratio",
+    "base_water_content",
+    "minimum_cement_content",
+    "coarse_aggregate_proportion",
+    "fine_aggregate_proportion",
+    "is_superplasticized",
+    "has_fly_ash",
+    "maximum_water_cement_ratio",
+    "characteristic_strength",
+    "target_strength_margin",
+))
+
+_AXIS_CODES = tuple({value: code for code, value in enumerate(values)} for _, values in DESIGN_SPACE_AXES)
+_AXIS_SIZES = tuple(len(values) for _, values in DESIGN_SPACE_AXES)
+
+
+def design_index(concrete_grade, exposure_condition, maximum_nominal_size,
+                 fine_aggregate_zone, is_pumpable, chemical_admixture,
+                 mineral_admixture) -> int:
+    """Return the position of a discrete input combination in DESIGN_SPACE.
+
+    Args:
+        concrete_grade (ConcreteGrade): The grade of concrete.
+        exposure_condition (ExposureCondition): The exposure condition.
+        maximum_nominal_size (MaximumNominalSize): The maximum nominal size of the aggregate.
+        fine_aggregate_zone (FineAggregateZone): The zone of fine aggregate.
+        is_pumpable (str | bool): Whether the concrete is pumpable (truthiness is used).
+        chemical_admixture (ChemicalAdmixture | None): The type of chemical admixture.
+        mineral_admixture (MineralAdmixture | None): The type of mineral admixture.
+
+    Raises:
+        ValueError: If any of the inputs is not a member of its axis.
+
+    Returns:
+        int: Index into DESIGN_SPACE.
+    """
+    index = 0
+    values = (concrete_grade, exposure_condition, maximum_nominal_size,
+              fine_aggregate_zone, bool(is_pumpable), chemical_admixture,
+              mineral_admixture)
+    for codes, size, value, (name, _) in zip(_AXIS_CODES, _AXIS_SIZES, values, DESIGN_SPACE_AXES):
+        try:
+            index = index * size + codes[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"invalid {name}: {value!r}")
+    return index
+
+
+def _build_entry(tables, grade, exposure, size, zone, pumpable, chemical, mineral) -> DesignSpaceEntry:
+    fck = int(grade.value.lstrip("M"))
+    target_mean = fck + 1.65 * tables.get_standard_deviation(grade)
+    margin = tables.get_target_strength_margin(grade)
+    if margin is not None:
+        target_mean = max(target_mean, fck + margin)
+
+    is_sp = chemical == ChemicalAdmixture.SUPERPLASTICIZER
+    maximum_wcr = tables.get_water_cement_ratio(exposure)
+    wcr = maximum_wcr
+    if is_sp:
+        wcr -= 0.05
+    wcr = float(wcr)
+
+    prop = tables.get_coarse_aggregate_proportion(size, zone)
+    if wcr == 0.5:
+        coarse_prop = prop
+    elif wcr < 0.5:
+        coarse_prop = prop + abs(round((0.5 - wcr) / 0.05)) * 0.01
+    else:
+        coarse_prop = prop - abs(round((wcr - 0.5) / 0.05)) * 0.01
+    if pumpable:
+        coarse_prop = round(coarse_prop * 0.9, 2)
+
+    return DesignSpaceEntry(
+        target_mean_strength=target_mean,
+        water_cement_ratio=wcr,
+        base_water_content=tables.get_water_content(size),
+        minimum_cement_content=tables.get_minimum_cement_content(exposure),
+        coarse_aggregate_proportion=coarse_prop,
+        fine_aggregate_proportion=float(1 - coarse_prop),
+        is_superplasticized=is_sp,
+        has_fly_ash=mineral == MineralAdmixture.FLY_ASH,
+        maximum_water_cement_ratio=float(maximum_wcr),
+        characteristic_strength=fck,
+        target_strength_margin=margin,
+    )
+
+
+_DESIGN_SPACES = {}
+
+
+def get_design_space(table_version: str = DEFAULT_TABLE_VERSION) -> tuple:
+    """Return the design space of a table version, building it on first use.
+
+    Spaces are immutable tuples shared by every caller in the process.
+
+    Args:
+        table_version (str, optional): Key of concrete.TABLE_SETS. Defaults to DEFAULT_TABLE_VERSION.
+
+    Raises:
+        ValueError: If the version is not registered.
+
+    Returns:
+        tuple: DesignSpaceEntry per design_index.
+    """
+    space = _DESIGN_SPACES.get(table_version)
+    if space is None:
+        tables = get_table_set(table_version)
+        space = tuple(_build_entry(tables, *combination)
+                      for combination in product(*(values for _, values in DESIGN_SPACE_AXES)))
+        _DESIGN_SPACES[table_version] = space
+    return space
+
+
+DESIGN_SPACE = get_design_space()
+
+
+def _volume(mass, specific_gravity):
+    # same expression and rounding as calculate_volume_based_on_mass_and_specific_gravity
+    return round((mass / specific_gravity) * (1 / 1000), 3)
+
+
+# continuous inputs of evaluate_entry(), in argument order
+CONTINUOUS_INPUTS = (
+    "slump_mm",
+    "chemical_admixture_percentage",
+    "mineral_admixture_percentage",
+    "cement_specific_gravity",
+    "fine_aggregate_specific_gravity",
+    "coarse_aggregate_specific_gravity",
+    "water_specific_gravity",
+    "admixture_specific_gravity",
+    "fly_ash_specific_gravity",
+    "coarse_aggregate_water_absorption",
+    "coarse_aggregate_surface_moisture",
+    "fine_aggregate_water_absorption",
+    "fine_aggregate_surface_moisture",
+)
+
+# design parameters of evaluate_entry(), following CONTINUOUS_INPUTS; they are
+# carried through every design-space path but neither sampled nor differentiated
+DESIGN_PARAMETERS = (
+    "site_standard_deviation",
+    "slump_adjustment_pct_per_25mm",
+)
+
+
+def target_mean_strength(entry: DesignSpaceEntry, site_standard_deviation=None) -> float:
+    """Target mean strength of an entry, with a site standard deviation replacing the table value.
+
+    Same expression as the target mean strength stage of ConcreteMixDesign.
+    """
+    if site_standard_deviation is None:
+        return entry.target_mean_strength
+    target_mean = entry.characteristic_strength + 1.65 * site_standard_deviation
+    if entry.target_strength_margin is not None:
+        target_mean = max(target_mean, entry.characteristic_strength + entry.target_strength_margin)
+    return target_mean
+
+
+def evaluate_binder(entry: DesignSpaceEntry, slump_mm, chemical_admixture_percentage,
+                    mineral_admixture_percentage, slump_adjustment_pct_per_25mm=0.03) -> tuple:
+    """Evaluate the water and binder contents of a design on top of a DESIGN_SPACE entry.
+
+    Admixture percentages must already be resolved (see evaluate_entry()). The
+    water content changes by slump_adjustment_pct_per_25mm for every 25 mm of
+    slump above or below 50 mm.
+
+    Returns:
+        tuple: Water content, cement content calculated from the w/c ratio,
+        final cement content and fly ash content (kg/m^3).
+    """
+    water = entry.base_water_content
+    if slump_mm is not None:
+        water = water * (1.0 + (slump_mm - 50.0) / 25.0 * slump_adjustment_pct_per_25mm)
+    if entry.is_superplasticized:
+        water *= (1 - chemical_admixture_percentage / 100)
+    water = round(water)
+
+    computed_cement = water / entry.water_cement_ratio
+    if entry.has_fly_ash:
+        cementitious = computed_cement * 1.10
+        replacement = (mineral_admixture_percentage / 100.0) if mineral_admixture_percentage > 0 else 0.30
+        fly_ash = float(math.floor(cementitious * replacement))
+        cement = cementitious - fly_ash
+    else:
+        cement = max(computed_cement, entry.minimum_cement_content)
+        fly_ash = 0.0
+    return water, computed_cement, cement, fly_ash
+
+
+def evaluate_entry(entry: DesignSpaceEntry, slump_mm, chemical_admixture_percentage,
+                   mineral_admixture_percentage, cement_specific_gravity,
+                   fine_aggregate_specific_gravity, coarse_aggregate_specific_gravity,
+                   water_specific_gravity, admixture_specific_gravity,
+                   fly_ash_specific_gravity=1.0,
+                   coarse_aggregate_water_absorption=0.0,
+                   coarse_aggregate_surface_moisture=0.0,
+                   fine_aggregate_water_absorption=0.0,
+                   fine_aggregate_surface_moisture=0.0,
+                   site_standard_deviation=None,
+                   slump_adjustment_pct_per_25mm=0.03) -> tuple:
+    """Evaluate the continuous stages of a design on top of a DESIGN_SPACE entry.
+
+    Admixture percentages must already be resolved (0.0 when the admixture is
+    absent, the enum default when no percentage was given). A site standard
+    deviation replaces the table value in the target mean strength;
+    slump_adjustment_pct_per_25mm is the water adjustment of evaluate_binder().
+
+    Returns:
+        tuple: Values in the order of ``batch.RESULT_COLUMNS``, followed by a
+        flag telling whether the calculated cement content was below the
+        exposure minimum.
+    """
+    wcr = entry.water_cement_ratio
+    water, computed_cement, cement, fly_ash = evaluate_binder(
+        entry, slump_mm, chemical_admixture_percentage, mineral_admixture_percentage,
+        slump_adjustment_pct_per_25mm)
+    below_minimum = computed_cement < entry.minimum_cement_content
+
+    coarse_prop = entry.coarse_aggregate_proportion
+    fine_prop = entry.fine_aggregate_proportion
+    v_cement = _volume(cement, cement_specific_gravity)
+    v_fly_ash = _volume(fly_ash, fly_ash_specific_gravity)
+    v_water = _volume(water, water_specific_gravity)
+    admixture = cement * 0.02
+    v_admixture = _volume(admixture, admixture_specific_gravity)
+    v_aggregate = 1 - v_cement - v_fly_ash - v_water - v_admixture
+    coarse = v_aggregate * coarse_prop * coarse_aggregate_specific_gravity * 1000
+    fine = v_aggregate * fine_prop * fine_aggregate_specific_gravity * 1000
+
+    ca_absorbed = coarse * coarse_aggregate_water_absorption * 0.01
+    fa_absorbed = fine * fine_aggregate_water_absorption * 0.01
+    ca_surface = coarse * coarse_aggregate_surface_moisture * 0.01
+    fa_surface = fine * fine_aggregate_surface_moisture * 0.01
+    free_water = water + ca_absorbed + fa_absorbed - ca_surface - fa_surface
+
+    return (target_mean_strength(entry, site_standard_deviation), wcr, cement, v_cement, fly_ash, v_fly_ash,
+            water, v_water, admixture, v_admixture,
+            coarse, _volume(coarse, coarse_aggregate_specific_gravity), coarse_prop,
+            fine, _volume(fine, fine_aggregate_specific_gravity), fine_prop,
+            ca_absorbed, fa_absorbed, ca_surface, fa_surface, free_water,
+            below_minimum)
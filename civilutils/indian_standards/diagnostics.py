@@ -0,0 +1,78 @@
+"""Rule violation codes of concrete mix designs.
+
+Diagnostics are bit flags, so a single small integer records every rule a
+design violates and a batch keeps them as one compact ``array('B')`` column
+instead of emitting a warning per design:
+
+* ``LOW_CEMENT_CONTENT``: the cement content calculated from the water content
+  and the w/c ratio is below the IS 456 Table 5 minimum for the exposure (the
+  design raises it to the minimum unless fly ash replaces part of it);
+* ``HIGH_CEMENT_CONTENT``: the cement content, not including fly ash
+  (IS 456 clause 8.2.4.2), exceeds the maximum cement content;
+* ``WATER_CEMENT_RATIO``: the ratio of free water to cementitious material
+  exceeds the IS 456 Table 5 maximum for the exposure.
+
+Example:
+    results = compute_mix_designs(specs, diagnostics=True)
+    flagged = [i for i, code in enumerate(results["diagnostics"]) if code & HIGH_CEMENT_CONTENT]
+    print(summarize(results["diagnostics"]))
+"""
+from collections import Counter
+
+LOW_CEMENT_CONTENT = 1
+HIGH_CEMENT_CONTENT = 2
+WATER_CEMENT_RATIO = 4
+
+# rule name -> flag, in bit order
+DIAGNOSTICS = {
+    "low_cement_content": LOW_CEMENT_CONTENT,
+    "high_cement_content": HIGH_CEMENT_CONTENT,
+    "water_cement_ratio": WATER_CEMENT_RATIO,
+}
+
+# absolute tolerance on the w/c ratio, which the design meets exactly
+_RATIO_TOLERANCE = 1e-9
+
+
+def diagnose(below_minimum: bool, cement: float, fly_ash: float, water: float,
+             maximum_cement: float | None, maximum_water_cement_ratio: float) -> int:
+    """Check the binder of one design against the cement and w/c rules.
+
+    Args:
+        below_minimum (bool): Whether the cement content calculated from water and w/c ratio is below the exposure minimum.
+        cement (float): Cement content of the design (kg/m^3).
+        fly_ash (float): Fly ash content of the design (kg/m^3).
+        water (float): Free water content of the design (kg/m^3).
+        maximum_cement (float | None): Maximum cement content (kg/m^3); None skips the check.
+        maximum_water_cement_ratio (float): Maximum free w/c ratio of the exposure.
+
+    Returns:
+        int: The violated rules as DIAGNOSTICS flags (0 when the design complies).
+    """
+    code = LOW_CEMENT_CONTENT if below_minimum else 0
+    if maximum_cement is not None and cement > maximum_cement:
+        code |= HIGH_CEMENT_CONTENT
+    if water / (cement + fly_ash) > maximum_water_cement_ratio + _RATIO_TOLERANCE:
+        code |= WATER_CEMENT_RATIO
+    return code
+
+
+def describe(code: int) -> tuple:
+    """Names of the rules flagged in a diagnostics code."""
+    return tuple(name for name, flag in DIAGNOSTICS.items() if code & flag)
+
+
+def summarize(codes) -> dict:
+    """Count the designs violating each rule.
+
+    Args:
+        codes (iterable[int]): Diagnostics codes, e.g. a batch "diagnostics" column.
+
+    Returns:
+        dict: Number of flagged designs keyed by rule name.
+    """
+    counts = dict.fromkeys(DIAGNOSTICS, 0)
+    for code, count in Counter(codes).items():
+        for name in describe(code):
+            counts[name] += count
+    return counts
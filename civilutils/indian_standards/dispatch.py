@@ -0,0 +1,168 @@
+"""Truck-load batch tickets for ready-mix dispatch.
+
+Each pour is split into equal truck loads no larger than the truck capacity.
+Every load is batched from ``ConcreteMixDesign.compute_mix_design_for_volume``
+with the aggregate moisture in force when the pour is dispatched: aggregates
+are weighed wet (SSD mass minus absorbed water plus surface moisture) and the
+added water is the free water after correction. Masses are rounded to the
+resolution of the plant scales, and the rounding residual of each component is
+carried to the next load so that cumulative batched totals never drift more
+than half a scale division from the exact totals.
+"""
+from collections import namedtuple
+import math
+
+from civilutils.indian_standards.results import COMPONENTS
+
+# Scale division of a typical batching plant, in kg.
+DEFAULT_SCALE_RESOLUTION_KG = {
+    "cement": 1.0,
+    "fly_ash": 1.0,
+    "water": 0.5,
+    "admixture": 0.01,
+    "coarse_aggregate": 5.0,
+    "fine_aggregate": 5.0,
+}
+
+# Pour fields updating the design's aggregate moisture before its loads are batched.
+MOISTURE_FIELDS = (
+    "coarse_aggregate_water_absorption",
+    "coarse_aggregate_surface_moisture",
+    "fine_aggregate_water_absorption",
+    "fine_aggregate_surface_moisture",
+)
+
+BatchTicket = namedtuple("BatchTicket", ("pour_id", "load_number", "load_count", "volume_m3", "batch_kg"))
+BatchTicket.__doc__ = """One truck load: the pour, the load's position in it, its volume
+and the rounded batch masses (kg) keyed by results.COMPONENTS."""
+
+
+def split_into_loads(volume_m3: float, truck_capacity_m3: float = 8.0) -> list:
+    """Split a pour into the fewest equal loads that fit the truck.
+
+    Args:
+        volume_m3 (float): Pour volume in m^3.
+        truck_capacity_m3 (float, optional): Drum capacity in m^3. Defaults to 8.0.
+
+    Raises:
+        ValueError: If the volume or the capacity is not greater than zero.
+
+    Returns:
+        list[float]: Load volumes summing to volume_m3.
+    """
+    if volume_m3 <= 0:
+        raise ValueError("volume_m3 must be greater than zero")
+    if truck_capacity_m3 <= 0:
+        raise ValueError("truck_capacity_m3 must be greater than zero")
+    count = max(1, math.ceil(volume_m3 / truck_capacity_m3 - 1e-9))
+    load = volume_m3 / count
+    return [load] * (count - 1) + [volume_m3 - load * (count - 1)]
+
+
+def _batch_masses(result) -> dict:
+    """Wet batch masses of a scaled MixResult for its aggregate moisture state."""
+    coarse = (result.coarse_aggregate.mass_kg
+              - result.adjustment("coarse_absorbed_water") + result.adjustment("coarse_surface_moisture"))
+    fine = (result.fine_aggregate.mass_kg
+            - result.adjustment("fine_absorbed_water") + result.adjustment("fine_surface_moisture"))
+    return {
+        "cement": result.cement.mass_kg,
+        "fly_ash": result.fly_ash.mass_kg,
+        "water": result.free_water_after_correction,
+        "admixture": result.admixture.mass_kg,
+        "coarse_aggregate": coarse,
+        "fine_aggregate": fine,
+    }
+
+
+class BatchTicketer:
+    """Generate truck batch tickets for a stream of pours of one mix design.
+
+    Rounding residuals, batched totals and the ticket count accumulate over
+    every pour passed through the same ticketer.
+
+    Example:
+        ticketer = BatchTicketer(design, truck_capacity_m3=7.0)
+        for ticket in ticketer.tickets(pours):
+            print(ticket.pour_id, ticket.load_number, ticket.batch_kg["cement"])
+    """
+    def __init__(self, design, truck_capacity_m3: float = 8.0, scale_resolution_kg: dict | None = None):
+        """Initialize the ticketer.
+
+        Args:
+            design (ConcreteMixDesign): The mix to batch. Moisture fields of the pours update it in place.
+            truck_capacity_m3 (float, optional): Drum capacity in m^3. Defaults to 8.0.
+            scale_resolution_kg (dict | None, optional): Scale division per component, merged over DEFAULT_SCALE_RESOLUTION_KG. Defaults to None.
+
+        Raises:
+            ValueError: If the capacity or a resolution is not greater than zero, or a component is unknown.
+        """
+        if truck_capacity_m3 <= 0:
+            raise ValueError("truck_capacity_m3 must be greater than zero")
+        resolution = dict(DEFAULT_SCALE_RESOLUTION_KG, **(scale_resolution_kg or {}))
+        unknown = set(resolution) - set(COMPONENTS)
+        if unknown:
+            raise ValueError(f"unknown components: {sorted(unknown)}")
+        if min(resolution.values()) <= 0:
+            raise ValueError("scale resolutions must be greater than zero")
+        self.design = design
+        self.truck_capacity_m3 = float(truck_capacity_m3)
+        self.scale_resolution_kg = resolution
+        self.residuals_kg = dict.fromkeys(COMPONENTS, 0.0)
+        self.exact_kg = dict.fromkeys(COMPONENTS, 0.0)
+        self.batched_kg = dict.fromkeys(COMPONENTS, 0.0)
+        self.tickets_issued = 0
+
+    def _round(self, exact: dict) -> dict:
+        batch = {}
+        for name, mass in exact.items():
+            resolution = self.scale_resolution_kg[name]
+            target = mass + self.residuals_kg[name]
+            rounded = round(round(target / resolution) * resolution, 6)
+            self.residuals_kg[name] = target - rounded
+            self.exact_kg[name] += mass
+            self.batched_kg[name] += rounded
+            batch[name] = rounded
+        return batch
+
+    def tickets(self, pours):
+        """Lazily yield batch tickets for a stream of pours.
+
+        Args:
+            pours (iterable[dict]): Rows with ``volume_m3`` (or ``volume``), an optional ``pour_id``
+                and optional MOISTURE_FIELDS (percent) holding the current aggregate moisture.
+
+        Raises:
+            ValueError: If a pour has no positive volume.
+
+        Yields:
+            BatchTicket: One ticket per truck load, in pour order.
+        """
+        for index, pour in enumerate(pours):
+            volume = pour.get("volume_m3", pour.get("volume"))
+            if volume in (None, ""):
+                raise ValueError(f"pour {index} has no volume_m3")
+            moisture = {name: float(pour[name]) for name in MOISTURE_FIELDS if pour.get(name) not in (None, "")}
+            if moisture:
+                self.design.set_inputs(**moisture)
+            pour_id = pour.get("pour_id", index)
+            loads = split_into_loads(float(volume), self.truck_capacity_m3)
+            for number, load in enumerate(loads, start=1):
+                result = self.design.compute_mix_design_for_volume(load, compact=True)
+                self.tickets_issued += 1
+                yield BatchTicket(pour_id, number, len(loads), load, self._round(_batch_masses(result)))
+
+
+def iter_batch_tickets(design, pours, truck_capacity_m3: float = 8.0, scale_resolution_kg: dict | None = None):
+    """Lazily yield batch tickets for a stream of pours (see BatchTicketer.tickets()).
+
+    Args:
+        design (ConcreteMixDesign): The mix to batch.
+        pours (iterable[dict]): Pour rows, see BatchTicketer.tickets().
+        truck_capacity_m3 (float, optional): Drum capacity in m^3. Defaults to 8.0.
+        scale_resolution_kg (dict | None, optional): Scale division per component. Defaults to None (DEFAULT_SCALE_RESOLUTION_KG).
+
+    Yields:
+        BatchTicket: One ticket per truck load, in pour order.
+    """
+    yield from BatchTicketer(design, truck_capacity_m3, scale_resolution_kg).tickets(pours)
@@ -0,0 +1,137 @@
+"""Opt-in per-stage instrumentation of the mix design calculation.
+
+While a registry is enabled, every ``ConcreteMixDesign.compute_mix_design``
+records the wall time and call count of each stage it runs and of the whole
+computation, and every low cement content warning is counted. Without an
+enabled registry the only cost is one function call per computation.
+
+Example:
+    registry = enable_metrics()
+    ...
+    print(registry.to_prometheus())
+    disable_metrics()
+"""
+import threading
+
+LOW_CEMENT_CONTENT_WARNING = "low_cement_content"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """Thread-safe in-process store of stage timings and counters."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._warnings = {}
+        self._computations = [0, 0.0]
+
+    def record_stage(self, stage: str, seconds: float):
+        """Record one run of a calculation stage."""
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                self._stages[stage] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds > entry[2]:
+                    entry[2] = seconds
+
+    def record_computation(self, seconds: float):
+        """Record one complete compute_mix_design() run."""
+        with self._lock:
+            self._computations[0] += 1
+            self._computations[1] += seconds
+
+    def record_warning(self, name: str):
+        """Count one emitted warning."""
+        with self._lock:
+            self._warnings[name] = self._warnings.get(name, 0) + 1
+
+    def snapshot(self) -> dict:
+        """Return a copy of every metric.
+
+        Returns:
+            dict: ``stages`` (calls, seconds and max_seconds per stage), ``warnings``
+            (count per warning) and ``computations`` (calls and seconds).
+        """
+        with self._lock:
+            return {
+                "stages": {
+                    stage: {"calls": calls, "seconds": seconds, "max_seconds": max_seconds}
+                    for stage, (calls, seconds, max_seconds) in self._stages.items()
+                },
+                "warnings": dict(self._warnings),
+                "computations": {"calls": self._computations[0], "seconds": self._computations[1]},
+            }
+
+    def reset(self):
+        """Clear every metric."""
+        with self._lock:
+            self._stages.clear()
+            self._warnings.clear()
+            self._computations = [0, 0.0]
+
+    def to_prometheus(self, prefix: str = "civilutils") -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): Metric name prefix. Defaults to "civilutils".
+
+        Returns:
+            str: The exposition text, ending with a newline.
+        """
+        snapshot = self.snapshot()
+        stages = snapshot["stages"]
+        families = [
+            ("mix_design_computations_total", "counter", "Completed mix design computations.",
+             [("", snapshot["computations"]["calls"])]),
+            ("mix_design_seconds_total", "counter", "Wall time spent in mix design computations.",
+             [("", snapshot["computations"]["seconds"])]),
+            ("stage_calls_total", "counter", "Runs of each mix design stage.",
+             [(f'{{stage="{_escape(s)}"}}', v["calls"]) for s, v in stages.items()]),
+            ("stage_seconds_total", "counter", "Wall time spent in each mix design stage.",
+             [(f'{{stage="{_escape(s)}"}}', v["seconds"]) for s, v in stages.items()]),
+            ("stage_seconds_max", "gauge", "Longest single run of each mix design stage.",
+             [(f'{{stage="{_escape(s)}"}}', v["max_seconds"]) for s, v in stages.items()]),
+            ("warnings_total", "counter", "Warnings emitted by mix design computations.",
+             [(f'{{warning="{_escape(w)}"}}', n) for w, n in snapshot["warnings"].items()]),
+        ]
+        lines = []
+        for name, kind, help_text, samples in families:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.extend(f"{metric}{labels} {value!r}" for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+_active = None
+
+
+def enable_metrics(registry: MetricsRegistry | None = None) -> MetricsRegistry:
+    """Start recording into a registry.
+
+    Args:
+        registry (MetricsRegistry | None, optional): Registry to record into. Defaults to None (a new registry).
+
+    Returns:
+        MetricsRegistry: The enabled registry.
+    """
+    global _active
+    _active = registry if registry is not None else MetricsRegistry()
+    return _active
+
+
+def disable_metrics():
+    """Stop recording; the previously enabled registry keeps its data."""
+    global _active
+    _active = None
+
+
+def active_registry() -> MetricsRegistry | None:
+    """Return the enabled registry, or None when metrics are disabled."""
+    return _active
@@ -0,0 +1,109 @@
+"""Streaming moisture correction for plant probe feeds.
+
+Only the last stage of ``ConcreteMixDesign.compute_mix_design`` depends on
+the aggregate moisture. A ``MoistureCorrector`` computes the design once and
+then turns each probe reading into corrected batch weights with a handful of
+multiplications, using the same expressions as the design's moisture
+correction stage:
+
+* aggregates are weighed wet: SSD mass minus absorbed water plus surface moisture;
+* the added water is the free water after correction.
+
+Readings are mappings holding any of ``dispatch.MOISTURE_FIELDS`` (percent).
+Fields missing from a reading keep their last value, so probes on different
+bins can report independently. The corrector holds a snapshot of the design;
+create a new one when the mix changes.
+
+Example:
+    corrector = MoistureCorrector(design, batch_volume_m3=3.0)
+    async for weights in corrector.astream(probe_feed):
+        plant.set_targets(weights.fine_aggregate_kg, weights.coarse_aggregate_kg, weights.water_kg)
+"""
+from collections import namedtuple
+
+from civilutils.indian_standards.dispatch import MOISTURE_FIELDS
+
+CorrectedWeights = namedtuple("CorrectedWeights", ("reading", "fine_aggregate_kg", "coarse_aggregate_kg", "water_kg"))
+CorrectedWeights.__doc__ = """Batch weights (kg) for one probe reading: wet fine and coarse
+aggregate and the free water to add, for the corrector's batch volume."""
+
+
+class MoistureCorrector:
+    """Correct the aggregate and water batch weights of one mix for live moisture readings."""
+    def __init__(self, design, batch_volume_m3: float = 1.0):
+        """Compute the design and capture its dry quantities.
+
+        Args:
+            design (ConcreteMixDesign): The mix; its moisture inputs are the starting readings.
+            batch_volume_m3 (float, optional): Volume the weights are given for, in m^3. Defaults to 1.0.
+
+        Raises:
+            ValueError: If batch_volume_m3 is not greater than zero or the design is invalid.
+        """
+        if batch_volume_m3 <= 0:
+            raise ValueError("batch_volume_m3 must be greater than zero")
+        design.compute_mix_design()
+        self.batch_volume_m3 = float(batch_volume_m3)
+        self.coarse_aggregate_kg = design.coarse_aggregate_content
+        self.fine_aggregate_kg = design.fine_aggregate_content
+        self.water_kg = design.maximum_water_content
+        self.moisture = {name: float(getattr(design, name)) for name in MOISTURE_FIELDS}
+        self.readings = 0
+
+    def update(self, reading) -> None:
+        """Apply the moisture fields (percent) present in a reading; other keys are ignored.
+
+        Raises:
+            ValueError: If a moisture value is not a number.
+        """
+        moisture = self.moisture
+        for name in MOISTURE_FIELDS:
+            value = reading.get(name)
+            if value is not None and value != "":
+                try:
+                    moisture[name] = float(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"invalid {name}: {value!r}")
+
+    def correct(self, reading=None) -> CorrectedWeights:
+        """Corrected batch weights for a reading.
+
+        Args:
+            reading (dict | None, optional): Probe reading; None reuses the current moisture. Defaults to None.
+
+        Raises:
+            ValueError: If a moisture value is not a number.
+
+        Returns:
+            CorrectedWeights: The weights, with the reading passed through.
+        """
+        if reading is not None:
+            self.update(reading)
+        self.readings += 1
+        moisture = self.moisture
+        coarse, fine = self.coarse_aggregate_kg, self.fine_aggregate_kg
+        # same expressions as ConcreteMixDesign's moisture correction stage
+        coarse_absorbed = coarse * moisture["coarse_aggregate_water_absorption"] * 0.01
+        fine_absorbed = fine * moisture["fine_aggregate_water_absorption"] * 0.01
+        coarse_surface = coarse * moisture["coarse_aggregate_surface_moisture"] * 0.01
+        fine_surface = fine * moisture["fine_aggregate_surface_moisture"] * 0.01
+        water = self.water_kg + coarse_absorbed + fine_absorbed - coarse_surface - fine_surface
+        volume = self.batch_volume_m3
+        return CorrectedWeights(
+            reading,
+            (fine - fine_absorbed + fine_surface) * volume,
+            (coarse - coarse_absorbed + coarse_surface) * volume,
+            water * volume,
+        )
+
+    def stream(self, readings):
+        """Lazily yield CorrectedWeights for an iterable of readings."""
+        correct = self.correct
+        for reading in readings:
+            yield correct(reading)
+
+    async def astream(self, readings):
+        """Asynchronously yield CorrectedWeights for an async iterable of readings."""
+        correct = self.correct
+        async for reading in readings:
+            yield correct(reading)
@@ -0,0 +1,201 @@
+"""Cost-minimizing inverse mix design.
+
+Instead of evaluating a given design, :func:`optimize_mix_design` searches the
+free design choices (nominal aggregate size, pumpability, admixture types and
+percentages) for the cheapest mix meeting a set of requirements. Candidates
+are enumerated with dominated choices pruned, evaluated in one pass over the
+precomputed design space and ranked by material cost per m^3.
+
+Example:
+    best, alternatives, evaluated, feasible = optimize_mix_design(
+        {"concrete_grade": "M30", "exposure_condition": "Severe",
+         "cement_specific_gravity": 3.15, "fine_aggregate_specific_gravity": 2.6,
+         "coarse_aggregate_specific_gravity": 2.7, "water_specific_gravity": 1.0,
+         "admixture_specific_gravity": 1.145},
+        prices={"cement": 7.5, "fly_ash": 1.8, "admixture": 95.0,
+                "coarse_aggregate": 0.9, "fine_aggregate": 1.1},
+        minimum_slump_mm=100, maximum_cement_content=400)
+"""
+from collections import namedtuple
+from itertools import product
+import heapq
+
+from civilutils.indian_standards.batch import (
+    ENUM_LOOKUPS,
+    RESULT_COLUMNS,
+    normalize_specs,
+    resolve_percentage,
+)
+from civilutils.indian_standards.concrete import (
+    ChemicalAdmixture,
+    MaximumNominalSize,
+    MineralAdmixture,
+    DEFAULT_TABLE_VERSION,
+    get_table_set,
+)
+from civilutils.indian_standards.design_space import design_index, evaluate_entry, get_design_space
+from civilutils.indian_standards.results import COMPONENTS
+
+# Choices searched when they are not fixed in the specs. Percentages are only
+# searched for the admixture whose percentage changes the design.
+DEFAULT_SEARCH_SPACE = {
+    "maximum_nominal_size": tuple(MaximumNominalSize),
+    "is_pumpable": (False, True),
+    "chemical_admixture": (None,) + tuple(ChemicalAdmixture),
+    "chemical_admixture_percentage": (10.0, 15.0, 20.0, 25.0, 30.0),
+    "mineral_admixture": (None,) + tuple(MineralAdmixture),
+    "mineral_admixture_percentage": (15.0, 20.0, 25.0, 30.0, 35.0),
+}
+
+MixCandidate = namedtuple("MixCandidate", ("cost", "spec", "result"))
+MixCandidate.__doc__ = """A feasible design: cost per m^3, the ConcreteMixDesign keyword
+inputs (``spec``) and the result columns keyed by batch.RESULT_COLUMNS."""
+
+OptimizationResult = namedtuple("OptimizationResult", ("best", "alternatives", "evaluated", "feasible"))
+OptimizationResult.__doc__ = """Cheapest candidate (None if nothing is feasible), the next
+cheapest candidates, and the numbers of evaluated and feasible candidates."""
+
+_MASS_INDEX = {name: RESULT_COLUMNS.index(f"{name}_mass_kg") for name in COMPONENTS}
+_CEMENT = _MASS_INDEX["cement"]
+_FLY_ASH = _MASS_INDEX["fly_ash"]
+
+
+def _coerce_choices(name: str, values) -> tuple:
+    lookup = ENUM_LOOKUPS[name]
+    try:
+        return tuple(None if value is None else lookup[value] for value in values)
+    except (KeyError, TypeError):
+        raise ValueError(f"invalid {name} in search space: {values!r}")
+
+
+def _axis(name: str, fixed: dict, search: dict) -> tuple:
+    if name in fixed:
+        return (fixed[name],)
+    return tuple(search[name])
+
+
+def _percentages(admixture, percentage_axis, fixed_percentage, searched_admixture) -> tuple:
+    """Percentages worth evaluating for an admixture (one when it cannot change the design)."""
+    if fixed_percentage is not None:
+        return (resolve_percentage(admixture, fixed_percentage),)
+    if admixture is searched_admixture:
+        return percentage_axis
+    return (resolve_percentage(admixture, None),)
+
+
+def optimize_mix_design(specs: dict, prices: dict, minimum_slump_mm: float | None = None,
+                        maximum_cement_content: float | None = 450.0, search: dict | None = None,
+                        alternatives: int = 4,
+                        table_version: str = DEFAULT_TABLE_VERSION) -> OptimizationResult:
+    """Find the cheapest mix design meeting the requirements.
+
+    ``specs`` fixes the inputs that are not up for choice (grade, exposure,
+    specific gravities, fine aggregate zone, moisture); any searchable input
+    given there (e.g. ``is_pumpable=True``) is fixed as well. The slump is
+    set to minimum_slump_mm, since a higher slump only adds water and cement.
+    A candidate is feasible when its cement content does not exceed
+    maximum_cement_content and its cement plus fly ash reaches the minimum
+    cement content of the exposure condition.
+
+    Args:
+        specs (dict): Scalar inputs keyed by the names in batch.SPEC_COLUMNS.
+        prices (dict): Price per kg keyed by component (see results.COMPONENTS); missing components cost nothing.
+        minimum_slump_mm (float | None, optional): Required slump. Defaults to None (the slump in specs, or 50 mm).
+        maximum_cement_content (float | None, optional): Cement limit in kg/m^3. Defaults to 450.0 (None for no limit).
+        search (dict | None, optional): Overrides of DEFAULT_SEARCH_SPACE axes. Defaults to None.
+        alternatives (int, optional): Number of runner-up candidates to return. Defaults to 4.
+        table_version (str, optional): Edition of the clause tables (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+
+    Raises:
+        ValueError: If specs, prices, the search space or the table version are invalid.
+
+    Returns:
+        OptimizationResult: The cheapest candidate, the runner-ups and candidate counts.
+    """
+    unknown = set(prices) - set(COMPONENTS)
+    if unknown:
+        raise ValueError(f"unknown price components: {sorted(unknown)}")
+    search = dict(DEFAULT_SEARCH_SPACE, **(search or {}))
+    unknown = set(search) - set(DEFAULT_SEARCH_SPACE)
+    if unknown:
+        raise ValueError(f"unknown search axes: {sorted(unknown)}")
+    if alternatives < 0:
+        raise ValueError("alternatives must not be negative")
+
+    fixed = dict(specs)
+    if minimum_slump_mm is not None:
+        fixed["slump_mm"] = float(minimum_slump_mm)
+    _, columns = normalize_specs(fixed)
+    base = {name: column[0] for name, column in columns.items()}
+    fixed = {name: base[name] for name in fixed}
+    for name in ("maximum_nominal_size", "chemical_admixture", "mineral_admixture"):
+        search[name] = _coerce_choices(name, search[name])
+
+    tables = get_table_set(table_version)
+    space = get_design_space(table_version)
+    minimum_cement = tables.get_minimum_cement_content(base["exposure_condition"])
+    cement_limit = float("inf") if maximum_cement_content is None else maximum_cement_content
+    weights = [(_MASS_INDEX[name], float(price)) for name, price in prices.items()]
+
+    chemical_choices = [
+        (chemical, pct)
+        for chemical in _axis("chemical_admixture", fixed, search)
+        for pct in _percentages(chemical, search["chemical_admixture_percentage"],
+                                fixed.get("chemical_admixture_percentage"), ChemicalAdmixture.SUPERPLASTICIZER)
+    ]
+    mineral_choices = [
+        (mineral, pct)
+        for mineral in _axis("mineral_admixture", fixed, search)
+        for pct in _percentages(mineral, search["mineral_admixture_percentage"],
+                                fixed.get("mineral_admixture_percentage"), MineralAdmixture.FLY_ASH)
+    ]
+    continuous = (
+        base["cement_specific_gravity"], base["fine_aggregate_specific_gravity"],
+        base["coarse_aggregate_specific_gravity"], base["water_specific_gravity"],
+        base["admixture_specific_gravity"], base["fly_ash_specific_gravity"],
+        base["coarse_aggregate_water_absorption"], base["coarse_aggregate_surface_moisture"],
+        base["fine_aggregate_water_absorption"], base["fine_aggregate_surface_moisture"],
+        base["site_standard_deviation"], base["slump_adjustment_pct_per_25mm"],
+    )
+
+    evaluated = 0
+    feasible = []
+    for order, (size, pumpable, (chemical, chemical_pct), (mineral, mineral_pct)) in enumerate(product(
+            _axis("maximum_nominal_size", fixed, search), _axis("is_pumpable", fixed, search),
+            chemical_choices, mineral_choices)):
+        entry = space[design_index(base["concrete_grade"], base["exposure_condition"], size,
+                                   base["fine_aggregate_zone"], pumpable, chemical, mineral)]
+        values = evaluate_entry(entry, base["slump_mm"], chemical_pct, mineral_pct, *continuous)
+        evaluated += 1
+        if values[_CEMENT] > cement_limit or values[_CEMENT] + values[_FLY_ASH] < minimum_cement:
+            continue
+        cost = sum(values[index] * price for index, price in weights)
+        feasible.append((cost, order, (size, pumpable, chemical, chemical_pct, mineral, mineral_pct), values))
+
+    ranked = [
+        _candidate(base, cost, choice, values)
+        for cost, _, choice, values in heapq.nsmallest(alternatives + 1, feasible)
+    ]
+    return OptimizationResult(
+        best=ranked[0] if ranked else None,
+        alternatives=tuple(ranked[1:]),
+        evaluated=evaluated,
+        feasible=len(feasible),
+    )
+
+
+def _candidate(base: dict, cost: float, choice: tuple, values: tuple) -> MixCandidate:
+    size, pumpable, chemical, chemical_pct, mineral, mineral_pct = choice
+    spec = {
+        "concrete_grade": base["concrete_grade"],
+        "exposure_condition": base["exposure_condition"],
+        "maximum_nominal_size": size,
+        "fine_aggregate_zone": base["fine_aggregate_zone"],
+        "is_pumpable": pumpable,
+        "chemical_admixture": chemical,
+        "chemical_admixture_percentage": chemical_pct if chemical is not None else None,
+        "mineral_admixture": mineral,
+        "mineral_admixture_percentage": mineral_pct if mineral is not None else None,
+        "slump_mm": base["slump_mm"],
+    }
+    return MixCandidate(cost=cost, spec=spec, result=dict(zip(RESULT_COLUMNS, values)))
@@ -0,0 +1,204 @@
+"""Streaming mix design evaluation for plant order files.
+
+Order rows (dicts of strings, as produced by ``csv.DictReader`` or parsed
+JSON lines) are parsed, grouped into fixed-size chunks, evaluated with the
+batch engine and yielded one result row at a time, so memory stays bounded by
+the chunk size no matter how long the input is.
+"""
+from array import array
+import csv
+import json
+
+from civilutils.indian_standards.batch import (
+    ENUM_LOOKUPS,
+    MANDATORY_COLUMNS,
+    RESULT_COLUMNS,
+    SPEC_COLUMNS,
+    SPECIFIC_GRAVITY_COLUMNS,
+    compute_mix_designs,
+)
+from civilutils.indian_standards.concrete import DEFAULT_TABLE_VERSION
+
+# Short column names accepted in order files.
+FIELD_ALIASES = {
+    "grade": "concrete_grade",
+    "exposure": "exposure_condition",
+    "nominal_size": "maximum_nominal_size",
+    "zone": "fine_aggregate_zone",
+    "pumpable": "is_pumpable",
+    "slump": "slump_mm",
+    "volume": "volume_m3",
+}
+
+# Result columns that scale with the ordered volume (same as compute_mix_design_for_volume).
+SCALED_COLUMNS = tuple(
+    name for name in RESULT_COLUMNS
+    if name.endswith(("_mass_kg", "_volume_m3", "_water", "_moisture", "_correction"))
+)
+
+_BOOLEANS = {
+    "true": True, "yes": True, "y": True, "1": True,
+    "false": False, "no": False, "n": False, "0": False,
+}
+
+
+def _parse_value(name: str, value):
+    if value is None or value == "":
+        return None
+    if name in ENUM_LOOKUPS:
+        try:
+            return ENUM_LOOKUPS[name][value]
+        except (KeyError, TypeError):
+            raise ValueError(f"invalid {name}: {value!r}")
+    if name == "is_pumpable":
+        if isinstance(value, bool):
+            return value
+        try:
+            return _BOOLEANS[str(value).strip().lower()]
+        except KeyError:
+            raise ValueError(f"invalid is_pumpable: {value!r}")
+    return float(value)
+
+
+def parse_order(row: dict, defaults: dict | None = None) -> tuple:
+    """Parse one order row into spec values and the ordered volume.
+
+    Args:
+        row (dict): Order fields; keys are spec column names or FIELD_ALIASES, values strings or numbers.
+        defaults (dict | None, optional): Spec values used when a field is missing or empty. Defaults to None.
+
+    Raises:
+        ValueError: If a value cannot be parsed or the volume is not positive.
+
+    Returns:
+        tuple: A dict of spec values and the volume in m^3 (1.0 when not given).
+    """
+    spec = dict(defaults or {})
+    volume = 1.0
+    for key, value in row.items():
+        name = FIELD_ALIASES.get(key, key)
+        if name == "volume_m3":
+            if value not in (None, ""):
+                volume = float(value)
+            continue
+        if name not in SPEC_COLUMNS:
+            continue
+        parsed = _parse_value(name, value)
+        if parsed is not None:
+            spec[name] = parsed
+    if volume <= 0:
+        raise ValueError("volume_m3 must be greater than zero")
+    return spec, volume
+
+
+def _evaluate_chunk(rows: list, specs: list, volumes: array, table_version: str):
+    columns = {name: [spec.get(name, SPEC_COLUMNS[name]) for spec in specs] for name in SPEC_COLUMNS}
+    results = compute_mix_designs(columns, table_version)
+    for name in SCALED_COLUMNS:
+        column = results[name]
+        for i, volume in enumerate(volumes):
+            column[i] *= volume
+    names = RESULT_COLUMNS
+    for i, (row, volume) in enumerate(zip(rows, volumes)):
+        out = dict(row)
+        out["volume_m3"] = volume
+        for name in names:
+            out[name] = results[name][i]
+        yield out
+
+
+def iter_order_designs(rows, defaults: dict | None = None, chunk_size: int = 4096,
+                       table_version: str = DEFAULT_TABLE_VERSION):
+    """Lazily compute mix quantities for a stream of order rows.
+
+    Each yielded row holds the original order fields, the ordered volume and
+    the batch result columns, with masses, volumes and moisture adjustments
+    scaled to the ordered volume as compute_mix_design_for_volume() does.
+
+    Args:
+        rows (iterable[dict]): Order rows, see parse_order().
+        defaults (dict | None, optional): Spec values for fields missing from a row (e.g. specific gravities). Defaults to None.
+        chunk_size (int, optional): Number of rows evaluated together. Defaults to 4096.
+        table_version (str, optional): Edition of the clause tables (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+
+    Raises:
+        ValueError: If chunk_size is not positive or a row is invalid (the message names the row, counted from 1).
+
+    Yields:
+        dict: One result row per order row, in input order.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+    pending, specs, volumes = [], [], array("d")
+    for number, row in enumerate(rows, start=1):
+        try:
+            spec, volume = parse_order(row, defaults)
+            missing = [name for name in MANDATORY_COLUMNS + SPECIFIC_GRAVITY_COLUMNS if spec.get(name) is None]
+            if missing:
+                raise ValueError(f"missing {', '.join(missing)}")
+        except ValueError as exc:
+            raise ValueError(f"order row {number}: {exc}") from None
+        pending.append(row)
+        specs.append(spec)
+        volumes.append(volume)
+        if len(pending) >= chunk_size:
+            yield from _evaluate_chunk(pending, specs, volumes, table_version)
+            pending, specs, volumes = [], [], array("d")
+    if pending:
+        yield from _evaluate_chunk(pending, specs, volumes, table_version)
+
+
+def read_order_rows(stream, fmt: str = "csv"):
+    """Iterate over the rows of a CSV or JSON-lines order stream.
+
+    Args:
+        stream: Text stream to read from.
+        fmt (str, optional): "csv" or "jsonl". Defaults to "csv".
+
+    Yields:
+        dict: One order row at a time.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "jsonl":
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        raise ValueError(f"unsupported format: {fmt!r}")
+
+
+class OrderResultWriter:
+    """Incremental CSV or JSON-lines writer for result rows.
+
+    Enum members are written as their values. For CSV the header is taken from
+    the first row written.
+    """
+    def __init__(self, stream, fmt: str = "csv"):
+        """Initialize the writer.
+
+        Args:
+            stream: Text stream to write to.
+            fmt (str, optional): "csv" or "jsonl". Defaults to "csv".
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        if fmt not in ("csv", "jsonl"):
+            raise ValueError(f"unsupported format: {fmt!r}")
+        self.stream = stream
+        self.fmt = fmt
+        self.rows_written = 0
+        self._csv_writer = None
+
+    def write(self, row: dict):
+        """Write one result row."""
+        row = {k: getattr(v, "value", v) for k, v in row.items()}
+        if self.fmt == "jsonl":
+            self.stream.write(json.dumps(row) + "\n")
+        else:
+            if self._csv_writer is None:
+                self._csv_writer = csv.DictWriter(self.stream, fieldnames=list(row), extrasaction="ignore")
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(row)
+        self.rows_written += 1
@@ -0,0 +1,256 @@
+"""Compact, array-backed mix design results.
+
+A :class:`MixResult` stores every numeric quantity of a design in a single
+fixed-layout ``array('d')`` (per m^3 of concrete) and exposes it through
+named accessors. Scaling to a volume returns a view that shares the same
+array, so no component data is copied. :meth:`MixResult.to_dict` produces the
+nested dict returned by ``compute_mix_design`` / ``compute_mix_design_for_volume``.
+"""
+from array import array
+
+COMPONENTS = ("cement", "fly_ash", "water", "admixture", "coarse_aggregate", "fine_aggregate")
+
+ADJUSTMENTS = (
+    "coarse_absorbed_water",
+    "fine_absorbed_water",
+    "coarse_surface_moisture",
+    "fine_surface_moisture",
+    "free_water_after_correction",
+)
+
+# Layout of MixResult.values: (mass_kg, volume_m3, specific_gravity) per
+# component, then the aggregate proportions, the adjustments and the summary.
+COARSE_PROPORTION_INDEX = 3 * len(COMPONENTS)
+FINE_PROPORTION_INDEX = COARSE_PROPORTION_INDEX + 1
+ADJUSTMENTS_INDEX = FINE_PROPORTION_INDEX + 1
+TARGET_MEAN_STRENGTH_INDEX = ADJUSTMENTS_INDEX + len(ADJUSTMENTS)
+WATER_CEMENT_RATIO_INDEX = TARGET_MEAN_STRENGTH_INDEX + 1
+LAYOUT_SIZE = WATER_CEMENT_RATIO_INDEX + 1
+
+# 1.0 for quantities that scale with concrete volume, 0.0 otherwise
+EXTENSIVE = array("d", [0.0] * LAYOUT_SIZE)
+for _k in range(len(COMPONENTS)):
+    EXTENSIVE[3 * _k] = EXTENSIVE[3 * _k + 1] = 1.0
+for _k in range(len(ADJUSTMENTS)):
+    EXTENSIVE[ADJUSTMENTS_INDEX + _k] = 1.0
+
+# Columns of MixResult.columns_for_volumes(): the volume, then every
+# quantity that scales with it (named as in batch.RESULT_COLUMNS).
+_VOLUME_COLUMN_INDEX = tuple(
+    [(f"{name}_mass_kg", 3 * k) for k, name in enumerate(COMPONENTS)]
+    + [(f"{name}_volume_m3", 3 * k + 1) for k, name in enumerate(COMPONENTS)]
+    + [(name, ADJUSTMENTS_INDEX + k) for k, name in enumerate(ADJUSTMENTS)]
+)
+VOLUME_COLUMNS = ("volume_m3",) + tuple(name for name, _ in _VOLUME_COLUMN_INDEX)
+
+
+class ComponentQuantity:
+    """Read-only view of one component of a MixResult."""
+    __slots__ = ("name", "_result", "_offset")
+
+    def __init__(self, result: "MixResult", name: str):
+        self.name = name
+        self._result = result
+        self._offset = 3 * COMPONENTS.index(name)
+
+    @property
+    def mass_kg(self) -> float:
+        return self._result.values[self._offset] * self._result.scale
+
+    @property
+    def volume_m3(self) -> float:
+        return self._result.values[self._offset + 1] * self._result.scale
+
+    @property
+    def specific_gravity(self) -> float:
+        return self._result.values[self._offset + 2]
+
+    def __repr__(self):
+        return f"ComponentQuantity({self.name!r}, mass_kg={self.mass_kg:.3f}, volume_m3={self.volume_m3:.4f})"
+
+
+class MixResult:
+    """Mix design result backed by a fixed-layout float array.
+
+    ``values`` always holds the per m^3 design; ``scale`` is the concrete
+    volume the accessors report quantities for.
+    """
+    __slots__ = ("values", "scale", "volume_m3", "admixture_type", "provenance")
+
+    def __init__(self, values: array, admixture_type: str | None, provenance: dict, volume_m3: float | None = None):
+        """Initialize the result.
+
+        Args:
+            values (array): Per m^3 quantities in the module's layout (LAYOUT_SIZE doubles).
+            admixture_type (str | None): Name of the chemical admixture, if any.
+            provenance (dict): Design inputs, as in the "provenance" entry of compute_mix_design().
+            volume_m3 (float | None, optional): Concrete volume of a scaled result. Defaults to None (per m^3 result).
+        """
+        self.values = values
+        self.volume_m3 = volume_m3
+        self.scale = 1.0 if volume_m3 is None else float(volume_m3)
+        self.admixture_type = admixture_type
+        self.provenance = provenance
+
+    @classmethod
+    def from_quantities(cls, masses, volumes, specific_gravities,
+                        coarse_aggregate_proportion: float, fine_aggregate_proportion: float,
+                        adjustments, target_mean_strength: float, water_cement_ratio: float,
+                        admixture_type: str | None, provenance: dict) -> "MixResult":
+        """Build a per m^3 result from per-component sequences (in COMPONENTS order)
+        and adjustment values (in ADJUSTMENTS order)."""
+        values = array("d", bytes(8 * LAYOUT_SIZE))
+        for k, (mass, volume, sg) in enumerate(zip(masses, volumes, specific_gravities)):
+            values[3 * k] = mass
+            values[3 * k + 1] = volume
+            values[3 * k + 2] = sg
+        values[COARSE_PROPORTION_INDEX] = coarse_aggregate_proportion
+        values[FINE_PROPORTION_INDEX] = fine_aggregate_proportion
+        values[ADJUSTMENTS_INDEX:TARGET_MEAN_STRENGTH_INDEX] = array("d", adjustments)
+        values[TARGET_MEAN_STRENGTH_INDEX] = target_mean_strength
+        values[WATER_CEMENT_RATIO_INDEX] = water_cement_ratio
+        return cls(values, admixture_type, provenance)
+
+    def scaled(self, volume_m3: float) -> "MixResult":
+        """Return a view of this design for volume_m3 of concrete, sharing the same array.
+
+        Raises:
+            ValueError: If volume_m3 is not greater than zero.
+        """
+        volume_m3 = float(volume_m3)
+        if volume_m3 <= 0:
+            raise ValueError("volume_m3 must be greater than zero")
+        return MixResult(self.values, self.admixture_type, self.provenance, volume_m3)
+
+    def copy(self) -> "MixResult":
+        """Return a result with its own copy of the value array."""
+        return MixResult(array("d", self.values), self.admixture_type, dict(self.provenance), self.volume_m3)
+
+    def as_array(self) -> array:
+        """Return all quantities for the current volume as a new array (one multiply per value)."""
+        scale = self.scale
+        return array("d", [v * scale if e else v for v, e in zip(self.values, EXTENSIVE)])
+
+    def columns_for_volumes(self, volumes) -> dict:
+        """Scale this design to many concrete volumes at once.
+
+        Args:
+            volumes (iterable[float]): Concrete volumes in m^3 (each greater than zero).
+
+        Raises:
+            ValueError: If a volume is not greater than zero.
+
+        Returns:
+            dict: ``array('d')`` columns keyed by VOLUME_COLUMNS, one row per volume.
+        """
+        volumes = array("d", volumes)
+        if volumes and min(volumes) <= 0:
+            raise ValueError("volume_m3 must be greater than zero")
+        values = self.values
+        columns = {"volume_m3": volumes}
+        for name, index in _VOLUME_COLUMN_INDEX:
+            per_m3 = values[index]
+            columns[name] = array("d", [per_m3 * volume for volume in volumes])
+        return columns
+
+    def component(self, name: str) -> ComponentQuantity:
+        """Return the accessor for a component (one of COMPONENTS)."""
+        if name not in COMPONENTS:
+            raise KeyError(name)
+        return ComponentQuantity(self, name)
+
+    @property
+    def components(self) -> tuple:
+        return tuple(ComponentQuantity(self, name) for name in COMPONENTS)
+
+    @property
+    def cement(self) -> ComponentQuantity:
+        return ComponentQuantity(self, "cement")
+
+    @property
+    def fly_ash(self) -> ComponentQuantity:
+        return ComponentQuantity(self, "fly_ash")
+
+    @property
+    def water(self) -> ComponentQuantity:
+        return ComponentQuantity(self, "water")
+
+    @property
+    def admixture(self) -> ComponentQuantity:
+        return ComponentQuantity(self, "admixture")
+
+    @property
+    def coarse_aggregate(self) -> ComponentQuantity:
+        return ComponentQuantity(self, "coarse_aggregate")
+
+    @property
+    def fine_aggregate(self) -> ComponentQuantity:
+        return ComponentQuantity(self, "fine_aggregate")
+
+    @property
+    def coarse_aggregate_proportion(self) -> float:
+        return self.values[COARSE_PROPORTION_INDEX]
+
+    @property
+    def fine_aggregate_proportion(self) -> float:
+        return self.values[FINE_PROPORTION_INDEX]
+
+    @property
+    def target_mean_strength(self) -> float:
+        return self.values[TARGET_MEAN_STRENGTH_INDEX]
+
+    @property
+    def water_cement_ratio(self) -> float:
+        return self.values[WATER_CEMENT_RATIO_INDEX]
+
+    def adjustment(self, name: str) -> float:
+        """Return an aggregate adjustment (one of ADJUSTMENTS) in kg for the current volume."""
+        return self.values[ADJUSTMENTS_INDEX + ADJUSTMENTS.index(name)] * self.scale
+
+    @property
+    def free_water_after_correction(self) -> float:
+        return self.adjustment("free_water_after_correction")
+
+    def to_dict(self) -> dict:
+        """Return the nested dict layout of compute_mix_design (or of
+        compute_mix_design_for_volume for a scaled result)."""
+        values = self.values
+        scale = self.scale
+        components = {}
+        for k, name in enumerate(COMPONENTS):
+            comp = {
+                "mass_kg": values[3 * k] * scale,
+                "volume_m3": values[3 * k + 1] * scale,
+                "specific_gravity": values[3 * k + 2],
+            }
+            if name == "admixture":
+                comp["type"] = self.admixture_type
+            elif name == "coarse_aggregate":
+                comp["volume_proportion"] = values[COARSE_PROPORTION_INDEX]
+            elif name == "fine_aggregate":
+                comp["volume_proportion"] = values[FINE_PROPORTION_INDEX]
+            components[name] = comp
+
+        if self.volume_m3 is None:
+            mix_key, total = "mix_per_m3", 1.0
+        else:
+            mix_key, total = "mix_for_volume_m3", self.volume_m3
+        return {
+            # kept as in the original result layout
+            "summary": {
+                "target_mean_strength_N_per_mm2": "self.target_mean_compressive_strength",
+                "water_cement_ratio": "self.water_cement_ratio"
+            },
+            mix_key: {
+                "components": components,
+                "total_concrete_volume_m3": total
+            },
+            "aggregate_adjustments_kg": {
+                name: values[ADJUSTMENTS_INDEX + k] * scale for k, name in enumerate(ADJUSTMENTS)
+            },
+            "provenance": dict(self.provenance)
+        }
+
+    def __repr__(self):
+        volume = 1.0 if self.volume_m3 is None else self.volume_m3
+        return f"MixResult(volume_m3={volume}, cement_kg={self.cement.mass_kg:.2f}, water_kg={self.water.mass_kg:.2f})"
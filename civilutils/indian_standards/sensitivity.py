@@ -0,0 +1,165 @@
+"""Analytical sensitivity of mix quantities to the continuous inputs.
+
+``compute_sensitivities`` returns the partial derivative of every result
+column of ``compute_mix_design`` with respect to every continuous input
+(slump, admixture percentages, specific gravities, water absorption and
+surface moisture). The derivatives are propagated in closed form through the
+stages of ``design_space.evaluate_entry`` in a single forward pass; the
+discrete inputs fix the DESIGN_SPACE entry and, like the design parameters
+(e.g. a site standard deviation), contribute no derivatives.
+
+The pipeline rounds the water content to whole kilograms and the component
+volumes to 0.001 m^3. The derivatives describe the unrounded relationship
+(rounding is treated as the identity), which is what a QA engineer asks for
+("kg of water per 1 % surface moisture"); the reported values are the
+rounded ones of compute_mix_design. Below the exposure minimum the cement
+content is clamped to the minimum and its derivatives are zero.
+
+Example:
+    sensitivity = compute_sensitivities(design)
+    sensitivity.jacobian["free_water_after_correction"]["fine_aggregate_surface_moisture"]
+"""
+from collections import namedtuple
+
+from civilutils.indian_standards.batch import RESULT_COLUMNS, design_spec, resolve_design_entry
+from civilutils.indian_standards.design_space import CONTINUOUS_INPUTS, DESIGN_PARAMETERS, evaluate_entry
+
+_N_INPUTS = len(CONTINUOUS_INPUTS)
+_INDEX = {name: i for i, name in enumerate(CONTINUOUS_INPUTS)}
+_ZERO = (0.0,) * _N_INPUTS
+
+# inputs: continuous input values; values: result columns; jacobian: for every
+# result column, the partial derivatives keyed by input name
+Sensitivity = namedtuple("Sensitivity", ("inputs", "values", "jacobian"))
+
+
+def _unit(name: str, scale: float = 1.0) -> tuple:
+    gradient = [0.0] * _N_INPUTS
+    gradient[_INDEX[name]] = scale
+    return tuple(gradient)
+
+
+def _combine(*terms) -> tuple:
+    """Linear combination of gradients given as (coefficient, gradient) pairs."""
+    return tuple(sum(coefficient * gradient[i] for coefficient, gradient in terms) for i in range(_N_INPUTS))
+
+
+def _volume_gradient(mass: float, mass_gradient: tuple, specific_gravity: float, sg_input: str) -> tuple:
+    """Gradient of mass / specific_gravity / 1000."""
+    return _combine((1.0 / (specific_gravity * 1000), mass_gradient),
+                    (1.0, _unit(sg_input, -mass / (specific_gravity * specific_gravity * 1000))))
+
+
+def entry_jacobian(entry, inputs: dict, parameters: dict | None = None) -> dict:
+    """Partial derivatives of evaluate_entry() results with respect to its continuous inputs.
+
+    Args:
+        entry (DesignSpaceEntry): The design's DESIGN_SPACE entry.
+        inputs (dict): Values of the names in CONTINUOUS_INPUTS (admixture percentages resolved).
+        parameters (dict | None, optional): Values of names in DESIGN_PARAMETERS. Defaults to None (the evaluate_entry() defaults).
+
+    Returns:
+        tuple: The evaluate_entry() values and a tuple of derivatives (in CONTINUOUS_INPUTS order),
+        both as dicts keyed by the names in RESULT_COLUMNS.
+    """
+    slump = inputs["slump_mm"]
+    slump_adjustment = (parameters or {}).get("slump_adjustment_pct_per_25mm", 0.03)
+    chemical_pct = inputs["chemical_admixture_percentage"]
+    mineral_pct = inputs["mineral_admixture_percentage"]
+    sg = {name: inputs[f"{name}_specific_gravity"]
+          for name in ("cement", "fine_aggregate", "coarse_aggregate", "water", "admixture", "fly_ash")}
+
+    # water content
+    base = entry.base_water_content
+    if slump is None:
+        water, g_water = base, _ZERO
+    else:
+        water = base * (1.0 + (slump - 50.0) / 25.0 * slump_adjustment)
+        g_water = _unit("slump_mm", base * slump_adjustment / 25.0)
+    if entry.is_superplasticized:
+        g_water = _combine((1 - chemical_pct / 100, g_water), (1.0, _unit("chemical_admixture_percentage", -water / 100)))
+        water *= (1 - chemical_pct / 100)
+    water = round(water)
+
+    # cement and fly ash
+    wcr = entry.water_cement_ratio
+    cement = water / wcr
+    g_cement = _combine((1.0 / wcr, g_water))
+    if entry.has_fly_ash:
+        cementitious, g_cementitious = cement * 1.10, _combine((1.10, g_cement))
+        if mineral_pct > 0:
+            replacement, g_replacement = mineral_pct / 100.0, _unit("mineral_admixture_percentage", 0.01)
+        else:
+            replacement, g_replacement = 0.30, _ZERO
+        g_fly_ash = _combine((replacement, g_cementitious), (cementitious, g_replacement))
+        g_cement = _combine((1.0, g_cementitious), (-1.0, g_fly_ash))
+    elif cement < entry.minimum_cement_content:
+        g_fly_ash = g_cement = _ZERO
+    else:
+        g_fly_ash = _ZERO
+    g_admixture = _combine((0.02, g_cement))
+
+    # the masses and volumes themselves are taken from the (rounded) pipeline
+    values = dict(zip(RESULT_COLUMNS, evaluate_entry(
+        entry, *(inputs[name] for name in CONTINUOUS_INPUTS), **(parameters or {}))))
+    g = dict.fromkeys(RESULT_COLUMNS, _ZERO)
+    g["water_mass_kg"], g["cement_mass_kg"] = g_water, g_cement
+    g["fly_ash_mass_kg"], g["admixture_mass_kg"] = g_fly_ash, g_admixture
+    for component in ("cement", "fly_ash", "water", "admixture"):
+        g[f"{component}_volume_m3"] = _volume_gradient(
+            values[f"{component}_mass_kg"], g[f"{component}_mass_kg"], sg[component], f"{component}_specific_gravity")
+
+    # aggregates share the volume left by the binder, water and admixture
+    g_aggregate_volume = _combine(*((-1.0, g[f"{component}_volume_m3"])
+                                    for component in ("cement", "fly_ash", "water", "admixture")))
+    aggregate_volume = (1 - values["cement_volume_m3"] - values["fly_ash_volume_m3"]
+                        - values["water_volume_m3"] - values["admixture_volume_m3"])
+    for component in ("coarse_aggregate", "fine_aggregate"):
+        proportion = values[f"{component}_volume_proportion"]
+        sg_input = f"{component}_specific_gravity"
+        g[f"{component}_mass_kg"] = _combine(
+            (proportion * sg[component] * 1000, g_aggregate_volume),
+            (1.0, _unit(sg_input, aggregate_volume * proportion * 1000)))
+        g[f"{component}_volume_m3"] = _volume_gradient(
+            values[f"{component}_mass_kg"], g[f"{component}_mass_kg"], sg[component], sg_input)
+
+    # moisture correction
+    for output, component, percentage in (
+            ("coarse_absorbed_water", "coarse_aggregate", "coarse_aggregate_water_absorption"),
+            ("fine_absorbed_water", "fine_aggregate", "fine_aggregate_water_absorption"),
+            ("coarse_surface_moisture", "coarse_aggregate", "coarse_aggregate_surface_moisture"),
+            ("fine_surface_moisture", "fine_aggregate", "fine_aggregate_surface_moisture")):
+        g[output] = _combine((inputs[percentage] * 0.01, g[f"{component}_mass_kg"]),
+                             (1.0, _unit(percentage, values[f"{component}_mass_kg"] * 0.01)))
+    g["free_water_after_correction"] = _combine(
+        (1.0, g["water_mass_kg"]), (1.0, g["coarse_absorbed_water"]), (1.0, g["fine_absorbed_water"]),
+        (-1.0, g["coarse_surface_moisture"]), (-1.0, g["fine_surface_moisture"]))
+    return values, g
+
+
+def compute_sensitivities(design, outputs=RESULT_COLUMNS) -> Sensitivity:
+    """Partial derivatives of the mix design results with respect to the continuous inputs.
+
+    Args:
+        design (ConcreteMixDesign): The design to differentiate.
+        outputs (iterable[str], optional): Result columns to include (names in RESULT_COLUMNS). Defaults to RESULT_COLUMNS.
+
+    Raises:
+        ValueError: If an output name is unknown or the design is missing a specific gravity.
+
+    Returns:
+        Sensitivity: The input values, the result values and the Jacobian, e.g.
+        ``jacobian["water_mass_kg"]["slump_mm"]`` in kg per mm of slump.
+    """
+    outputs = tuple(outputs)
+    unknown = set(outputs) - set(RESULT_COLUMNS)
+    if unknown:
+        raise ValueError(f"unknown outputs: {sorted(unknown)}")
+    resolved, entry = resolve_design_entry(design_spec(design), design.table_version)
+    inputs = {name: resolved[name] for name in CONTINUOUS_INPUTS}
+    values, gradients = entry_jacobian(entry, inputs, {name: resolved[name] for name in DESIGN_PARAMETERS})
+    return Sensitivity(
+        inputs=inputs,
+        values={name: values[name] for name in outputs},
+        jacobian={name: dict(zip(CONTINUOUS_INPUTS, gradients[name])) for name in outputs},
+    )
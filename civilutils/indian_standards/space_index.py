@@ -0,0 +1,185 @@
+"""Reverse lookup of the IS 10262 design space by output ranges.
+
+The water, cement and fly ash contents of a design depend only on its
+discrete inputs, the slump and the admixture percentages; the specific
+gravities and moisture corrections only split the remaining volume between
+the aggregates. A ``DesignSpaceIndex`` evaluates those outputs once for every
+entry of the design space at a reference slump and admixture percentages, and
+keeps one sorted column per output next to the design indexes it came from.
+A range query bisects each queried column (O(log n)), walks the narrowest of
+the matching spans and checks the other conditions on those entries only, so
+its cost grows with the number of candidates instead of the size of the space.
+
+Example:
+    index = DesignSpaceIndex(slump_mm=100)
+    specs = index.query(cement_mass_kg=(340, 380), water_cement_ratio=(None, 0.45),
+                        mineral_admixture=[None, "Fly Ash"])
+    for spec in specs:
+        print(spec["concrete_grade"], spec["exposure_condition"], spec["maximum_nominal_size"])
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import product
+import math
+
+from civilutils.indian_standards.batch import ENUM_LOOKUPS, resolve_percentage
+from civilutils.indian_standards.concrete import DEFAULT_TABLE_VERSION
+from civilutils.indian_standards.design_space import DESIGN_SPACE_AXES, evaluate_binder, get_design_space
+
+# Outputs that can be queried, named as batch.RESULT_COLUMNS.
+INDEXED_COLUMNS = (
+    "target_mean_strength_N_per_mm2",
+    "water_cement_ratio",
+    "cement_mass_kg",
+    "fly_ash_mass_kg",
+    "water_mass_kg",
+    "coarse_aggregate_volume_proportion",
+)
+
+_AXIS_POSITIONS = {name: position for position, (name, _) in enumerate(DESIGN_SPACE_AXES)}
+
+
+def _bounds(name: str, value) -> tuple:
+    low, high = value if isinstance(value, (list, tuple)) else (value, value)
+    if low is not None and high is not None and low > high:
+        raise ValueError(f"empty range for {name}: {value!r}")
+    return low, high
+
+
+def _axis_choices(name: str, value) -> frozenset:
+    values = value if isinstance(value, (list, tuple, set, frozenset)) else (value,)
+    if name == "is_pumpable":
+        return frozenset(bool(v) for v in values)
+    lookup = ENUM_LOOKUPS[name]
+    try:
+        return frozenset(None if v is None else lookup[v] for v in values)
+    except (KeyError, TypeError):
+        raise ValueError(f"invalid {name}: {value!r}")
+
+
+class DesignSpaceIndex:
+    """Sorted per-output columns over every discrete input combination."""
+    def __init__(self, table_version: str = DEFAULT_TABLE_VERSION, slump_mm: float = 50.0,
+                 chemical_admixture_percentage: float | None = None,
+                 mineral_admixture_percentage: float | None = None):
+        """Evaluate and sort the indexed outputs of a design space.
+
+        Args:
+            table_version (str, optional): Edition of the clause tables (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+            slump_mm (float, optional): Slump of every indexed design. Defaults to 50.0.
+            chemical_admixture_percentage (float | None, optional): Dosage of the chemical admixture. Defaults to None (the admixture's default).
+            mineral_admixture_percentage (float | None, optional): Replacement by the mineral admixture. Defaults to None (the admixture's default).
+
+        Raises:
+            ValueError: If the table version is unknown.
+        """
+        space = get_design_space(table_version)
+        self.table_version = table_version
+        self.slump_mm = slump_mm
+        self.combinations = tuple(product(*(values for _, values in DESIGN_SPACE_AXES)))
+        self.percentages = []
+        columns = {name: array("d") for name in INDEXED_COLUMNS}
+        for entry, combination in zip(space, self.combinations):
+            chemical_pct = resolve_percentage(combination[-2], chemical_admixture_percentage)
+            mineral_pct = resolve_percentage(combination[-1], mineral_admixture_percentage)
+            water, _, cement, fly_ash = evaluate_binder(entry, slump_mm, chemical_pct, mineral_pct)
+            self.percentages.append((chemical_pct, mineral_pct))
+            for name, value in zip(INDEXED_COLUMNS, (
+                    entry.target_mean_strength, entry.water_cement_ratio, cement, fly_ash, water,
+                    entry.coarse_aggregate_proportion)):
+                columns[name].append(value)
+        self.columns = columns
+        self._order = {}
+        self._sorted = {}
+        for name, column in columns.items():
+            order = sorted(range(len(column)), key=column.__getitem__)
+            self._order[name] = array("L", order)
+            self._sorted[name] = array("d", (column[i] for i in order))
+
+    def __len__(self) -> int:
+        return len(self.combinations)
+
+    def _span(self, name: str, value) -> tuple:
+        low, high = _bounds(name, value)
+        keys = self._sorted[name]
+        start = 0 if low is None else bisect_left(keys, low)
+        stop = len(keys) if high is None else bisect_right(keys, high)
+        return start, max(start, stop)
+
+    def indices(self, **filters) -> list:
+        """Design indexes (see design_space.design_index) matching every filter.
+
+        Filters on INDEXED_COLUMNS take a value or inclusive (low, high) bounds,
+        either of which may be None. Filters on the discrete axes of the design
+        space take a value or a list of values (members, names or values; None
+        matches designs without that admixture).
+
+        Raises:
+            ValueError: If a filter name or value is invalid.
+
+        Returns:
+            list[int]: Matching design indexes in ascending order.
+        """
+        ranges, choices = {}, {}
+        for name, value in filters.items():
+            if name in self.columns:
+                ranges[name] = self._span(name, value)
+            elif name in _AXIS_POSITIONS:
+                choices[_AXIS_POSITIONS[name]] = _axis_choices(name, value)
+            else:
+                raise ValueError(f"cannot filter on {name!r}")
+        if ranges:
+            driver = min(ranges, key=lambda name: ranges[name][1] - ranges[name][0])
+            start, stop = ranges.pop(driver)
+            candidates = self._order[driver][start:stop]
+        else:
+            candidates = range(len(self.combinations))
+        matches = list(candidates)
+        for name in ranges:
+            column = self.columns[name]
+            low, high = _bounds(name, filters[name])
+            low = -math.inf if low is None else low
+            high = math.inf if high is None else high
+            matches = [i for i in matches if low <= column[i] <= high]
+        combinations = self.combinations
+        for position, allowed in choices.items():
+            matches = [i for i in matches if combinations[i][position] in allowed]
+        matches.sort()
+        return matches
+
+    def count(self, **filters) -> int:
+        """Number of design indexes matching the filters of indices()."""
+        if len(filters) == 1:
+            name, value = next(iter(filters.items()))
+            if name in self.columns:
+                start, stop = self._span(name, value)
+                return stop - start
+        return len(self.indices(**filters))
+
+    def spec(self, index: int) -> dict:
+        """Inputs of an indexed design, keyed by the names in batch.SPEC_COLUMNS.
+
+        Specific gravities and moisture corrections are not part of the
+        index; add them to compute the design.
+        """
+        spec = dict(zip((name for name, _ in DESIGN_SPACE_AXES), self.combinations[index]))
+        chemical_pct, mineral_pct = self.percentages[index]
+        spec["chemical_admixture_percentage"] = chemical_pct if spec["chemical_admixture"] is not None else None
+        spec["mineral_admixture_percentage"] = mineral_pct if spec["mineral_admixture"] is not None else None
+        spec["slump_mm"] = self.slump_mm
+        return spec
+
+    def values(self, index: int) -> dict:
+        """Indexed outputs of a design, keyed by the names in INDEXED_COLUMNS."""
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def query(self, **filters) -> list:
+        """Input specs of the designs matching the filters of indices().
+
+        Raises:
+            ValueError: If a filter name or value is invalid.
+
+        Returns:
+            list[dict]: One spec (see spec()) per matching design, in design index order.
+        """
+        return [self.spec(i) for i in self.indices(**filters)]
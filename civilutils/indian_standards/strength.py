@@ -0,0 +1,186 @@
+"""Site standard deviation of concrete strength from cube test results.
+
+IS 10262 bases the target mean strength on the standard deviation
+established at the site from at least 30 cube results of a grade, and on the
+assumed values of the clause tables only until such results exist. A
+``StandardDeviationEstimator`` ingests streams of cube results and keeps a
+running mean and sum of squared deviations (Welford's method) per plant and
+grade, so every result costs O(1) time and memory no matter how long the
+history is. With a window, only the latest results of each plant and grade
+are kept: the oldest one leaves the statistics as a new one arrives.
+
+Example:
+    estimator = StandardDeviationEstimator(window=100)
+    estimator.ingest(lab_feed)                 # CubeResult(plant, grade, strength) records
+    estimator.apply(design, plant="North")     # site value once 30 results exist, else the table value
+    design.compute_mix_design()
+"""
+from collections import deque, namedtuple
+import math
+
+from civilutils.indian_standards.batch import ENUM_LOOKUPS
+
+# IS 10262: results needed before a site standard deviation replaces the assumed one
+MINIMUM_RESULTS = 30
+
+CubeResult = namedtuple("CubeResult", ("plant", "concrete_grade", "strength"))
+CubeResult.__doc__ = """One cube test: the plant, the ConcreteGrade (or its name/value)
+and the compressive strength in N/mm^2."""
+
+
+def _grade(value):
+    try:
+        return ENUM_LOOKUPS["concrete_grade"][value]
+    except (KeyError, TypeError):
+        raise ValueError(f"invalid concrete_grade: {value!r}")
+
+
+class RunningStatistics:
+    """Count, mean and sample standard deviation of a stream, updated in O(1)."""
+    __slots__ = ("count", "mean", "_squares")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._squares = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._squares += delta * (value - self.mean)
+
+    def remove(self, value: float):
+        """Take back a value previously added."""
+        if self.count <= 1:
+            self.count, self.mean, self._squares = 0, 0.0, 0.0
+            return
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self._squares = max(self._squares - delta * (value - self.mean), 0.0)
+
+    @property
+    def standard_deviation(self) -> float | None:
+        """Sample standard deviation (n - 1 denominator); None for fewer than two values."""
+        if self.count < 2:
+            return None
+        return math.sqrt(self._squares / (self.count - 1))
+
+
+class StandardDeviationEstimator:
+    """Running standard deviation of cube strengths per plant and grade."""
+    def __init__(self, window: int | None = None, minimum_results: int = MINIMUM_RESULTS):
+        """Create an empty estimator.
+
+        Args:
+            window (int | None, optional): Number of latest results kept per plant and grade. Defaults to None (the whole history).
+            minimum_results (int, optional): Results needed before an estimate is reported. Defaults to MINIMUM_RESULTS.
+
+        Raises:
+            ValueError: If window or minimum_results is invalid.
+        """
+        if minimum_results < 2:
+            raise ValueError("minimum_results must be at least 2")
+        if window is not None and window < minimum_results:
+            raise ValueError("window must not be smaller than minimum_results")
+        self.window = window
+        self.minimum_results = minimum_results
+        self.statistics = {}
+        self._windows = {}
+        self.results = 0
+
+    def add(self, plant, concrete_grade, strength: float):
+        """Record one cube result.
+
+        Args:
+            plant: Plant identifier (any hashable value).
+            concrete_grade (ConcreteGrade | str): Grade of the cube.
+            strength (float): Compressive strength in N/mm^2.
+
+        Raises:
+            ValueError: If the grade or the strength is invalid.
+        """
+        try:
+            strength = float(strength)
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid strength: {strength!r}")
+        if not strength > 0 or math.isinf(strength):
+            raise ValueError(f"invalid strength: {strength!r}")
+        key = (plant, _grade(concrete_grade))
+        statistics = self.statistics.get(key)
+        if statistics is None:
+            statistics = self.statistics[key] = RunningStatistics()
+            if self.window is not None:
+                self._windows[key] = deque()
+        statistics.add(strength)
+        if self.window is not None:
+            latest = self._windows[key]
+            latest.append(strength)
+            if len(latest) > self.window:
+                statistics.remove(latest.popleft())
+        self.results += 1
+
+    def ingest(self, results) -> int:
+        """Record an iterable of CubeResult records or (plant, grade, strength) triples.
+
+        Raises:
+            ValueError: If a result is invalid.
+
+        Returns:
+            int: Number of results recorded.
+        """
+        add = self.add
+        count = 0
+        for plant, concrete_grade, strength in results:
+            add(plant, concrete_grade, strength)
+            count += 1
+        return count
+
+    async def aingest(self, results) -> int:
+        """Record an async iterable of results (see ingest())."""
+        add = self.add
+        count = 0
+        async for plant, concrete_grade, strength in results:
+            add(plant, concrete_grade, strength)
+            count += 1
+        return count
+
+    def count(self, plant, concrete_grade) -> int:
+        """Number of results currently held for a plant and grade."""
+        statistics = self.statistics.get((plant, _grade(concrete_grade)))
+        return 0 if statistics is None else statistics.count
+
+    def standard_deviation(self, plant, concrete_grade) -> float | None:
+        """Site standard deviation (N/mm^2) of a plant and grade.
+
+        Raises:
+            ValueError: If the grade is invalid.
+
+        Returns:
+            float | None: The estimate, or None while fewer than minimum_results results are held.
+        """
+        statistics = self.statistics.get((plant, _grade(concrete_grade)))
+        if statistics is None or statistics.count < self.minimum_results:
+            return None
+        return statistics.standard_deviation
+
+    def apply(self, design, plant) -> float | None:
+        """Use the current estimate for a design's grade as its site standard deviation.
+
+        Without an estimate, or when the results show no spread (an estimate
+        of 0), the design falls back to the assumed value of its clause
+        tables. Only the target mean strength stage is invalidated.
+
+        Args:
+            design (ConcreteMixDesign): The design to update.
+            plant: Plant whose results apply.
+
+        Returns:
+            float | None: The standard deviation set on the design.
+        """
+        value = self.standard_deviation(plant, design.concrete_grade)
+        if value is not None and value <= 0:
+            value = None
+        design.set_inputs(site_standard_deviation=value)
+        return value
@@ -0,0 +1,197 @@
+"""Parallel parameter sweeps over the IS 10262 design space.
+
+Inputs are packed into a column-major float64 block in
+``multiprocessing.shared_memory`` (one design-space index plus the continuous
+inputs and design parameters per row). Worker processes read their chunk of rows from that block and
+write results into a second shared block, so nothing but a few integers and
+buffer names is pickled per chunk. Every row has a fixed slot in the output,
+so results come back in input order regardless of which worker finishes first.
+"""
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing import shared_memory
+import math
+import os
+import warnings
+
+from civilutils.indian_standards.batch import (
+    RESULT_COLUMNS,
+    normalize_specs,
+    resolve_percentage,
+)
+from civilutils.indian_standards.concrete import DEFAULT_TABLE_VERSION, get_table_set
+from civilutils.indian_standards.design_space import design_index, evaluate_entry, get_design_space
+
+# Packed input fields, in the positional order expected by evaluate_entry().
+PACKED_INPUT_FIELDS = (
+    "design_index",
+    "slump_mm",
+    "chemical_admixture_percentage",
+    "mineral_admixture_percentage",
+    "cement_specific_gravity",
+    "fine_aggregate_specific_gravity",
+    "coarse_aggregate_specific_gravity",
+    "water_specific_gravity",
+    "admixture_specific_gravity",
+    "fly_ash_specific_gravity",
+    "coarse_aggregate_water_absorption",
+    "coarse_aggregate_surface_moisture",
+    "fine_aggregate_water_absorption",
+    "fine_aggregate_surface_moisture",
+    "site_standard_deviation",
+    "slump_adjustment_pct_per_25mm",
+)
+
+# fields whose None value is packed as NaN: slump_mm=None (no slump
+# adjustment) and site_standard_deviation=None (the table value)
+_NULLABLE_FIELDS = ("slump_mm", "site_standard_deviation")
+
+
+def sweep_grid(**axes) -> dict:
+    """Expand axes of values into the spec columns of their cartesian product.
+
+    Example:
+        sweep_grid(concrete_grade=list(ConcreteGrade), slump_mm=[50, 75, 100],
+                   cement_specific_gravity=3.15, ...)
+
+    Args:
+        **axes: Spec column names mapped to a list of values (swept) or a scalar (kept constant).
+
+    Returns:
+        dict: Spec columns suitable for compute_mix_designs() or run_sweep().
+    """
+    swept = {k: v for k, v in axes.items() if isinstance(v, (list, tuple))}
+    constant = {k: v for k, v in axes.items() if k not in swept}
+    specs = {name: [] for name in swept}
+    for combination in product(*swept.values()):
+        for column, value in zip(specs.values(), combination):
+            column.append(value)
+    specs.update(constant)
+    return specs
+
+
+def pack_specs(specs: dict) -> tuple:
+    """Pack spec columns into column-major float64 input columns.
+
+    Args:
+        specs (dict): Input columns keyed by the names in batch.SPEC_COLUMNS.
+
+    Returns:
+        tuple: The number of rows and one ``array('d')`` per PACKED_INPUT_FIELDS entry.
+    """
+    n_rows, columns = normalize_specs(specs)
+    packed = {name: array("d") for name in PACKED_INPUT_FIELDS}
+    packed["design_index"].extend(
+        design_index(*key) for key in zip(
+            columns["concrete_grade"], columns["exposure_condition"],
+            columns["maximum_nominal_size"], columns["fine_aggregate_zone"],
+            columns["is_pumpable"], columns["chemical_admixture"],
+            columns["mineral_admixture"]))
+    for name in _NULLABLE_FIELDS:
+        packed[name].extend(math.nan if v is None else v for v in columns[name])
+    packed["chemical_admixture_percentage"].extend(
+        map(resolve_percentage, columns["chemical_admixture"], columns["chemical_admixture_percentage"]))
+    packed["mineral_admixture_percentage"].extend(
+        map(resolve_percentage, columns["mineral_admixture"], columns["mineral_admixture_percentage"]))
+    for name in PACKED_INPUT_FIELDS[4:]:
+        if name not in _NULLABLE_FIELDS:
+            packed[name].extend(columns[name])
+    return n_rows, tuple(packed[name] for name in PACKED_INPUT_FIELDS)
+
+
+def _evaluate_chunk(input_name: str, output_name: str, n_rows: int, start: int, stop: int,
+                    table_version: str = DEFAULT_TABLE_VERSION) -> int:
+    """Evaluate rows [start, stop) of the shared input block into the shared output block."""
+    shm_in = shared_memory.SharedMemory(name=input_name)
+    shm_out = shared_memory.SharedMemory(name=output_name)
+    inputs = shm_in.buf.cast("d")
+    outputs = shm_out.buf.cast("d")
+    try:
+        fields = [inputs[f * n_rows + start:f * n_rows + stop].tolist() for f in range(len(PACKED_INPUT_FIELDS))]
+        results = [array("d") for _ in RESULT_COLUMNS]
+        space = get_design_space(table_version)
+        low_cement_rows = 0
+        for index, slump, *rest, site_sd, slump_adjustment in zip(*fields):
+            values = evaluate_entry(space[int(index)], None if slump != slump else slump, *rest,
+                                    None if site_sd != site_sd else site_sd, slump_adjustment)
+            for column, value in zip(results, values):
+                column.append(value)
+            low_cement_rows += values[-1]
+        for c, column in enumerate(results):
+            outputs[c * n_rows + start:c * n_rows + stop] = column
+        return low_cement_rows
+    finally:
+        inputs.release()
+        outputs.release()
+        shm_in.close()
+        shm_out.close()
+
+
+def run_sweep(specs: dict, max_workers: int | None = None, chunk_size: int | None = None,
+              executor: ProcessPoolExecutor | None = None,
+              table_version: str = DEFAULT_TABLE_VERSION) -> dict:
+    """Evaluate spec columns in parallel over a process pool.
+
+    Results are identical to compute_mix_designs(specs, table_version) and are
+    returned in input order.
+
+    Args:
+        specs (dict): Input columns keyed by the names in batch.SPEC_COLUMNS (see sweep_grid()).
+        max_workers (int | None, optional): Number of worker processes. Defaults to os.cpu_count().
+        chunk_size (int | None, optional): Rows per task. Defaults to about four chunks per worker.
+        executor (ProcessPoolExecutor | None, optional): Existing pool to reuse. Defaults to None (a pool is created and shut down).
+        table_version (str, optional): Edition of the clause tables (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+
+    Returns:
+        dict: ``array('d')`` result columns keyed by the names in batch.RESULT_COLUMNS.
+    """
+    get_table_set(table_version)
+    n_rows, packed = pack_specs(specs)
+    workers = max_workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(n_rows / (workers * 4)))
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+
+    results = {name: array("d") for name in RESULT_COLUMNS}
+    if n_rows == 0:
+        return results
+
+    column_bytes = 8 * n_rows
+    own_executor = executor is None
+    blocks = []  # every block created so far is closed and unlinked, even if a later one fails
+    try:
+        shm_in = shared_memory.SharedMemory(create=True, size=column_bytes * len(PACKED_INPUT_FIELDS))
+        blocks.append(shm_in)
+        shm_out = shared_memory.SharedMemory(create=True, size=column_bytes * len(RESULT_COLUMNS))
+        blocks.append(shm_out)
+        for f, column in enumerate(packed):
+            shm_in.buf[f * column_bytes:(f + 1) * column_bytes] = column.tobytes()
+
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                executor.submit(_evaluate_chunk, shm_in.name, shm_out.name, n_rows, start,
+                                min(start + chunk_size, n_rows), table_version)
+                for start in range(0, n_rows, chunk_size)
+            ]
+            low_cement_rows = sum(future.result() for future in futures)
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+        for c, name in enumerate(RESULT_COLUMNS):
+            results[name].frombytes(shm_out.buf[c * column_bytes:(c + 1) * column_bytes])
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    if low_cement_rows:
+        warnings.warn(
+            f"Calculated cement content is less than minimum required for exposure condition in {low_cement_rows} of {n_rows} designs",
+            UserWarning
+        )
+    return results
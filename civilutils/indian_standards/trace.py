@@ -0,0 +1,236 @@
+"""Structured calculation trace for concrete mix design.
+
+Each stage of ``ConcreteMixDesign.compute_mix_design`` emits a
+:class:`TraceEvent` carrying the stage name and its named intermediate values
+to the design's ``trace_sink``. A sink is any callable taking one event;
+:class:`TraceCollector`, :class:`LoggingSink` and :class:`ConsoleRenderer`
+cover the common cases. When no sink is attached and display is off, no event
+is built at all.
+
+``display_result=True`` simply attaches :class:`ConsoleRenderer`, which
+renders events as the familiar console summary.
+"""
+from collections import namedtuple
+import logging
+
+TraceEvent = namedtuple("TraceEvent", ("stage", "values"))
+
+RULE = "-" * 60
+DOUBLE_RULE = "=" * 60
+
+
+class TraceCollector:
+    """Sink collecting events in a list."""
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event: TraceEvent):
+        self.events.append(event)
+
+    def stage(self, name: str) -> dict | None:
+        """Return the values of the last event of a stage, or None if it was not emitted."""
+        for event in reversed(self.events):
+            if event.stage == name:
+                return event.values
+        return None
+
+    def clear(self):
+        """Remove every collected event."""
+        self.events.clear()
+
+
+class LoggingSink:
+    """Sink writing one log record per event."""
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.DEBUG):
+        """Initialize the sink.
+
+        Args:
+            logger (logging.Logger | None, optional): Target logger. Defaults to the "civilutils.trace" logger.
+            level (int, optional): Log level of the records. Defaults to logging.DEBUG.
+        """
+        self.logger = logger or logging.getLogger("civilutils.trace")
+        self.level = level
+
+    def __call__(self, event: TraceEvent):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s %s", event.stage, event.values)
+
+
+def _render_calculation_started(v):
+    return ["\n" + DOUBLE_RULE, "Concrete Mix Design - Calculation Summary", DOUBLE_RULE]
+
+
+def _render_target_mean_strength(v):
+    return [
+        "\n" + RULE,
+        "Target Mean Compressive Strength",
+        RULE,
+        f"Concrete grade (f_ck) : {v['concrete_grade']} => {v['characteristic_strength']} N/mm^2",
+        f"Standard deviation    : {v['standard_deviation']:.2f} N/mm^2",
+        f"Target mean strength  : {v['target_mean_strength']:.2f} N/mm^2",
+        RULE,
+    ]
+
+
+def _render_water_cement_ratio(v):
+    return [
+        "\n" + RULE,
+        "Water / Cement Ratio (IS456 Table 5)",
+        RULE,
+        f"Exposure condition : {v['exposure_condition']}",
+        f"Reinforced member  : {'Yes' if v['reinforced'] else 'No'}",
+        f"Calculated W/C     : {v['water_cement_ratio']:.3f}",
+        RULE,
+    ]
+
+
+def _render_water_content(v):
+    lines = [
+        "\n" + RULE,
+        "Water Content Determination",
+        RULE,
+        f"Maximum nominal aggregate size : {v['maximum_nominal_size_mm']} mm",
+        f"Base water content (50 mm slump): {v['base_water_content']:.2f} litres",
+    ]
+    if v["slump_mm"] is not None:
+        lines += [
+            f"Slump provided                 : {v['slump_mm']:.1f} mm",
+            f"Adjustment per 25 mm           : {v['slump_adjustment_pct_per_25mm'] * 100.0:.1f}%",
+            f"Adjusted water content         : {v['water_content']:.2f} litres",
+        ]
+    if v["superplasticizer"]:
+        lines.append(f"Superplasticizer used: water reduced by {v['chemical_admixture_percentage']}%")
+    lines.append(RULE)
+    return lines
+
+
+def _render_cement_content(v):
+    return [
+        "\n" + RULE,
+        "Cement Content Calculation",
+        RULE,
+        f"Computed cement (water / w/c) : {v['computed_cement_content']:.2f} kg/m^3",
+        f"Minimum cement for exposure   : {v['minimum_cement_content']:.2f} kg/m^3",
+        f"Final cement content selected : {v['cement_content']:.2f} kg/m^3",
+        RULE,
+    ]
+
+
+def _render_cement_with_fly_ash(v):
+    return [
+        "\n" + RULE,
+        "Cement + Fly Ash (Mineral Admixture) Calculation",
+        RULE,
+        f"Computed cement (water / w/c)            : {v['computed_cement_content']:.2f} kg/m^3",
+        f"Minimum cement for exposure              : {v['minimum_cement_content']:.2f} kg/m^3",
+        f"Initial cement selected (base)           : {v['initial_cement_content']:.2f} kg/m^3",
+        f"Cementitious material (cement + others)  : {v['cementitious_material_content']:.2f} kg/m^3",
+        f"Fly ash replacement (mass)               : {v['fly_ash_content']:.2f} kg/m^3 ({v['replacement_fraction']*100:.1f}%)",
+        f"Final cement content after replacement   : {v['cement_content']:.2f} kg/m^3",
+        f"Cement savings                            : {v['cement_savings']:.2f} kg/m^3",
+        f"Adjusted water/cement ratio (effective)  : {v['effective_water_cement_ratio']:.3f}",
+        RULE,
+    ]
+
+
+def _render_aggregate_proportions(v):
+    lines = [
+        "\n" + RULE,
+        "Aggregate Proportions (by volume)",
+        RULE,
+        f"Fine aggregate zone            : {v['fine_aggregate_zone']}",
+        f"Nominal max size (mm)         : {v['maximum_nominal_size_mm']}",
+        f"Base coarse proportion (table) : {v['base_coarse_aggregate_proportion']:.3f}",
+        f"W/C ratio                      : {v['water_cement_ratio']:.3f}",
+        f"Adjusted coarse proportion     : {v['coarse_aggregate_proportion']:.3f}",
+    ]
+    if v["is_pumpable"]:
+        lines.append("Pumpable mix adjustment applied: coarse proportion reduced by 10%")
+    lines += [f"Fine aggregate proportion      : {v['fine_aggregate_proportion']:.3f}", RULE]
+    return lines
+
+
+def _render_mix_quantities(v):
+    return [
+        "\n" + RULE,
+        "Final Mix Quantities (per m^3 of concrete)",
+        RULE,
+        f"{'Component':<20} | {'Mass (kg/m^3)':>15} | {'Volume (m^3)':>12}",
+        RULE,
+        f"{'Cement':<20} | {v['cement_mass_kg']:15.2f} | {v['cement_volume_m3']:12.4f}",
+        f"{'Fly Ash':<20} | {v['fly_ash_mass_kg']:15.2f} | {v['fly_ash_volume_m3']:12.4f}",
+        f"{'Water':<20} | {v['water_mass_kg']:15.2f} | {v['water_volume_m3']:12.4f}",
+        f"{'Admixture':<20} | {v['admixture_mass_kg']:15.2f} | {v['admixture_volume_m3']:12.4f}",
+        f"{'Coarse aggregate':<20} | {v['coarse_aggregate_mass_kg']:15.2f} | {v['coarse_aggregate_volume_m3']:12.4f}",
+        f"{'Fine aggregate':<20} | {v['fine_aggregate_mass_kg']:15.2f} | {v['fine_aggregate_volume_m3']:12.4f}",
+        RULE,
+        f"After absorption and surface moisture adjustments, free water available: "
+        f"{v['free_water_after_correction']:.2f} kg "
+        f"({v['free_water_volume_m3']:.4f} m^3)",
+        f"Coarse aggregate absorbed water : {v['coarse_absorbed_water']:.2f} kg",
+        f"Fine   aggregate absorbed water : {v['fine_absorbed_water']:.2f} kg",
+        f"Coarse aggregate surface moisture: {v['coarse_surface_moisture']:.2f} kg",
+        f"Fine   aggregate surface moisture: {v['fine_surface_moisture']:.2f} kg",
+        RULE,
+    ]
+
+
+def _render_volume_quantities(v):
+    scale = v["volume_m3"]
+    lines = [
+        "\n" + DOUBLE_RULE,
+        f"Concrete Mix Design - Quantities for {scale:.3f} m^3",
+        DOUBLE_RULE,
+        "\n" + RULE,
+        "Final Mix Quantities",
+        RULE,
+        f"{'Component':<20} | {'Mass (kg)':>15} | {'Volume (m^3)':>12}",
+        RULE,
+    ]
+    for name, mass, volume in v["components"]:
+        lines.append(f"{name.replace('_', ' ').title():<20} | {mass:15.2f} | {volume:12.4f}")
+    lines += [
+        RULE,
+        f"After absorption and surface moisture adjustments, free water available: "
+        f"{v['free_water_after_correction']:.2f} kg ({v['free_water_volume_m3']:.4f} m^3) for {scale:.3f} m^3",
+        f"Coarse aggregate absorbed water : {v['coarse_absorbed_water']:.2f} kg",
+        f"Fine   aggregate absorbed water : {v['fine_absorbed_water']:.2f} kg",
+        f"Coarse aggregate surface moisture: {v['coarse_surface_moisture']:.2f} kg",
+        f"Fine   aggregate surface moisture: {v['fine_surface_moisture']:.2f} kg",
+        RULE,
+    ]
+    return lines
+
+
+RENDERERS = {
+    "calculation_started": _render_calculation_started,
+    "target_mean_strength": _render_target_mean_strength,
+    "water_cement_ratio": _render_water_cement_ratio,
+    "water_content": _render_water_content,
+    "cement_content": _render_cement_content,
+    "cement_with_fly_ash": _render_cement_with_fly_ash,
+    "aggregate_proportions": _render_aggregate_proportions,
+    "mix_quantities": _render_mix_quantities,
+    "volume_quantities": _render_volume_quantities,
+}
+
+
+def render_text(event: TraceEvent) -> str:
+    """Render an event as the console summary text (empty for unknown stages)."""
+    renderer = RENDERERS.get(event.stage)
+    return "\n".join(renderer(event.values)) if renderer else ""
+
+
+class ConsoleRenderer:
+    """Sink printing events as the console calculation summary."""
+    def __init__(self, file=None):
+        """Initialize the renderer.
+
+        Args:
+            file (optional): Stream to print to. Defaults to None (sys.stdout at print time).
+        """
+        self.file = file
+
+    def __call__(self, event: TraceEvent):
+        if event.stage in RENDERERS:
+            print(render_text(event), file=self.file)
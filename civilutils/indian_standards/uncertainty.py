@@ -0,0 +1,260 @@
+"""Monte Carlo uncertainty analysis of mix design quantities.
+
+Specific gravities, water absorption and surface moisture vary from lot to
+lot. ``monte_carlo`` draws samples of such continuous inputs from the given
+distributions and evaluates them chunk by chunk on the design's precomputed
+DESIGN_SPACE entry (the discrete inputs do not vary, so the table lookups are
+done once). Design parameters such as a site standard deviation keep the
+design's values. Only streaming statistics are kept, so the memory used does
+not grow with the number of samples.
+
+Example:
+    result = monte_carlo(design, {
+        "fine_aggregate_surface_moisture": Normal(2.0, 0.5, low=0.0),
+        "fine_aggregate_specific_gravity": Uniform(2.55, 2.65),
+    }, samples=1_000_000, seed=42)
+    result.outputs["free_water_after_correction"].percentiles[95.0]
+"""
+import math
+import random
+from array import array
+from collections import Counter, namedtuple
+from itertools import repeat
+
+from civilutils.indian_standards.batch import RESULT_COLUMNS, design_spec, resolve_design_entry
+from civilutils.indian_standards.design_space import CONTINUOUS_INPUTS, DESIGN_PARAMETERS, evaluate_entry
+
+DEFAULT_OUTPUTS = (
+    "cement_mass_kg",
+    "water_mass_kg",
+    "coarse_aggregate_mass_kg",
+    "fine_aggregate_mass_kg",
+    "free_water_after_correction",
+)
+
+DEFAULT_PERCENTILES = (5.0, 50.0, 95.0)
+
+# fine histogram bins per reported bin; percentiles are accurate to one fine bin
+FINE_BINS_PER_BIN = 64
+
+
+def _clip(values: array, low, high) -> array:
+    if low is not None or high is not None:
+        low = -math.inf if low is None else low
+        high = math.inf if high is None else high
+        return array("d", [low if v < low else high if v > high else v for v in values])
+    return values
+
+
+def _check_bounds(low, high):
+    if low is not None and high is not None and low > high:
+        raise ValueError("low must not exceed high")
+
+
+class Normal(namedtuple("Normal", ("mean", "std", "low", "high"), defaults=(None, None))):
+    """Normal distribution, optionally clipped to [low, high]."""
+    def validate(self):
+        if self.std < 0:
+            raise ValueError("std must not be negative")
+        _check_bounds(self.low, self.high)
+
+    def sample(self, rng: random.Random, n: int) -> array:
+        gauss, mean, std = rng.gauss, self.mean, self.std
+        return _clip(array("d", [gauss(mean, std) for _ in range(n)]), self.low, self.high)
+
+
+class Uniform(namedtuple("Uniform", ("low", "high"))):
+    """Uniform distribution over [low, high]."""
+    def validate(self):
+        _check_bounds(self.low, self.high)
+
+    def sample(self, rng: random.Random, n: int) -> array:
+        uniform, low, high = rng.uniform, self.low, self.high
+        return array("d", [uniform(low, high) for _ in range(n)])
+
+
+class Triangular(namedtuple("Triangular", ("low", "mode", "high"))):
+    """Triangular distribution over [low, high] peaking at mode."""
+    def validate(self):
+        _check_bounds(self.low, self.high)
+        if not self.low <= self.mode <= self.high:
+            raise ValueError("mode must lie within [low, high]")
+
+    def sample(self, rng: random.Random, n: int) -> array:
+        triangular, low, high, mode = rng.triangular, self.low, self.high, self.mode
+        return array("d", [triangular(low, high, mode) for _ in range(n)])
+
+
+# Summary of one output column over every sample. percentiles maps each
+# requested percentile to its value; histogram holds the counts of the
+# len(bin_edges) - 1 equal bins between minimum and maximum.
+OutputDistribution = namedtuple("OutputDistribution", (
+    "mean", "std", "minimum", "maximum", "percentiles", "histogram", "bin_edges",
+))
+
+# low_cement_samples counts the samples whose calculated cement content was
+# below the exposure minimum
+MonteCarloResult = namedtuple("MonteCarloResult", ("samples", "seed", "outputs", "low_cement_samples"))
+
+
+class _StreamingHistogram:
+    """Mean, variance, extremes and a fixed-grid histogram of a stream of values.
+
+    The grid spans the first chunk's range widened by half its span on both
+    sides; values outside it are counted in underflow/overflow bins bounded by
+    the observed extremes.
+    """
+    def __init__(self, first: array, n_bins: int):
+        self.minimum, self.maximum = min(first), max(first)
+        span = self.maximum - self.minimum
+        if span == 0:
+            span = max(abs(self.minimum) * 1e-6, 1e-9)
+        self.low = self.minimum - span / 2
+        self.n_bins = n_bins
+        self.scale = n_bins / (2 * span)
+        self.counts = [0] * n_bins
+        self.underflow = self.overflow = 0
+        # shifted sums keep the variance accurate for values far from zero
+        self.shift = math.fsum(first) / len(first)
+        self.n = 0
+        self.sum = self.sum_squares = 0.0
+
+    def add(self, values: array):
+        self.minimum = min(self.minimum, min(values))
+        self.maximum = max(self.maximum, max(values))
+        shift = self.shift
+        deviations = [v - shift for v in values]
+        self.n += len(values)
+        self.sum += math.fsum(deviations)
+        self.sum_squares += math.fsum([d * d for d in deviations])
+        low, scale, n_bins, counts = self.low, self.scale, self.n_bins, self.counts
+        for k, count in Counter([math.floor((v - low) * scale) for v in values]).items():
+            if k < 0:
+                self.underflow += count
+            elif k >= n_bins:
+                self.overflow += count
+            else:
+                counts[k] += count
+
+    def _segments(self):
+        """Yield (start, stop, count) of the underflow, grid and overflow bins."""
+        width = 1.0 / self.scale
+        high = self.low + self.n_bins * width
+        yield min(self.minimum, self.low), self.low, self.underflow
+        for k, count in enumerate(self.counts):
+            yield self.low + k * width, self.low + (k + 1) * width, count
+        yield high, max(self.maximum, high), self.overflow
+
+    def percentile(self, p: float) -> float:
+        target = p / 100.0 * self.n
+        cumulative = 0
+        value = self.maximum
+        for start, stop, count in self._segments():
+            if count and cumulative + count >= target:
+                value = start + (stop - start) * (target - cumulative) / count
+                break
+            cumulative += count
+        return min(max(value, self.minimum), self.maximum)
+
+    def histogram(self, bins: int) -> tuple:
+        """Counts of equal bins between the observed extremes, assigning each grid bin by its centre."""
+        width = (self.maximum - self.minimum) / bins
+        edges = [self.minimum + i * width for i in range(bins)] + [self.maximum]
+        counts = [0] * bins
+        for start, stop, count in self._segments():
+            if count:
+                k = int(((start + stop) / 2 - self.minimum) / width) if width > 0 else 0
+                counts[min(max(k, 0), bins - 1)] += count
+        return counts, edges
+
+    def summary(self, percentiles, bins: int) -> OutputDistribution:
+        mean_deviation = self.sum / self.n
+        variance = max(self.sum_squares / self.n - mean_deviation * mean_deviation, 0.0)
+        if self.n > 1:
+            variance *= self.n / (self.n - 1)
+        counts, edges = self.histogram(bins)
+        return OutputDistribution(
+            mean=self.shift + mean_deviation,
+            std=math.sqrt(variance),
+            minimum=self.minimum,
+            maximum=self.maximum,
+            percentiles={p: self.percentile(p) for p in percentiles},
+            histogram=counts,
+            bin_edges=edges,
+        )
+
+
+def monte_carlo(design, distributions: dict, samples: int = 100_000, seed: int | None = None,
+                outputs=DEFAULT_OUTPUTS, percentiles=DEFAULT_PERCENTILES, bins: int = 50,
+                chunk_size: int = 16384) -> MonteCarloResult:
+    """Propagate input uncertainty through a mix design.
+
+    Every input in ``distributions`` is drawn independently for each sample
+    while the other inputs keep the design's values. Each input has its own
+    random stream derived from ``seed``, so a seed reproduces the same
+    samples whatever the chunk size.
+
+    Args:
+        design (ConcreteMixDesign): The design supplying the fixed inputs and the table version.
+        distributions (dict): Normal, Uniform or Triangular distributions keyed by names in CONTINUOUS_INPUTS.
+        samples (int, optional): Number of samples. Defaults to 100_000.
+        seed (int | None, optional): Seed of the random streams. Defaults to None (a random seed, reported in the result).
+        outputs (iterable[str], optional): Result columns to summarize (names in RESULT_COLUMNS). Defaults to DEFAULT_OUTPUTS.
+        percentiles (iterable[float], optional): Percentiles (0-100) to report. Defaults to DEFAULT_PERCENTILES.
+        bins (int, optional): Histogram bins per output. Defaults to 50.
+        chunk_size (int, optional): Samples evaluated together. Defaults to 16384.
+
+    Raises:
+        ValueError: If a distribution, output name, percentile or count is invalid.
+
+    Returns:
+        MonteCarloResult: The sample count, the seed and an OutputDistribution per output.
+    """
+    unknown = set(distributions) - set(CONTINUOUS_INPUTS)
+    if unknown:
+        raise ValueError(f"cannot sample {sorted(unknown)}; choose from CONTINUOUS_INPUTS")
+    for distribution in distributions.values():
+        distribution.validate()
+    outputs = tuple(outputs)
+    unknown = set(outputs) - set(RESULT_COLUMNS)
+    if unknown:
+        raise ValueError(f"unknown outputs: {sorted(unknown)}")
+    percentiles = tuple(float(p) for p in percentiles)
+    if any(not 0.0 <= p <= 100.0 for p in percentiles):
+        raise ValueError("percentiles must lie within [0, 100]")
+    if samples <= 0 or bins <= 0 or chunk_size <= 0:
+        raise ValueError("samples, bins and chunk_size must be greater than zero")
+
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    streams = {name: random.Random(f"{seed}:{name}") for name in sorted(distributions)}
+    spec = design_spec(design)
+    for name in streams:
+        spec[name] = 0.0  # placeholder so that sampled specific gravities pass validation
+    fixed, entry = resolve_design_entry(spec, design.table_version)
+    parameters = tuple(fixed[name] for name in DESIGN_PARAMETERS)
+    output_index = {name: RESULT_COLUMNS.index(name) for name in outputs}
+
+    accumulators = {}
+    low_cement_samples = 0
+    done = 0
+    while done < samples:
+        n = min(chunk_size, samples - done)
+        arguments = [
+            distributions[name].sample(streams[name], n) if name in streams else repeat(fixed[name], n)
+            for name in CONTINUOUS_INPUTS
+        ]
+        rows = [evaluate_entry(entry, *values, *parameters) for values in zip(*arguments)]
+        low_cement_samples += sum([row[-1] for row in rows])
+        for name, index in output_index.items():
+            column = array("d", [row[index] for row in rows])
+            if name not in accumulators:
+                accumulators[name] = _StreamingHistogram(column, bins * FINE_BINS_PER_BIN)
+            accumulators[name].add(column)
+        done += n
+    return MonteCarloResult(
+        samples=samples,
+        seed=seed,
+        outputs={name: accumulators[name].summary(percentiles, bins) for name in outputs},
+        low_cement_samples=low_cement_samples,
+    )
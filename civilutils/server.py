@@ -0,0 +1,327 @@
+"""Local HTTP/JSON mix design service built on asyncio.
+
+Endpoints:
+    POST /mix-design           spec JSON -> per m^3 result columns (as compute_mix_design)
+    POST /mix-design/volume    spec JSON with ``volume_m3`` -> quantities for that volume
+                               (as compute_mix_design_for_volume)
+    GET  /health               {"status": "ok"}
+    GET  /metrics              server counters (and stage metrics, if enabled) as Prometheus text
+
+A spec holds the inputs of ``batch.SPEC_COLUMNS`` (enums by member name or
+value). Requests arriving within ``batch_window`` seconds of each other are
+evaluated together with one ``compute_mix_designs`` call, and concurrent
+requests for the same spec share a single evaluation. Connections are kept
+alive (HTTP/1.1) unless the client asks otherwise.
+
+Example:
+    civilutils serve --port 8080
+    curl -s localhost:8080/mix-design -d '{"concrete_grade": "M30", "exposure_condition": "Severe",
+        "cement_specific_gravity": 3.15, "fine_aggregate_specific_gravity": 2.6,
+        "coarse_aggregate_specific_gravity": 2.7, "water_specific_gravity": 1.0,
+        "admixture_specific_gravity": 1.145}'
+"""
+import asyncio
+import json
+import math
+import warnings
+from enum import Enum
+
+from civilutils.indian_standards.batch import (
+    ENUM_COLUMNS,
+    RESULT_COLUMNS,
+    SPEC_COLUMNS,
+    SPECIFIC_GRAVITY_COLUMNS,
+    compute_mix_designs,
+    normalize_specs,
+)
+from civilutils.indian_standards.concrete import DEFAULT_TABLE_VERSION, get_table_set
+from civilutils.indian_standards.metrics import active_registry
+from civilutils.indian_standards.orders import SCALED_COLUMNS
+
+MAX_BODY_BYTES = 1 << 20
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+# server counters exported on /metrics, with their Prometheus help text
+SERVER_COUNTERS = {
+    "requests": "HTTP requests handled.",
+    "errors": "Requests answered with an error status.",
+    "coalesced": "Design requests served by an identical in-flight evaluation.",
+    "batches": "Batch evaluations run.",
+    "designs": "Distinct designs evaluated.",
+    "connections": "Accepted connections.",
+}
+
+# spec inputs that must be finite numbers when given
+NUMERIC_COLUMNS = tuple(name for name in SPEC_COLUMNS if name not in ENUM_COLUMNS and name != "is_pumpable")
+
+
+class HTTPError(Exception):
+    """Error answered with an HTTP status and a JSON message."""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _json_value(value):
+    if isinstance(value, Enum):
+        return value.value[0] if isinstance(value.value, tuple) else value.value
+    return value
+
+
+def parse_spec(payload) -> tuple:
+    """Validate a request spec.
+
+    A null input takes the default of its SPEC_COLUMNS entry; a null
+    mandatory specific gravity is rejected.
+
+    Args:
+        payload (dict): Decoded request JSON.
+
+    Raises:
+        HTTPError: If the payload is not an object or the spec is invalid.
+
+    Returns:
+        tuple: Normalized spec values in SPEC_COLUMNS order (hashable) and the volume_m3 (or None).
+    """
+    if not isinstance(payload, dict):
+        raise HTTPError(400, "request body must be a JSON object")
+    spec = dict(payload)
+    volume = spec.pop("volume_m3", None)
+    if volume is not None:
+        if not isinstance(volume, (int, float)) or isinstance(volume, bool) or volume <= 0:
+            raise HTTPError(400, "volume_m3 must be a number greater than zero")
+    for name, value in spec.items():
+        if isinstance(value, (list, dict)):
+            raise HTTPError(400, f"{name} must be a scalar")
+        if value is None:
+            if name in SPECIFIC_GRAVITY_COLUMNS:
+                raise HTTPError(400, f"{name} is required")
+            continue
+        if name in NUMERIC_COLUMNS:
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or not math.isfinite(value):
+                raise HTTPError(400, f"{name} must be a finite number")
+            if name.endswith("_specific_gravity") and value <= 0:
+                raise HTTPError(400, f"{name} must be greater than zero")
+    try:
+        _, columns = normalize_specs(spec)
+    except ValueError as exc:
+        raise HTTPError(400, str(exc))
+    return tuple(columns[name][0] for name in SPEC_COLUMNS), volume
+
+
+class MixDesignServer:
+    """Asyncio HTTP server evaluating mix designs in coalesced micro-batches."""
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080, batch_window: float = 0.002,
+                 max_batch_size: int = 512, table_version: str = DEFAULT_TABLE_VERSION):
+        """Initialize the server.
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+            port (int, optional): TCP port, 0 for any free port. Defaults to 8080.
+            batch_window (float, optional): Seconds to collect requests before evaluating them. Defaults to 0.002.
+            max_batch_size (int, optional): Distinct designs that trigger an immediate evaluation. Defaults to 512.
+            table_version (str, optional): Edition of the clause tables (a key of TABLE_SETS). Defaults to DEFAULT_TABLE_VERSION.
+
+        Raises:
+            ValueError: If batch_window is negative, max_batch_size is not positive or the table version is unknown.
+        """
+        if batch_window < 0:
+            raise ValueError("batch_window must not be negative")
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be greater than zero")
+        get_table_set(table_version)
+        self.host = host
+        self.port = port
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.table_version = table_version
+        self.counters = dict.fromkeys(SERVER_COUNTERS, 0)
+        self._server = None
+        self._in_flight = {}
+        self._pending = []
+        self._flush_handle = None
+
+    async def start(self):
+        """Bind the socket and start accepting connections (self.port holds the bound port)."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Start the server (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting connections and wait for the listening socket to close."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    # -- evaluation -------------------------------------------------------
+
+    def evaluate(self, key: tuple) -> asyncio.Future:
+        """Return a future of the result row of a normalized spec, sharing in-flight evaluations."""
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.counters["coalesced"] += 1
+            return future
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self._pending.append(key)
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+        return future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        keys, self._pending = self._pending, []
+        if not keys:
+            return
+        self.counters["batches"] += 1
+        self.counters["designs"] += len(keys)
+        try:
+            rows = self._compute(keys)
+        except Exception:
+            # isolate the failing rows so they cannot fail the rest of the batch
+            for key in keys:
+                try:
+                    row = self._compute([key])[0]
+                except Exception as exc:
+                    self._in_flight.pop(key).set_exception(exc)
+                else:
+                    self._in_flight.pop(key).set_result(row)
+            return
+        for key, row in zip(keys, rows):
+            self._in_flight.pop(key).set_result(row)
+
+    def _compute(self, keys: list) -> list:
+        columns = {name: [key[i] for key in keys] for i, name in enumerate(SPEC_COLUMNS)}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = compute_mix_designs(columns, self.table_version)
+        return [{name: results[name][i] for name in RESULT_COLUMNS} for i in range(len(keys))]
+
+    async def design(self, payload, require_volume: bool = False) -> dict:
+        """Evaluate one request payload.
+
+        Raises:
+            HTTPError: If the payload is invalid or its design cannot be computed.
+
+        Returns:
+            dict: The spec echoed back with the result columns, scaled when volume_m3 is given.
+        """
+        key, volume = parse_spec(payload)
+        if require_volume and volume is None:
+            raise HTTPError(400, "volume_m3 is required")
+        try:
+            row = await self.evaluate(key)
+        except (ValueError, ArithmeticError) as exc:
+            raise HTTPError(400, f"cannot compute the design: {exc}")
+        response = {name: _json_value(value) for name, value in zip(SPEC_COLUMNS, key)}
+        if volume is None:
+            response.update(row)
+        else:
+            response["volume_m3"] = volume
+            response.update(row)
+            for name in SCALED_COLUMNS:
+                response[name] = row[name] * volume
+        return response
+
+    def metrics_text(self) -> str:
+        """Render the server counters (and enabled stage metrics) as Prometheus text."""
+        lines = []
+        for name, help_text in SERVER_COUNTERS.items():
+            metric = f"civilutils_server_{name}_total"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter", f"{metric} {self.counters[name]}"]
+        text = "\n".join(lines) + "\n"
+        registry = active_registry()
+        return text + registry.to_prometheus() if registry is not None else text
+
+    # -- HTTP ---------------------------------------------------------------
+
+    async def _route(self, method: str, path: str, body: bytes) -> tuple:
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                raise HTTPError(405, "use GET")
+            return 200, "application/json", b'{"status": "ok"}'
+        if path == "/metrics":
+            if method != "GET":
+                raise HTTPError(405, "use GET")
+            return 200, "text/plain; version=0.0.4", self.metrics_text().encode()
+        if path in ("/mix-design", "/mix-design/volume"):
+            if method != "POST":
+                raise HTTPError(405, "use POST")
+            try:
+                payload = json.loads(body or b"null")
+            except ValueError:
+                raise HTTPError(400, "request body is not valid JSON")
+            result = await self.design(payload, require_volume=path.endswith("/volume"))
+            return 200, "application/json", json.dumps(result).encode()
+        raise HTTPError(404, f"no route for {path}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.counters["connections"] += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, path, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, 400, "application/json", b'{"error": "malformed request line"}', False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                self.counters["requests"] += 1
+                try:
+                    try:
+                        length = int(headers.get("content-length", "0"))
+                    except ValueError:
+                        raise HTTPError(400, "invalid Content-Length")
+                    if length < 0 or length > MAX_BODY_BYTES:
+                        raise HTTPError(413, "request body too large")
+                    body = await reader.readexactly(length) if length else b""
+                    status, content_type, payload = await self._route(method, path, body)
+                except HTTPError as exc:
+                    status, content_type = exc.status, "application/json"
+                    payload = json.dumps({"error": str(exc)}).encode()
+                except asyncio.IncompleteReadError:
+                    break
+                except Exception as exc:
+                    status, content_type = 500, "application/json"
+                    payload = json.dumps({"error": str(exc)}).encode()
+                if status >= 400:
+                    self.counters["errors"] += 1
+                await self._respond(writer, status, content_type, payload, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status: int, content_type: str, payload: bytes, keep_alive: bool):
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + payload)
+        await writer.drain()
@@ -0,0 +1,111 @@
+import asyncio
+import os
+import random
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.acceptance import (
+    AcceptanceChecker,
+    SampleResult,
+    acceptance_limits,
+)
+from civilutils.indian_standards.concrete import ConcreteGrade
+from civilutils.indian_standards.strength import CubeResult, StandardDeviationEstimator
+
+
+def feed(strengths, source="Pour-1", grade=ConcreteGrade.M25):
+    return [SampleResult(source, grade, i, s) for i, s in enumerate(strengths)]
+
+
+class TestAcceptanceLimits(unittest.TestCase):
+    def test_table_11_limits(self):
+        # M25, assumed s = 4.0: 0.825 * 4.0 = 3.3 -> 3.5, below the 4 N/mm^2 floor
+        self.assertEqual(acceptance_limits("M25"), (29.0, 21.0))
+        # M40, assumed s = 5.0: 0.825 * 5.0 = 4.125 -> 4.0
+        self.assertEqual(acceptance_limits(ConcreteGrade.M40), (44.0, 36.0))
+        self.assertEqual(acceptance_limits("M15"), (18.0, 12.0))
+        # established s = 6.5: 5.3625 -> 5.5
+        self.assertEqual(acceptance_limits("M40", standard_deviation=6.5), (45.5, 36.0))
+
+    def test_invalid_input_raises(self):
+        with self.assertRaises(ValueError):
+            acceptance_limits("M99")
+        with self.assertRaises(ValueError):
+            acceptance_limits("M30", standard_deviation=0)
+        with self.assertRaises(ValueError):
+            AcceptanceChecker(reorder_window=-1)
+        with self.assertRaises(ValueError):
+            AcceptanceChecker().check(SampleResult("P", "M30", 0, "n/a"))
+
+
+class TestAcceptanceChecker(unittest.TestCase):
+    def test_individual_and_group_failures(self):
+        checker = AcceptanceChecker()
+        events = list(checker.stream(feed([31.0, 30.0, 20.5, 33.0,    # mean 28.625 < 29, 20.5 < 21
+                                           30.0, 29.0, 31.0, 30.0])))  # mean 30.0
+        self.assertEqual([(e.criterion, e.sequences) for e in events],
+                         [("individual", (2,)), ("group_mean", (0, 1, 2, 3))])
+        self.assertEqual(events[1].value, 28.625)
+        self.assertEqual(events[1].limit, 29.0)
+        self.assertEqual((checker.results, checker.groups, checker.non_compliances), (8, 2, 2))
+
+    def test_groups_are_kept_per_source_and_grade(self):
+        results = feed([28.0] * 4, source="A")
+        interleaved = [r for pair in zip(results, feed([35.0] * 4, source="B")) for r in pair]
+        events = list(AcceptanceChecker().stream(interleaved))
+        self.assertEqual([(e.criterion, e.source) for e in events], [("group_mean", "A")])
+
+    def test_unsorted_feed_matches_sorted(self):
+        rng = random.Random(7)
+        results = [r for source in ("A", "B", "C")
+                   for r in feed([rng.gauss(31.0, 3.0) for _ in range(400)], source=source)]
+        expected = AcceptanceChecker()
+        expected_events = list(expected.stream(results)) + expected.flush()
+        # shuffle each result by at most 8 positions within its source
+        shuffled = sorted(results, key=lambda r: (r.sequence + rng.uniform(0, 8), r.source))
+        checker = AcceptanceChecker(reorder_window=8)
+        events = list(checker.stream(shuffled)) + checker.flush()
+        self.assertEqual(checker.late, 0)
+        self.assertEqual(sorted(events), sorted(expected_events))
+        self.assertEqual(checker.groups, expected.groups)
+
+    def test_late_results_are_checked_individually_only(self):
+        checker = AcceptanceChecker(reorder_window=1)
+        events = list(checker.stream(feed([30.0, 30.0, 30.0]) + [SampleResult("Pour-1", "M25", 0, 15.0)]))
+        self.assertEqual(checker.late, 1)
+        self.assertEqual([e.criterion for e in events], ["individual"])
+
+    def test_established_standard_deviation(self):
+        strengths = [30.0, 30.0, 30.0, 30.5]   # mean 30.125
+        self.assertEqual(list(AcceptanceChecker().stream(feed(strengths))), [])
+        # s = 7.0 -> 0.825 * 7 = 5.775 -> 6.0: limit 31
+        events = list(AcceptanceChecker({"M25": 7.0}).stream(feed(strengths)))
+        self.assertEqual([e.limit for e in events], [31.0])
+        estimator = StandardDeviationEstimator()
+        rng = random.Random(1)
+        estimator.ingest(CubeResult("Pour-1", "M25", rng.gauss(33.0, 7.0)) for _ in range(60))
+        checker = AcceptanceChecker(estimator)
+        self.assertGreater(checker.limits("Pour-1", "M25").group_mean, 29.0)
+        self.assertEqual(checker.limits("Pour-2", "M25"), acceptance_limits("M25"))
+        estimator.ingest(CubeResult("Pour-3", "M25", 33.0) for _ in range(30))
+        self.assertEqual(checker.limits("Pour-3", "M25"), acceptance_limits("M25"))
+
+    def test_async_stream(self):
+        results = feed([31.0, 30.0, 20.5, 33.0])
+
+        async def source():
+            for result in results:
+                await asyncio.sleep(0)
+                yield result
+
+        async def collect():
+            return [event async for event in AcceptanceChecker().astream(source())]
+
+        self.assertEqual(asyncio.run(collect()), list(AcceptanceChecker().stream(results)))
+
+
+if __name__ == "__main__":
+    unittest.main()
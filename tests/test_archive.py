@@ -0,0 +1,127 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+import warnings
+from datetime import date, datetime, timezone
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.archive import ARCHIVE_COLUMNS, SQLiteArchive
+from civilutils.indian_standards.batch import compute_mix_designs
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+    MineralAdmixture,
+)
+
+BASE = {
+    "cement_specific_gravity": 3.15,
+    "fine_aggregate_specific_gravity": 2.60,
+    "coarse_aggregate_specific_gravity": 2.70,
+    "water_specific_gravity": 1.00,
+    "admixture_specific_gravity": 1.145,
+}
+
+SPECS = dict(BASE, **{
+    "concrete_grade": ["M35", "M35", "M35", "M20"],
+    "exposure_condition": ["Very Severe", "Very Severe", "Severe", "Mild"],
+    "mineral_admixture": ["Fly Ash", "Fly Ash", "Fly Ash", None],
+    "mineral_admixture_percentage": [30.0, 20.0, 30.0, None],
+})
+
+
+class TestSQLiteArchive(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "designs.sqlite")
+        self.archive = SQLiteArchive(self.path)
+
+    def tearDown(self):
+        self.archive.close()
+        self.directory.cleanup()
+
+    def test_insert_and_point_query(self):
+        self.assertEqual(self.archive.insert(SPECS, issued_at=date(2026, 5, 1), reference="PO-1"), 4)
+        self.archive.insert(SPECS, issued_at=datetime(2026, 8, 15, 9, 30), issued_by="QA", reference="PO-2")
+        rows = self.archive.query(concrete_grade="M35", exposure_condition=ExposureCondition.VERY_SEVERE,
+                                  mineral_admixture="Fly Ash", mineral_admixture_percentage=(25, None),
+                                  issued_from="2026-07-01", issued_to="2026-10-01")
+        self.assertEqual(len(rows), 1)
+        row = rows[0]
+        self.assertEqual((row.reference, row.issued_by, row.issued_at), ("PO-2", "QA", "2026-08-15T09:30:00"))
+        self.assertEqual((row.concrete_grade, row.exposure_condition, row.mineral_admixture),
+                         ("M35", "VERY_SEVERE", "FLY_ASH"))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = compute_mix_designs(SPECS)
+        self.assertEqual(row.cement_mass_kg, expected["cement_mass_kg"][0])
+        self.assertEqual(row.table_version, "IS 10262:2009")
+        self.assertEqual(row._fields, ("id",) + ARCHIVE_COLUMNS)
+
+    def test_filters_columns_and_count(self):
+        self.archive.insert(SPECS, issued_at="2026-01-01")
+        self.assertEqual(self.archive.count(), 4)
+        self.assertEqual(self.archive.count(mineral_admixture=None), 1)
+        self.assertEqual(self.archive.count(mineral_admixture=[None, "FLY_ASH"]), 4)
+        self.assertEqual(self.archive.count(exposure_condition=["Severe", "Mild"]), 2)
+        self.assertEqual(self.archive.count(mineral_admixture_percentage=30.0), 2)
+        self.assertEqual(self.archive.count(issued_from="2026-02-01"), 0)
+        rows = self.archive.query(columns=("concrete_grade", "water_mass_kg"), limit=2)
+        self.assertEqual([row._fields for row in rows], [("concrete_grade", "water_mass_kg")] * 2)
+
+    def test_designs_and_wal_mode(self):
+        design = ConcreteMixDesign(
+            concrete_grade=ConcreteGrade.M30,
+            exposure_condition=ExposureCondition.SEVERE,
+            specific_gravities=[
+                SpecificGravity(Materials.CEMENT, 3.15),
+                SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+                SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+                SpecificGravity(Materials.WATER, 1.00),
+                SpecificGravity(Materials.ADMIXTURE, 1.145),
+            ],
+            mineral_admixture=MineralAdmixture.FLY_ASH,
+        )
+        self.archive.insert_designs([design], issued_at=datetime(2026, 3, 1, tzinfo=timezone.utc))
+        (row,) = self.archive.query()
+        self.assertEqual(row.cement_mass_kg, design.compute_mix_design(compact=True).cement.mass_kg)
+        self.assertEqual(row.is_pumpable, 1)
+        self.assertEqual(self.archive.connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        indexes = {name for (name,) in self.archive.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn("designs_grade_exposure", indexes)
+        plan = " ".join(str(step) for step in self.archive.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM designs WHERE concrete_grade = 'M35' AND exposure_condition = 'SEVERE'"))
+        self.assertIn("designs_grade_exposure", plan)
+
+    def test_reopen_and_errors(self):
+        self.archive.insert(SPECS)
+        self.archive.close()
+        self.archive = SQLiteArchive(self.path)
+        self.assertEqual(self.archive.count(), 4)
+        with self.assertRaises(ValueError):
+            self.archive.query(concrete_grade="M99")
+        with self.assertRaises(ValueError):
+            self.archive.query(steel_mass_kg=1.0)
+        with self.assertRaises(ValueError):
+            self.archive.query(columns=("steel_mass_kg",))
+        with self.assertRaises(ValueError):
+            self.archive.insert(SPECS, issued_at=object())
+        self.assertEqual(self.archive.count(), 4)
+        with self.assertRaises(ValueError):
+            SQLiteArchive(self.path, table_version="IS 456")
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA user_version=99")
+        connection.close()
+        with self.assertRaises(ValueError):
+            SQLiteArchive(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
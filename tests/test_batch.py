@@ -0,0 +1,164 @@
+import os
+import sys
+import unittest
+import warnings
+from itertools import product
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    MaximumNominalSize,
+    MineralAdmixture,
+    ChemicalAdmixture,
+    ExposureCondition,
+    SpecificGravity,
+    FineAggregateZone,
+    Materials,
+)
+from civilutils.indian_standards.batch import compute_mix_designs, normalize_specs, RESULT_COLUMNS
+
+
+SG = {
+    "cement_specific_gravity": 3.15,
+    "fine_aggregate_specific_gravity": 2.60,
+    "coarse_aggregate_specific_gravity": 2.70,
+    "water_specific_gravity": 1.00,
+    "admixture_specific_gravity": 1.145,
+}
+
+
+def scalar_columns(design):
+    """Flatten a compute_mix_design() result into the batch column layout."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = design.compute_mix_design(display_result=False)
+    row = {
+        "target_mean_strength_N_per_mm2": design.target_mean_compressive_strength,
+        "water_cement_ratio": design.water_cement_ratio,
+    }
+    for name, comp in result["mix_per_m3"]["components"].items():
+        row[f"{name}_mass_kg"] = comp["mass_kg"]
+        row[f"{name}_volume_m3"] = comp["volume_m3"]
+        if "volume_proportion" in comp:
+            row[f"{name}_volume_proportion"] = comp["volume_proportion"]
+    row.update(result["aggregate_adjustments_kg"])
+    return row
+
+
+class TestComputeMixDesigns(unittest.TestCase):
+    def setUp(self):
+        self.sg_list = [
+            SpecificGravity(Materials.CEMENT, SG["cement_specific_gravity"]),
+            SpecificGravity(Materials.FINE_AGGREGATE, SG["fine_aggregate_specific_gravity"]),
+            SpecificGravity(Materials.COARSE_AGGREGATE, SG["coarse_aggregate_specific_gravity"]),
+            SpecificGravity(Materials.WATER, SG["water_specific_gravity"]),
+            SpecificGravity(Materials.ADMIXTURE, SG["admixture_specific_gravity"]),
+        ]
+
+    def test_matches_scalar_path_exactly(self):
+        cases = list(product(
+            ConcreteGrade,
+            ExposureCondition,
+            MaximumNominalSize,
+            FineAggregateZone,
+            (True, False),
+            (None, ChemicalAdmixture.SUPERPLASTICIZER),
+            (None, MineralAdmixture.FLY_ASH),
+            (25.0, 100.0),
+        ))
+        specs = {name: [] for name in (
+            "concrete_grade", "exposure_condition", "maximum_nominal_size",
+            "fine_aggregate_zone", "is_pumpable", "chemical_admixture",
+            "mineral_admixture", "slump_mm")}
+        expected = []
+        for case in cases:
+            for name, value in zip(specs, case):
+                specs[name].append(value)
+            grade, exposure, size, zone, pumpable, chemical, mineral, slump = case
+            design = ConcreteMixDesign(
+                concrete_grade=grade,
+                exposure_condition=exposure,
+                specific_gravities=self.sg_list,
+                maximum_nominal_size=size,
+                fine_aggregate_zone=zone,
+                is_pumpable=pumpable,
+                chemical_admixture=chemical,
+                mineral_admixture=mineral,
+                slump_mm=slump,
+                coarse_aggregate_water_absorption=0.5,
+                fine_aggregate_water_absorption=1.0,
+                coarse_aggregate_surface_moisture=0.2,
+                fine_aggregate_surface_moisture=2.0,
+            )
+            expected.append(scalar_columns(design))
+
+        specs.update(SG)
+        specs.update(
+            coarse_aggregate_water_absorption=0.5,
+            fine_aggregate_water_absorption=1.0,
+            coarse_aggregate_surface_moisture=0.2,
+            fine_aggregate_surface_moisture=2.0,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = compute_mix_designs(specs)
+
+        self.assertEqual(set(results), set(RESULT_COLUMNS))
+        for i, row in enumerate(expected):
+            for name in RESULT_COLUMNS:
+                self.assertEqual(results[name][i], row[name], msg=f"row {i}: {name}")
+
+    def test_accepts_enum_names_and_values(self):
+        by_member = compute_mix_designs(dict(
+            SG, concrete_grade=[ConcreteGrade.M30], exposure_condition=[ExposureCondition.VERY_SEVERE],
+            maximum_nominal_size=[MaximumNominalSize.SIZE_10]))
+        by_string = compute_mix_designs(dict(
+            SG, concrete_grade=["M30"], exposure_condition=["VERY_SEVERE"],
+            maximum_nominal_size=["10"]))
+        self.assertEqual(by_member, by_string)
+
+    def test_scalar_inputs_broadcast(self):
+        results = compute_mix_designs(dict(
+            SG, concrete_grade=ConcreteGrade.M25, exposure_condition=ExposureCondition.SEVERE,
+            slump_mm=[50.0, 75.0, 100.0]))
+        self.assertEqual(len(results["cement_mass_kg"]), 3)
+        self.assertLess(results["water_mass_kg"][0], results["water_mass_kg"][2])
+
+    def test_low_cement_content_warns_once_per_batch(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            compute_mix_designs(dict(
+                SG, concrete_grade=ConcreteGrade.M20, exposure_condition=ExposureCondition.MILD,
+                maximum_nominal_size=MaximumNominalSize.SIZE_40, slump_mm=[25.0] * 10))
+        self.assertEqual(len(caught), 1)
+        self.assertIn("10 of 10", str(caught[0].message))
+
+    def test_invalid_inputs_raise(self):
+        with self.assertRaises(ValueError):
+            compute_mix_designs({"concrete_grade": ["M20"], "exposure_condition": ["Mild"]})
+        with self.assertRaises(ValueError):
+            compute_mix_designs(dict(SG, concrete_grade=["M99"], exposure_condition=["Mild"]))
+        with self.assertRaises(ValueError):
+            compute_mix_designs(dict(SG, concrete_grade=["M20", "M25"], exposure_condition=["Mild"]))
+
+    def test_none_entries(self):
+        specs = dict(SG, concrete_grade=["M25", "M25"], exposure_condition="Severe",
+                     cement_specific_gravity=[3.15, None])
+        with self.assertRaisesRegex(ValueError, "cement_specific_gravity in row 1"):
+            compute_mix_designs(specs)
+        defaulted = compute_mix_designs(dict(
+            SG, concrete_grade=["M25", "M25"], exposure_condition="Severe",
+            maximum_nominal_size=[None, MaximumNominalSize.SIZE_20], fly_ash_specific_gravity=[None, 1.0],
+            fine_aggregate_surface_moisture=[None, 0.0], mineral_admixture=MineralAdmixture.FLY_ASH))
+        for name in RESULT_COLUMNS:
+            self.assertEqual(defaulted[name][0], defaulted[name][1], msg=name)
+        # slump_mm=None means no slump adjustment and is kept
+        self.assertEqual(normalize_specs(dict(SG, concrete_grade="M25", exposure_condition="Severe",
+                                              slump_mm=None))[1]["slump_mm"], [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import os
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.bench_mix_design import CASES, compare, run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_every_case_runs(self):
+        results = run_benchmarks(number=1, repeat=1)
+        self.assertEqual(set(results["cases"]), set(CASES))
+        for case in results["cases"].values():
+            self.assertGreater(case["seconds_per_op"], 0)
+            self.assertGreater(case["peak_bytes"], 0)
+
+    def test_unknown_case_raises(self):
+        with self.assertRaises(ValueError):
+            run_benchmarks(["nope"], number=1, repeat=1)
+
+    def test_compare_flags_regressions_beyond_tolerance(self):
+        baseline = {"cases": {"scalar": {"seconds_per_op": 1.0, "peak_bytes": 1000}}}
+        within = {"cases": {"scalar": {"seconds_per_op": 1.2, "peak_bytes": 1000}, "batch": {"seconds_per_op": 9.0, "peak_bytes": 1}}}
+        self.assertEqual(compare(within, baseline, tolerance=0.25), [])
+        slower = {"cases": {"scalar": {"seconds_per_op": 1.3, "peak_bytes": 2000}}}
+        messages = compare(slower, baseline, tolerance=0.25)
+        self.assertEqual(len(messages), 2)
+        self.assertTrue(messages[0].startswith("scalar: seconds_per_op"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    MaximumNominalSize,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+)
+from civilutils.indian_standards.cache import MixDesignCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMixDesignCache(unittest.TestCase):
+    def setUp(self):
+        self.sg_list = [
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ]
+
+    def make_design(self, cache, **kwargs):
+        params = dict(
+            concrete_grade=ConcreteGrade.M25,
+            exposure_condition=ExposureCondition.SEVERE,
+            specific_gravities=self.sg_list,
+            maximum_nominal_size=MaximumNominalSize.SIZE_20,
+            result_cache=cache,
+        )
+        params.update(kwargs)
+        return ConcreteMixDesign(**params)
+
+    def test_hit_returns_same_result_and_restores_attributes(self):
+        cache = MixDesignCache()
+        expected = self.make_design(None).compute_mix_design()
+        first = self.make_design(cache).compute_mix_design()
+        design = self.make_design(cache)
+        second = design.compute_mix_design()
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+        self.assertAlmostEqual(design.water_cement_ratio, 0.45)
+        self.assertEqual(design.minimum_cement_content, expected["mix_per_m3"]["components"]["cement"]["mass_kg"])
+
+    def test_returned_results_are_defensive_copies(self):
+        cache = MixDesignCache()
+        design = self.make_design(cache)
+        first = design.compute_mix_design()
+        first["mix_per_m3"]["components"]["cement"]["mass_kg"] = -1.0
+        second = design.compute_mix_design()
+        self.assertNotEqual(second["mix_per_m3"]["components"]["cement"]["mass_kg"], -1.0)
+
+    def test_restored_attributes_are_defensive_copies(self):
+        cache = MixDesignCache()
+        first = self.make_design(cache)
+        first.compute_mix_design()
+        expected = dict(first.aggregate_absorbed_water)
+        first.aggregate_absorbed_water["coarse"] = 999.0
+        second = self.make_design(cache)
+        second.compute_mix_design()
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(second.aggregate_absorbed_water, expected)
+        second.aggregate_surface_moisture["fine"] = -1.0
+        third = self.make_design(cache)
+        third.compute_mix_design()
+        self.assertNotEqual(third.aggregate_surface_moisture["fine"], -1.0)
+
+    def test_fingerprint_includes_specific_gravity_values(self):
+        cache = MixDesignCache()
+        self.make_design(cache).compute_mix_design()
+        other_sg = [SpecificGravity(sg.material, sg.value) for sg in self.sg_list]
+        other_sg[2] = SpecificGravity(Materials.COARSE_AGGREGATE, 2.74)
+        self.make_design(cache, specific_gravities=other_sg).compute_mix_design()
+        self.assertEqual(cache.stats()["misses"], 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_lru_eviction(self):
+        cache = MixDesignCache(maxsize=2)
+        for slump in (50.0, 75.0, 50.0, 100.0):
+            self.make_design(cache, slump_mm=slump).compute_mix_design()
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["size"], 2)
+        # 50 mm was used most recently before 100 mm, so 75 mm was evicted
+        self.make_design(cache, slump_mm=50.0).compute_mix_design()
+        self.assertEqual(cache.stats()["hits"], 2)
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = MixDesignCache(ttl=10.0, clock=clock)
+        design = self.make_design(cache)
+        design.compute_mix_design()
+        clock.now = 5.0
+        design.compute_mix_design()
+        clock.now = 20.0
+        design.compute_mix_design()
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["expirations"]), (1, 2, 1))
+
+    def test_volume_path_uses_cache(self):
+        cache = MixDesignCache()
+        design = self.make_design(cache)
+        design.compute_mix_design_for_volume(2.0)
+        scaled = design.compute_mix_design_for_volume(3.0)
+        self.assertEqual(cache.stats()["hits"], 1)
+        expected = self.make_design(None).compute_mix_design_for_volume(3.0)
+        self.assertEqual(scaled, expected)
+
+    def test_invalid_configuration_raises(self):
+        with self.assertRaises(ValueError):
+            MixDesignCache(maxsize=0)
+        with self.assertRaises(ValueError):
+            MixDesignCache(ttl=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import json
+import math
+import os
+import sys
+import tempfile
+import unittest
+import warnings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.batch import RESULT_COLUMNS, compute_mix_designs
+from civilutils.indian_standards.columnar import ColumnarReader, ColumnarWriter, SCHEMA_FILE, STORE_COLUMNS
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ChemicalAdmixture,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+    MineralAdmixture,
+)
+
+SPECS = {
+    "concrete_grade": ["M20", "M30", "M40", "M25"],
+    "exposure_condition": ["Mild", "Severe", "Extreme", "Moderate"],
+    "chemical_admixture": [None, "Superplasticizer", None, None],
+    "mineral_admixture": [None, None, "Fly Ash", None],
+    "fine_aggregate_surface_moisture": [0.0, 1.5, 2.0, 3.0],
+    "cement_specific_gravity": 3.15,
+    "fine_aggregate_specific_gravity": 2.60,
+    "coarse_aggregate_specific_gravity": 2.70,
+    "water_specific_gravity": 1.00,
+    "admixture_specific_gravity": 1.145,
+}
+
+
+class TestColumnarStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "designs.cols")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_in_chunks(self):
+        with ColumnarWriter(self.path) as writer:
+            self.assertEqual(writer.append(SPECS), 4)
+        with ColumnarWriter(self.path) as writer:
+            writer.append(SPECS)
+            self.assertEqual(writer.rows, 8)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = compute_mix_designs(SPECS)
+        with ColumnarReader(self.path) as reader:
+            self.assertEqual(reader.rows, 8)
+            self.assertEqual(set(reader.columns), {name for name, _ in STORE_COLUMNS})
+            for name in RESULT_COLUMNS:
+                self.assertEqual(list(reader.column(name)), list(expected[name]) * 2)
+            self.assertEqual(reader.decoded("concrete_grade")[:4],
+                             [ConcreteGrade.M20, ConcreteGrade.M30, ConcreteGrade.M40, ConcreteGrade.M25])
+            self.assertEqual(reader.decoded("chemical_admixture")[1], ChemicalAdmixture.SUPERPLASTICIZER)
+            self.assertEqual(list(reader.column("fine_aggregate_surface_moisture"))[4:], [0.0, 1.5, 2.0, 3.0])
+            row = reader.row(2)
+            self.assertEqual(row["mineral_admixture"], MineralAdmixture.FLY_ASH)
+            self.assertEqual(row["mineral_admixture_percentage"], 30.0)
+            self.assertIs(row["is_pumpable"], True)
+            self.assertIsNone(row["chemical_admixture"])
+
+    def test_columns_are_zero_copy_views(self):
+        with ColumnarWriter(self.path) as writer:
+            writer.append(SPECS)
+        with ColumnarReader(self.path) as reader:
+            view = reader.column("cement_mass_kg")
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual((view.format, view.itemsize, len(view)), ("d", 8, 4))
+            self.assertTrue(view.readonly)
+            self.assertEqual(reader.column("concrete_grade").format, "B")
+
+    def test_close_with_slice_in_use(self):
+        with ColumnarWriter(self.path) as writer:
+            writer.append(SPECS)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = compute_mix_designs(SPECS)
+        reader = ColumnarReader(self.path)
+        cement = reader.column("cement_mass_kg", copy=True)
+        held = reader.column("water_mass_kg")[:2]
+        reader.column("fine_aggregate_mass_kg")
+        with self.assertRaisesRegex(BufferError, r"water_mass_kg.*copy=True"):
+            reader.close()
+        # the slice stays readable until it is released
+        self.assertEqual(held.tolist(), list(expected["water_mass_kg"][:2]))
+        held.release()
+        reader.close()
+        self.assertEqual(list(cement), list(expected["cement_mass_kg"]))
+
+    def test_designs_are_archived(self):
+        design = ConcreteMixDesign(
+            concrete_grade=ConcreteGrade.M30,
+            exposure_condition=ExposureCondition.SEVERE,
+            specific_gravities=[
+                SpecificGravity(Materials.CEMENT, 3.15),
+                SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+                SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+                SpecificGravity(Materials.WATER, 1.00),
+                SpecificGravity(Materials.ADMIXTURE, 1.145),
+            ],
+        )
+        result = design.compute_mix_design(compact=True)
+        with ColumnarWriter(self.path) as writer:
+            self.assertEqual(writer.append_designs([design, design]), 2)
+            self.assertEqual(writer.append_designs([]), 0)
+        with ColumnarReader(self.path) as reader:
+            self.assertEqual(list(reader.column("cement_mass_kg")), [result.cement.mass_kg] * 2)
+            self.assertTrue(math.isclose(reader.row(-1)["free_water_after_correction"], result.free_water_after_correction))
+
+    def test_uncommitted_data_is_discarded(self):
+        with ColumnarWriter(self.path) as writer:
+            writer.append(SPECS)
+        # simulate a crash after the column data but before the schema was committed
+        with open(os.path.join(self.path, "cement_mass_kg.bin"), "ab") as handle:
+            handle.write(b"\0" * 24)
+        with ColumnarReader(self.path) as reader:
+            self.assertEqual(len(reader.column("cement_mass_kg")), 4)
+        with ColumnarWriter(self.path) as writer:
+            writer.append(SPECS)
+        with ColumnarReader(self.path) as reader:
+            self.assertEqual(list(reader.column("cement_mass_kg"))[4:], list(reader.column("cement_mass_kg"))[:4])
+
+    def test_empty_archive_and_errors(self):
+        ColumnarWriter(self.path).close()
+        with ColumnarReader(self.path) as reader:
+            self.assertEqual(reader.rows, 0)
+            self.assertEqual(len(reader.column("water_mass_kg")), 0)
+            with self.assertRaises(ValueError):
+                reader.column("steel_mass_kg")
+            with self.assertRaises(ValueError):
+                reader.decoded("slump_mm")
+            with self.assertRaises(IndexError):
+                reader.row(0)
+        with self.assertRaises(ValueError):
+            ColumnarWriter(self.path, table_version="IS 10262:2019")
+        with self.assertRaises(ValueError):
+            ColumnarReader(self.directory.name)
+        with open(os.path.join(self.path, SCHEMA_FILE)) as handle:
+            schema = json.load(handle)
+        schema["version"] = 99
+        with open(os.path.join(self.path, SCHEMA_FILE), "w") as handle:
+            json.dump(schema, handle)
+        with self.assertRaises(ValueError):
+            ColumnarReader(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import pickle
+import sys
+import threading
+import unittest
+import warnings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ChemicalAdmixture,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+    MineralAdmixture,
+    compute_mix,
+    compute_stages,
+)
+from civilutils.indian_standards.trace import TraceCollector
+
+
+def make_design(**kwargs):
+    return ConcreteMixDesign(
+        concrete_grade=kwargs.pop("concrete_grade", ConcreteGrade.M30),
+        exposure_condition=kwargs.pop("exposure_condition", ExposureCondition.SEVERE),
+        specific_gravities=[
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ],
+        coarse_aggregate_water_absorption=0.5,
+        fine_aggregate_surface_moisture=2.0,
+        **kwargs,
+    )
+
+
+def design_matrix():
+    return [make_design(concrete_grade=grade, exposure_condition=exposure,
+                        mineral_admixture=mineral, chemical_admixture=chemical)
+            for grade in ConcreteGrade for exposure in ExposureCondition
+            for mineral in (None, MineralAdmixture.FLY_ASH)
+            for chemical in (None, ChemicalAdmixture.SUPERPLASTICIZER)]
+
+
+class TestComputationCore(unittest.TestCase):
+    def setUp(self):
+        warnings.simplefilter("ignore")
+        self.addCleanup(warnings.resetwarnings)
+
+    def test_compute_mix_matches_design(self):
+        for design in design_matrix():
+            with self.subTest(grade=design.concrete_grade, exposure=design.exposure_condition):
+                expected = design.compute_mix_design()
+                self.assertEqual(compute_mix(design.to_spec()).to_dict(), expected)
+
+    def test_core_leaves_design_untouched(self):
+        design = make_design()
+        spec = design.to_spec()
+        hash(spec)
+        before = dict(vars(design))
+        values = compute_stages(spec)
+        self.assertEqual(vars(design), before)
+        self.assertFalse(hasattr(design, "water_cement_ratio"))
+        with self.assertRaises(TypeError):
+            values["water_cement_ratio"] = 0.1
+
+    def test_spec_is_a_snapshot(self):
+        design = make_design()
+        spec = design.to_spec()
+        design.set_inputs(slump_mm=120)
+        self.assertEqual(spec.slump_mm, 50.0)
+        self.assertNotEqual(compute_mix(spec).water.mass_kg, design.compute_mix_design(compact=True).water.mass_kg)
+
+    def test_thread_pool_matches_serial(self):
+        specs = [design.to_spec() for design in design_matrix()]
+        expected = [compute_mix(spec).to_dict() for spec in specs]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(compute_mix, specs * 4))
+        self.assertEqual([result.to_dict() for result in results], expected * 4)
+
+    def test_shared_design_across_threads(self):
+        design = make_design(mineral_admixture=MineralAdmixture.FLY_ASH)
+        expected = make_design(mineral_admixture=MineralAdmixture.FLY_ASH).compute_mix_design()
+
+        def compute(moisture):
+            design.set_inputs(fine_aggregate_surface_moisture=moisture)
+            result = design.compute_mix_design(compact=True)
+            return result.adjustment("fine_surface_moisture") / result.fine_aggregate.mass_kg * 100
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            moistures = list(executor.map(compute, [2.0, 3.0] * 200))
+        # every result is internally consistent with one of the moisture readings
+        for moisture in moistures:
+            self.assertTrue(abs(moisture - 2.0) < 1e-9 or abs(moisture - 3.0) < 1e-9)
+        design.set_inputs(fine_aggregate_surface_moisture=2.0)
+        self.assertEqual(design.compute_mix_design(), expected)
+
+    def test_input_changed_during_compute_is_not_lost(self):
+        design = make_design()
+        writer = threading.Thread(target=design.set_inputs, kwargs={"fine_aggregate_surface_moisture": 5.0})
+
+        def sink(event):
+            if event.stage == "target_mean_strength":
+                writer.start()
+                writer.join(timeout=0.2)
+
+        design.trace_sink = sink
+        design.compute_mix_design()
+        writer.join()
+        design.trace_sink = None
+        result = design.compute_mix_design(compact=True)
+        self.assertAlmostEqual(result.adjustment("fine_surface_moisture"), result.fine_aggregate.mass_kg * 0.05)
+
+    def test_trace_matches_design_trace(self):
+        design = make_design(mineral_admixture=MineralAdmixture.FLY_ASH)
+        collector = TraceCollector()
+        design.trace_sink = collector
+        design.compute_mix_design()
+        events = []
+        compute_mix(design.to_spec(), trace=lambda stage, **values: events.append((stage, values)))
+        self.assertEqual(events, [(event.stage, event.values) for event in collector.events])
+
+    def test_design_survives_pickling(self):
+        design = make_design()
+        design.compute_mix_design()
+        restored = pickle.loads(pickle.dumps(design))
+        self.assertEqual(restored.compute_mix_design(), design.compute_mix_design())
+        self.assertEqual(restored.last_recomputed_stages, ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import sys
+import unittest
+from itertools import product
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    MaximumNominalSize,
+    ExposureCondition,
+    SpecificGravity,
+    FineAggregateZone,
+    Materials,
+)
+from civilutils.indian_standards.design_space import (
+    DESIGN_SPACE,
+    DESIGN_SPACE_AXES,
+    design_index,
+)
+
+
+class TestDesignSpace(unittest.TestCase):
+    def setUp(self):
+        self.sg_list = [
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ]
+
+    def test_covers_every_discrete_combination_once(self):
+        combinations = list(product(*(values for _, values in DESIGN_SPACE_AXES)))
+        self.assertEqual(len(DESIGN_SPACE), len(combinations))
+        indices = [design_index(*combination) for combination in combinations]
+        self.assertEqual(indices, list(range(len(DESIGN_SPACE))))
+
+    def test_entries_match_scalar_stages(self):
+        for grade, exposure, size, zone in product(ConcreteGrade, ExposureCondition, MaximumNominalSize, FineAggregateZone):
+            design = ConcreteMixDesign(
+                concrete_grade=grade,
+                exposure_condition=exposure,
+                specific_gravities=self.sg_list,
+                maximum_nominal_size=size,
+                fine_aggregate_zone=zone,
+            )
+            target = design._ConcreteMixDesign__calculate_target_mean_compressive_strength()
+            wcr = design._ConcreteMixDesign__calculate_water_cement_ratio_by_is456()
+            design._ConcreteMixDesign__calculate_water_content()
+            coarse, fine = design._ConcreteMixDesign__calculate_aggregate_content()
+
+            entry = DESIGN_SPACE[design_index(grade, exposure, size, zone, True, None, None)]
+            self.assertEqual(entry.target_mean_strength, target)
+            self.assertEqual(entry.water_cement_ratio, wcr)
+            self.assertEqual(entry.coarse_aggregate_proportion, coarse)
+            self.assertEqual(entry.fine_aggregate_proportion, fine)
+
+    def test_pumpable_uses_truthiness(self):
+        args = (ConcreteGrade.M20, ExposureCondition.MILD, MaximumNominalSize.SIZE_20, FineAggregateZone.ZONE_II)
+        self.assertEqual(design_index(*args, "yes", None, None), design_index(*args, True, None, None))
+
+    def test_invalid_member_raises(self):
+        with self.assertRaises(ValueError):
+            design_index("M20", ExposureCondition.MILD, MaximumNominalSize.SIZE_20,
+                         FineAggregateZone.ZONE_II, True, None, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
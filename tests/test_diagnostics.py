@@ -0,0 +1,103 @@
+import os
+import sys
+import unittest
+import warnings
+from itertools import product
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.batch import compute_mix_designs, validate_mix_designs
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ChemicalAdmixture,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+    MineralAdmixture,
+)
+from civilutils.indian_standards.diagnostics import (
+    HIGH_CEMENT_CONTENT,
+    LOW_CEMENT_CONTENT,
+    WATER_CEMENT_RATIO,
+    describe,
+    diagnose,
+    summarize,
+)
+
+SG = {
+    "cement_specific_gravity": 3.15,
+    "fine_aggregate_specific_gravity": 2.60,
+    "coarse_aggregate_specific_gravity": 2.70,
+    "water_specific_gravity": 1.00,
+    "admixture_specific_gravity": 1.145,
+}
+
+ROWS = list(product(ConcreteGrade, ExposureCondition, (None, ChemicalAdmixture.SUPERPLASTICIZER),
+                    (None, MineralAdmixture.FLY_ASH), (25.0, 50.0, 150.0)))
+SPECS = dict(
+    SG,
+    concrete_grade=[row[0] for row in ROWS],
+    exposure_condition=[row[1] for row in ROWS],
+    chemical_admixture=[row[2] for row in ROWS],
+    mineral_admixture=[row[3] for row in ROWS],
+    slump_mm=[row[4] for row in ROWS],
+)
+
+
+class TestBatchDiagnostics(unittest.TestCase):
+    def test_diagnostics_match_scalar_designs(self):
+        codes = compute_mix_designs(SPECS, diagnostics=True, maximum_cement_content=400.0)["diagnostics"]
+        self.assertEqual(codes.typecode, "B")
+        sg = [SpecificGravity(Materials[name[:-len("_specific_gravity")].upper()], value) for name, value in SG.items()]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for (grade, exposure, chemical, mineral, slump), code in zip(ROWS, codes):
+                design = ConcreteMixDesign(grade, exposure, sg, chemical_admixture=chemical, mineral_admixture=mineral,
+                                           slump_mm=slump, maximum_cement_content=400.0)
+                design.compute_mix_design()
+                with self.subTest(grade=grade, exposure=exposure, chemical=chemical, mineral=mineral, slump=slump):
+                    self.assertEqual(design.diagnostics, code)
+        self.assertTrue(any(code & LOW_CEMENT_CONTENT for code in codes))
+        self.assertTrue(any(code & HIGH_CEMENT_CONTENT for code in codes))
+
+    def test_validation_matches_computation(self):
+        validated = validate_mix_designs(SPECS, maximum_cement_content=400.0)
+        computed = compute_mix_designs(SPECS, diagnostics=True, maximum_cement_content=400.0)["diagnostics"]
+        self.assertEqual(validated, computed)
+        per_row = [400.0 if i % 2 else None for i in range(len(ROWS))]
+        codes = validate_mix_designs(SPECS, maximum_cement_content=per_row)
+        self.assertFalse(any(code & HIGH_CEMENT_CONTENT for code in codes[::2]))
+
+    def test_diagnostics_mode_does_not_warn(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            results = compute_mix_designs(SPECS, diagnostics=True)
+        self.assertEqual(caught, [])
+        with self.assertWarns(UserWarning):
+            plain = compute_mix_designs(SPECS)
+        self.assertNotIn("diagnostics", plain)
+        low_rows = sum(1 for code in results["diagnostics"] if code & LOW_CEMENT_CONTENT)
+        self.assertGreater(low_rows, 0)
+
+    def test_diagnose_flags_each_rule(self):
+        self.assertEqual(diagnose(False, 400.0, 0.0, 180.0, 450.0, 0.45), 0)
+        self.assertEqual(diagnose(True, 300.0, 0.0, 135.0, 450.0, 0.45), LOW_CEMENT_CONTENT)
+        self.assertEqual(diagnose(False, 460.0, 0.0, 180.0, 450.0, 0.45), HIGH_CEMENT_CONTENT)
+        self.assertEqual(diagnose(False, 460.0, 0.0, 180.0, None, 0.45), 0)
+        self.assertEqual(diagnose(False, 300.0, 50.0, 170.0, 450.0, 0.45), WATER_CEMENT_RATIO)
+
+    def test_describe_and_summarize(self):
+        self.assertEqual(describe(LOW_CEMENT_CONTENT | WATER_CEMENT_RATIO), ("low_cement_content", "water_cement_ratio"))
+        self.assertEqual(describe(0), ())
+        self.assertEqual(summarize([0, LOW_CEMENT_CONTENT, LOW_CEMENT_CONTENT | HIGH_CEMENT_CONTENT, 0]),
+                         {"low_cement_content": 2, "high_cement_content": 1, "water_cement_ratio": 0})
+
+    def test_invalid_maximum_column_raises(self):
+        with self.assertRaises(ValueError):
+            validate_mix_designs(SPECS, maximum_cement_content=[450.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
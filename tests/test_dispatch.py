@@ -0,0 +1,110 @@
+import os
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+)
+from civilutils.indian_standards.dispatch import (
+    DEFAULT_SCALE_RESOLUTION_KG,
+    BatchTicketer,
+    iter_batch_tickets,
+    split_into_loads,
+)
+from civilutils.indian_standards.results import COMPONENTS
+
+
+def make_design(**kwargs):
+    return ConcreteMixDesign(
+        concrete_grade=ConcreteGrade.M30,
+        exposure_condition=ExposureCondition.SEVERE,
+        specific_gravities=[
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ],
+        coarse_aggregate_water_absorption=0.5,
+        fine_aggregate_water_absorption=1.0,
+        **kwargs,
+    )
+
+
+class TestSplitIntoLoads(unittest.TestCase):
+    def test_equal_loads_within_capacity(self):
+        self.assertEqual(split_into_loads(16.0, 8.0), [8.0, 8.0])
+        loads = split_into_loads(17.0, 8.0)
+        self.assertEqual(len(loads), 3)
+        self.assertAlmostEqual(sum(loads), 17.0)
+        self.assertTrue(all(load <= 8.0 for load in loads))
+        self.assertEqual(split_into_loads(2.5, 7.0), [2.5])
+        self.assertEqual(split_into_loads(1e-10), [1e-10])
+
+    def test_invalid_volume_raises(self):
+        with self.assertRaises(ValueError):
+            split_into_loads(0.0)
+        with self.assertRaises(ValueError):
+            split_into_loads(5.0, 0.0)
+
+
+class TestBatchTickets(unittest.TestCase):
+    def test_tickets_are_rounded_to_scale_resolution(self):
+        tickets = list(iter_batch_tickets(make_design(), [{"pour_id": "P1", "volume_m3": 13.0}], truck_capacity_m3=7.0))
+        self.assertEqual([(t.pour_id, t.load_number, t.load_count) for t in tickets], [("P1", 1, 2), ("P1", 2, 2)])
+        for ticket in tickets:
+            for name, mass in ticket.batch_kg.items():
+                steps = mass / DEFAULT_SCALE_RESOLUTION_KG[name]
+                self.assertAlmostEqual(steps, round(steps), places=6)
+
+    def test_residuals_keep_cumulative_totals_exact(self):
+        ticketer = BatchTicketer(make_design(), truck_capacity_m3=6.0)
+        pours = [{"volume_m3": v} for v in (5.3, 7.7, 12.1, 3.3, 19.9) * 40]
+        tickets = list(ticketer.tickets(pours))
+        self.assertEqual(ticketer.tickets_issued, len(tickets))
+        for name in COMPONENTS:
+            batched = sum(t.batch_kg[name] for t in tickets)
+            self.assertAlmostEqual(batched, ticketer.batched_kg[name], places=6)
+            self.assertLessEqual(abs(ticketer.batched_kg[name] - ticketer.exact_kg[name]),
+                                 DEFAULT_SCALE_RESOLUTION_KG[name] / 2 + 1e-6)
+
+    def test_tickets_match_volume_design_without_moisture(self):
+        design = make_design()
+        ticket = next(iter_batch_tickets(design, [{"volume": "4.0"}], scale_resolution_kg=dict.fromkeys(COMPONENTS, 1e-6)))
+        expected = design.compute_mix_design_for_volume(4.0, compact=True)
+        self.assertAlmostEqual(ticket.batch_kg["cement"], expected.cement.mass_kg, places=5)
+        self.assertAlmostEqual(ticket.batch_kg["water"], expected.free_water_after_correction, places=5)
+
+    def test_pour_moisture_updates_design_incrementally(self):
+        design = make_design()
+        resolution = dict.fromkeys(COMPONENTS, 1e-6)
+        dry, wet = iter_batch_tickets(design, [
+            {"volume_m3": 6.0},
+            {"volume_m3": 6.0, "fine_aggregate_surface_moisture": "3.0"},
+        ], scale_resolution_kg=resolution)
+        self.assertEqual(design.last_recomputed_stages, ("moisture_correction",))
+        self.assertEqual(design.stage_recomputations["water_content"], 1)
+        self.assertEqual(design.stage_recomputations["moisture_correction"], 2)
+        self.assertGreater(wet.batch_kg["fine_aggregate"], dry.batch_kg["fine_aggregate"])
+        self.assertLess(wet.batch_kg["water"], dry.batch_kg["water"])
+        # water moved from the mixer water to the sand, total mass unchanged
+        self.assertAlmostEqual(sum(wet.batch_kg.values()), sum(dry.batch_kg.values()), places=3)
+
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(ValueError):
+            BatchTicketer(make_design(), truck_capacity_m3=0)
+        with self.assertRaises(ValueError):
+            BatchTicketer(make_design(), scale_resolution_kg={"steel": 1.0})
+        with self.assertRaises(ValueError):
+            list(iter_batch_tickets(make_design(), [{"pour_id": "P1"}]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import os
+import sys
+import unittest
+import warnings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    MaximumNominalSize,
+    MineralAdmixture,
+    ChemicalAdmixture,
+    ExposureCondition,
+    SpecificGravity,
+    FineAggregateZone,
+    Materials,
+    MIX_DESIGN_STAGES,
+)
+from civilutils.indian_standards.cache import MixDesignCache
+from civilutils.indian_standards.diagnostics import HIGH_CEMENT_CONTENT
+
+
+def sg_list(coarse=2.70):
+    return [
+        SpecificGravity(Materials.CEMENT, 3.15),
+        SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+        SpecificGravity(Materials.COARSE_AGGREGATE, coarse),
+        SpecificGravity(Materials.WATER, 1.00),
+        SpecificGravity(Materials.ADMIXTURE, 1.145),
+    ]
+
+
+BASE_INPUTS = dict(
+    concrete_grade=ConcreteGrade.M30,
+    exposure_condition=ExposureCondition.SEVERE,
+    maximum_nominal_size=MaximumNominalSize.SIZE_20,
+    fine_aggregate_zone=FineAggregateZone.ZONE_II,
+    is_pumpable=True,
+    chemical_admixture=ChemicalAdmixture.SUPERPLASTICIZER,
+    slump_mm=100.0,
+    coarse_aggregate_water_absorption=0.5,
+    fine_aggregate_water_absorption=1.0,
+)
+
+
+def compute(design):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return design.compute_mix_design()
+
+
+class TestIncrementalRecomputation(unittest.TestCase):
+    def make_design(self, **overrides):
+        inputs = dict(BASE_INPUTS, specific_gravities=sg_list())
+        inputs.update(overrides)
+        return ConcreteMixDesign(**inputs)
+
+    def test_first_computation_runs_every_stage(self):
+        design = self.make_design()
+        compute(design)
+        self.assertEqual(design.last_recomputed_stages, MIX_DESIGN_STAGES)
+
+    def test_unchanged_design_recomputes_nothing(self):
+        design = self.make_design()
+        first = compute(design)
+        second = compute(design)
+        self.assertEqual(design.last_recomputed_stages, ())
+        self.assertEqual(first, second)
+
+    def test_moisture_change_only_recomputes_correction(self):
+        design = self.make_design()
+        compute(design)
+        design.set_inputs(fine_aggregate_surface_moisture=2.5)
+        result = compute(design)
+        self.assertEqual(design.last_recomputed_stages, ("moisture_correction",))
+        self.assertEqual(result, compute(self.make_design(fine_aggregate_surface_moisture=2.5)))
+
+    def test_slump_change_recomputes_water_and_downstream(self):
+        design = self.make_design()
+        compute(design)
+        design.set_inputs(slump_mm=75)
+        result = compute(design)
+        self.assertEqual(design.last_recomputed_stages,
+                         ("water_content", "cement_content", "mix_quantities", "moisture_correction"))
+        self.assertEqual(result, compute(self.make_design(slump_mm=75.0)))
+
+    def test_single_stage_updates_dirty_stages(self):
+        design = self.make_design()
+        compute(design)
+        design.set_inputs(slump_mm=75)
+        design._ConcreteMixDesign__calculate_water_content()
+        self.assertNotIn("water_content", design._dirty_stages)
+        self.assertIn("cement_content", design._dirty_stages)
+        result = compute(design)
+        self.assertEqual(design.last_recomputed_stages, ("cement_content", "mix_quantities", "moisture_correction"))
+        self.assertEqual(result, compute(self.make_design(slump_mm=75.0)))
+        # an unreinforced ratio is not what compute_mix_design() uses, so it is recomputed
+        design._ConcreteMixDesign__calculate_water_cement_ratio_by_is456(reinforced=False)
+        self.assertIn("water_cement_ratio", design._dirty_stages)
+        self.assertEqual(compute(design), result)
+        self.assertIn("water_cement_ratio", design.last_recomputed_stages)
+
+    def test_attribute_assignment_invalidates(self):
+        design = self.make_design()
+        compute(design)
+        design.is_pumpable = False
+        result = compute(design)
+        self.assertIn("aggregate_proportions", design.last_recomputed_stages)
+        self.assertNotIn("water_content", design.last_recomputed_stages)
+        self.assertEqual(result, compute(self.make_design(is_pumpable=False)))
+
+    def test_incremental_matches_fresh_design_for_every_input(self):
+        changes = [
+            dict(concrete_grade=ConcreteGrade.M40),
+            dict(exposure_condition=ExposureCondition.MILD),
+            dict(maximum_nominal_size=MaximumNominalSize.SIZE_40),
+            dict(fine_aggregate_zone=FineAggregateZone.ZONE_IV),
+            dict(chemical_admixture=ChemicalAdmixture.PLASTICIZER),
+            dict(chemical_admixture_percentage=10.0),
+            dict(mineral_admixture=MineralAdmixture.FLY_ASH),
+            dict(mineral_admixture=MineralAdmixture.FLY_ASH, mineral_admixture_percentage=25.0),
+            dict(specific_gravities=sg_list(coarse=2.74)),
+            dict(coarse_aggregate_surface_moisture=1.0),
+            dict(table_version="IS 10262:2019"),
+        ]
+        for change in changes:
+            with self.subTest(change=change):
+                design = self.make_design()
+                compute(design)
+                design.set_inputs(**change)
+                self.assertEqual(compute(design), compute(self.make_design(**change)))
+
+    def test_admixture_change_resolves_default_percentage(self):
+        design = self.make_design(chemical_admixture_percentage=12.0)
+        design.set_inputs(chemical_admixture=ChemicalAdmixture.PLASTICIZER)
+        self.assertEqual(design.chemical_admixture_percentage, ChemicalAdmixture.PLASTICIZER.default_percentage)
+        design.set_inputs(chemical_admixture=None)
+        self.assertEqual(design.chemical_admixture_percentage, 0.0)
+
+    def test_setting_equal_value_keeps_stages_valid(self):
+        design = self.make_design()
+        compute(design)
+        design.set_inputs(slump_mm=100)
+        compute(design)
+        self.assertEqual(design.last_recomputed_stages, ())
+
+    def test_unknown_input_raises(self):
+        with self.assertRaises(ValueError):
+            self.make_design().set_inputs(colour="grey")
+
+    def test_counters_accumulate(self):
+        design = self.make_design()
+        compute(design)
+        for moisture in (1.0, 2.0, 3.0):
+            design.set_inputs(fine_aggregate_surface_moisture=moisture)
+            compute(design)
+        self.assertEqual(design.stage_recomputations["moisture_correction"], 4)
+        self.assertEqual(design.stage_recomputations["target_mean_strength"], 1)
+
+    def test_invalidate_recomputes_every_stage(self):
+        design = self.make_design()
+        compute(design)
+        design.invalidate()
+        compute(design)
+        self.assertEqual(design.last_recomputed_stages, MIX_DESIGN_STAGES)
+
+    def test_cache_hit_leaves_stages_valid(self):
+        cache = MixDesignCache()
+        compute(self.make_design(result_cache=cache))
+        design = self.make_design(result_cache=cache)
+        compute(design)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(design.last_recomputed_stages, ())
+        design.set_inputs(coarse_aggregate_surface_moisture=0.5)
+        compute(design)
+        self.assertEqual(design.last_recomputed_stages, ("moisture_correction",))
+
+    def test_specific_gravity_changed_in_place(self):
+        expected = compute(self.make_design(specific_gravities=sg_list(coarse=2.9)))
+        for cache in (None, MixDesignCache()):
+            with self.subTest(cache=cache):
+                gravities = sg_list()
+                design = self.make_design(specific_gravities=gravities, result_cache=cache)
+                compute(design)
+                gravities[2].value = 2.9
+                self.assertEqual(compute(design), expected)
+                self.assertEqual(design.last_recomputed_stages, ("mix_quantities", "moisture_correction"))
+                if cache is not None:
+                    fresh = self.make_design(specific_gravities=sg_list(coarse=2.9), result_cache=cache)
+                    self.assertEqual(compute(fresh), expected)
+                    self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_maximum_cement_content_recomputes_diagnostics(self):
+        design = self.make_design()
+        compute(design)
+        design.set_inputs(maximum_cement_content=300.0)
+        compute(design)
+        self.assertEqual(design.last_recomputed_stages, ("cement_content", "mix_quantities", "moisture_correction"))
+        self.assertEqual(design.diagnostics, HIGH_CEMENT_CONTENT)
+
+
+if __name__ == "__main__":
+    unittest.main()
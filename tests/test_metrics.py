@@ -0,0 +1,110 @@
+import os
+import sys
+import threading
+import unittest
+import warnings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ChemicalAdmixture,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+    MIX_DESIGN_STAGES,
+)
+from civilutils.indian_standards.metrics import (
+    LOW_CEMENT_CONTENT_WARNING,
+    MetricsRegistry,
+    active_registry,
+    disable_metrics,
+    enable_metrics,
+)
+
+
+def make_design(**kwargs):
+    return ConcreteMixDesign(
+        concrete_grade=ConcreteGrade.M20,
+        exposure_condition=ExposureCondition.MILD,
+        specific_gravities=[
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ],
+        **kwargs,
+    )
+
+
+class TestStageMetrics(unittest.TestCase):
+    def tearDown(self):
+        disable_metrics()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(active_registry())
+
+    def test_records_stages_computations_and_warnings(self):
+        registry = enable_metrics()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            design = make_design(chemical_admixture=ChemicalAdmixture.SUPERPLASTICIZER)
+            design.compute_mix_design()
+            design.set_inputs(fine_aggregate_surface_moisture=1.0)
+            design.compute_mix_design()
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot["computations"]["calls"], 2)
+        self.assertEqual(snapshot["stages"]["target_mean_strength"]["calls"], 1)
+        self.assertEqual(snapshot["stages"]["moisture_correction"]["calls"], 2)
+        self.assertEqual(set(snapshot["stages"]), set(MIX_DESIGN_STAGES))
+        for stage in snapshot["stages"].values():
+            self.assertGreaterEqual(stage["seconds"], stage["max_seconds"])
+        self.assertEqual(snapshot["warnings"], {LOW_CEMENT_CONTENT_WARNING: 1})
+
+    def test_disable_stops_recording(self):
+        registry = enable_metrics()
+        disable_metrics()
+        make_design().compute_mix_design()
+        self.assertEqual(registry.snapshot()["computations"]["calls"], 0)
+
+    def test_reset(self):
+        registry = enable_metrics(MetricsRegistry())
+        make_design().compute_mix_design()
+        registry.reset()
+        self.assertEqual(registry.snapshot(), {"stages": {}, "warnings": {}, "computations": {"calls": 0, "seconds": 0.0}})
+
+    def test_prometheus_export(self):
+        registry = MetricsRegistry()
+        registry.record_stage("water_content", 0.5)
+        registry.record_stage("water_content", 0.25)
+        registry.record_warning(LOW_CEMENT_CONTENT_WARNING)
+        registry.record_computation(1.0)
+        text = registry.to_prometheus()
+        self.assertIn("# TYPE civilutils_stage_calls_total counter", text)
+        self.assertIn('civilutils_stage_calls_total{stage="water_content"} 2', text)
+        self.assertIn('civilutils_stage_seconds_total{stage="water_content"} 0.75', text)
+        self.assertIn('civilutils_stage_seconds_max{stage="water_content"} 0.5', text)
+        self.assertIn('civilutils_warnings_total{warning="low_cement_content"} 1', text)
+        self.assertIn("civilutils_mix_design_computations_total 1", text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_concurrent_recording(self):
+        registry = MetricsRegistry()
+
+        def work():
+            for _ in range(1000):
+                registry.record_stage("cement_content", 0.001)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(registry.snapshot()["stages"]["cement_content"]["calls"], 4000)
+
+
+if __name__ == "__main__":
+    unittest.main()
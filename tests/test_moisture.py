@@ -0,0 +1,98 @@
+import asyncio
+import os
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+    MineralAdmixture,
+)
+from civilutils.indian_standards.moisture import MoistureCorrector
+
+
+def make_design(**kwargs):
+    return ConcreteMixDesign(
+        concrete_grade=ConcreteGrade.M30,
+        exposure_condition=ExposureCondition.SEVERE,
+        specific_gravities=[
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ],
+        coarse_aggregate_water_absorption=0.5,
+        fine_aggregate_water_absorption=1.0,
+        **kwargs,
+    )
+
+
+READINGS = [
+    {"probe": "sand", "fine_aggregate_surface_moisture": 2.4},
+    {"probe": "stone", "coarse_aggregate_surface_moisture": "0.3"},
+    {"probe": "sand", "fine_aggregate_surface_moisture": 3.1},
+    {"probe": "sand", "fine_aggregate_surface_moisture": None},
+]
+
+
+class TestMoistureCorrector(unittest.TestCase):
+    def test_matches_recomputed_design(self):
+        design = make_design(mineral_admixture=MineralAdmixture.FLY_ASH)
+        corrector = MoistureCorrector(design)
+        reference = make_design(mineral_admixture=MineralAdmixture.FLY_ASH)
+        moisture = {}
+        for reading, weights in zip(READINGS, corrector.stream(READINGS)):
+            self.assertIs(weights.reading, reading)
+            moisture.update({k: float(v) for k, v in reading.items() if k != "probe" and v is not None})
+            reference.set_inputs(**moisture)
+            result = reference.compute_mix_design(compact=True)
+            self.assertEqual(weights.water_kg, result.free_water_after_correction)
+            self.assertEqual(weights.fine_aggregate_kg, result.fine_aggregate.mass_kg
+                             - result.adjustment("fine_absorbed_water") + result.adjustment("fine_surface_moisture"))
+            self.assertEqual(weights.coarse_aggregate_kg, result.coarse_aggregate.mass_kg
+                             - result.adjustment("coarse_absorbed_water") + result.adjustment("coarse_surface_moisture"))
+        self.assertEqual(corrector.moisture["fine_aggregate_surface_moisture"], 3.1)
+        self.assertEqual(corrector.readings, len(READINGS))
+
+    def test_readings_do_not_recompute_design(self):
+        design = make_design()
+        corrector = MoistureCorrector(design)
+        before = dict(design.stage_recomputations)
+        for _ in corrector.stream(READINGS * 100):
+            pass
+        self.assertEqual(design.stage_recomputations, before)
+
+    def test_batch_volume_scales_weights(self):
+        per_m3 = MoistureCorrector(make_design()).correct({"fine_aggregate_surface_moisture": 2.0})
+        batch = MoistureCorrector(make_design(), batch_volume_m3=3.0).correct({"fine_aggregate_surface_moisture": 2.0})
+        self.assertAlmostEqual(batch.water_kg, per_m3.water_kg * 3.0)
+        self.assertAlmostEqual(batch.fine_aggregate_kg, per_m3.fine_aggregate_kg * 3.0)
+
+    def test_async_stream(self):
+        async def feed():
+            for reading in READINGS:
+                await asyncio.sleep(0)
+                yield reading
+
+        async def collect():
+            return [weights async for weights in MoistureCorrector(make_design()).astream(feed())]
+
+        expected = list(MoistureCorrector(make_design()).stream(READINGS))
+        self.assertEqual(asyncio.run(collect()), expected)
+
+    def test_invalid_input_raises(self):
+        with self.assertRaises(ValueError):
+            MoistureCorrector(make_design(), batch_volume_m3=0)
+        with self.assertRaises(ValueError):
+            MoistureCorrector(make_design()).correct({"fine_aggregate_surface_moisture": "wet"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import sys
+import unittest
+import warnings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ChemicalAdmixture,
+    MineralAdmixture,
+    MaximumNominalSize,
+    SpecificGravity,
+    Materials,
+)
+from civilutils.indian_standards.optimize import optimize_mix_design
+
+
+SPECS = {
+    "concrete_grade": "M30",
+    "exposure_condition": "Severe",
+    "cement_specific_gravity": 3.15,
+    "fine_aggregate_specific_gravity": 2.60,
+    "coarse_aggregate_specific_gravity": 2.70,
+    "water_specific_gravity": 1.00,
+    "admixture_specific_gravity": 1.145,
+}
+
+PRICES = {
+    "cement": 7.5,
+    "fly_ash": 1.8,
+    "admixture": 95.0,
+    "coarse_aggregate": 0.9,
+    "fine_aggregate": 1.1,
+}
+
+SG_LIST = [
+    SpecificGravity(Materials.CEMENT, 3.15),
+    SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+    SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+    SpecificGravity(Materials.WATER, 1.00),
+    SpecificGravity(Materials.ADMIXTURE, 1.145),
+]
+
+
+def cost_of(spec):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = ConcreteMixDesign(specific_gravities=SG_LIST, **spec).compute_mix_design(compact=True)
+    return sum(result.component(name).mass_kg * price for name, price in PRICES.items()), result
+
+
+class TestOptimizeMixDesign(unittest.TestCase):
+    def test_best_candidate_is_cheapest_and_feasible(self):
+        outcome = optimize_mix_design(SPECS, PRICES, minimum_slump_mm=100, maximum_cement_content=400)
+        self.assertIsNotNone(outcome.best)
+        self.assertGreater(outcome.evaluated, outcome.feasible)
+        costs = [outcome.best.cost] + [c.cost for c in outcome.alternatives]
+        self.assertEqual(costs, sorted(costs))
+        self.assertEqual(len(outcome.alternatives), 4)
+        self.assertLessEqual(outcome.best.result["cement_mass_kg"], 400)
+        self.assertEqual(outcome.best.spec["slump_mm"], 100.0)
+
+    def test_candidate_spec_reproduces_scalar_design(self):
+        outcome = optimize_mix_design(SPECS, PRICES, minimum_slump_mm=100)
+        for candidate in (outcome.best,) + outcome.alternatives:
+            cost, result = cost_of(candidate.spec)
+            self.assertAlmostEqual(candidate.cost, cost, places=9)
+            self.assertEqual(candidate.result["cement_mass_kg"], result.cement.mass_kg)
+
+    def test_fixed_inputs_are_not_searched(self):
+        specs = dict(SPECS, is_pumpable=True, maximum_nominal_size=MaximumNominalSize.SIZE_20)
+        outcome = optimize_mix_design(specs, PRICES, alternatives=50)
+        for candidate in (outcome.best,) + outcome.alternatives:
+            self.assertTrue(candidate.spec["is_pumpable"])
+            self.assertEqual(candidate.spec["maximum_nominal_size"], MaximumNominalSize.SIZE_20)
+
+    def test_search_space_override(self):
+        outcome = optimize_mix_design(SPECS, PRICES, search={
+            "chemical_admixture": [None],
+            "mineral_admixture": ["FLY_ASH"],
+            "mineral_admixture_percentage": (20.0,),
+        })
+        self.assertIsNone(outcome.best.spec["chemical_admixture"])
+        self.assertEqual(outcome.best.spec["mineral_admixture"], MineralAdmixture.FLY_ASH)
+        self.assertEqual(outcome.best.spec["mineral_admixture_percentage"], 20.0)
+
+    def test_percentages_are_pruned_when_irrelevant(self):
+        outcome = optimize_mix_design(SPECS, PRICES, search={
+            "chemical_admixture": [ChemicalAdmixture.PLASTICIZER],
+            "mineral_admixture": [None],
+        })
+        # 3 nominal sizes x 2 pumpability choices, one percentage each
+        self.assertEqual(outcome.evaluated, 6)
+
+    def test_infeasible_constraints_return_no_candidate(self):
+        outcome = optimize_mix_design(SPECS, PRICES, maximum_cement_content=100)
+        self.assertIsNone(outcome.best)
+        self.assertEqual(outcome.alternatives, ())
+        self.assertEqual(outcome.feasible, 0)
+
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(ValueError):
+            optimize_mix_design(SPECS, {"steel": 60.0})
+        with self.assertRaises(ValueError):
+            optimize_mix_design(SPECS, PRICES, search={"slump_mm": (100,)})
+        with self.assertRaises(ValueError):
+            optimize_mix_design(SPECS, PRICES, search={"chemical_admixture": ["Retarder"]})
+        with self.assertRaises(ValueError):
+            optimize_mix_design(dict(SPECS, concrete_grade=None), PRICES)
+
+
+if __name__ == "__main__":
+    unittest.main()
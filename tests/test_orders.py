@@ -0,0 +1,131 @@
+import os
+import sys
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+import warnings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+)
+from civilutils.indian_standards.orders import (
+    OrderResultWriter,
+    iter_order_designs,
+    parse_order,
+    read_order_rows,
+)
+from civilutils.cli import main
+
+DEFAULTS = {
+    "cement_specific_gravity": 3.15,
+    "fine_aggregate_specific_gravity": 2.60,
+    "coarse_aggregate_specific_gravity": 2.70,
+    "water_specific_gravity": 1.00,
+    "admixture_specific_gravity": 1.145,
+}
+
+ORDERS_CSV = (
+    "order_id,grade,exposure,volume,slump,fine_aggregate_surface_moisture\n"
+    "A1,M25,Severe,6.5,75,2.0\n"
+    "A2,M30,VERY_SEVERE,8,,\n"
+    "A3,M20,Moderate,,100,1.5\n"
+)
+
+
+class TestOrders(unittest.TestCase):
+    def test_results_match_compute_mix_design_for_volume(self):
+        rows = list(read_order_rows(io.StringIO(ORDERS_CSV)))
+        results = list(iter_order_designs(rows, defaults=DEFAULTS, chunk_size=2))
+        self.assertEqual([r["order_id"] for r in results], ["A1", "A2", "A3"])
+
+        sg_list = [
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ]
+        design = ConcreteMixDesign(
+            concrete_grade=ConcreteGrade.M25,
+            exposure_condition=ExposureCondition.SEVERE,
+            specific_gravities=sg_list,
+            slump_mm=75.0,
+            fine_aggregate_surface_moisture=2.0,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = design.compute_mix_design_for_volume(6.5)
+        first = results[0]
+        self.assertEqual(first["volume_m3"], 6.5)
+        for name, comp in expected["mix_for_volume_m3"]["components"].items():
+            self.assertEqual(first[f"{name}_mass_kg"], comp["mass_kg"])
+            self.assertEqual(first[f"{name}_volume_m3"], comp["volume_m3"])
+        for name, value in expected["aggregate_adjustments_kg"].items():
+            self.assertEqual(first[name], value)
+        # rows without a volume default to 1 m^3
+        self.assertEqual(results[2]["volume_m3"], 1.0)
+
+    def test_parse_order_rejects_invalid_values(self):
+        with self.assertRaises(ValueError):
+            parse_order({"grade": "M99"})
+        with self.assertRaises(ValueError):
+            parse_order({"grade": "M20", "volume": "0"})
+        with self.assertRaises(ValueError):
+            parse_order({"pumpable": "maybe"})
+
+    def test_jsonl_writer_writes_enum_values(self):
+        out = io.StringIO()
+        writer = OrderResultWriter(out, "jsonl")
+        rows = [{"grade": "M25", "exposure": "Mild", "volume": 2}]
+        for row in iter_order_designs(rows, defaults=DEFAULTS):
+            writer.write(row)
+        record = json.loads(out.getvalue())
+        self.assertEqual(record["grade"], "M25")
+        self.assertEqual(writer.rows_written, 1)
+
+    def test_cli_batch_csv_to_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "orders.csv")
+            target = os.path.join(tmp, "designs.jsonl")
+            with open(source, "w") as fh:
+                fh.write(ORDERS_CSV)
+            argv = ["batch", source, "-o", target]
+            for name, value in DEFAULTS.items():
+                argv += ["--set", f"{name}={value}"]
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                self.assertEqual(main(argv), 0)
+            with open(target) as fh:
+                records = [json.loads(line) for line in fh]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[1]["order_id"], "A2")
+        self.assertGreater(records[1]["cement_mass_kg"], 0.0)
+
+    def test_cli_batch_reports_missing_specific_gravities(self):
+        orders = "grade,exposure," + ",".join(DEFAULTS) + "\n"
+        orders += "M25,Severe," + ",".join(str(value) for value in DEFAULTS.values()) + "\n"
+        orders += "M30,Severe,,2.6,2.7,1.0,1.145\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "orders.csv")
+            with open(source, "w") as fh:
+                fh.write(orders)
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr), warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                with self.assertRaises(SystemExit) as raised:
+                    main(["batch", source, "-o", os.path.join(tmp, "designs.jsonl")])
+        self.assertEqual(raised.exception.code, 2)
+        self.assertIn("order row 2: missing cement_specific_gravity", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    MaximumNominalSize,
+    MineralAdmixture,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+)
+from civilutils.indian_standards.cache import MixDesignCache
+from civilutils.indian_standards.results import COMPONENTS, VOLUME_COLUMNS, MixResult
+
+
+class TestMixResult(unittest.TestCase):
+    def setUp(self):
+        self.sg_list = [
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ]
+        self.design = ConcreteMixDesign(
+            concrete_grade=ConcreteGrade.M30,
+            exposure_condition=ExposureCondition.SEVERE,
+            specific_gravities=self.sg_list,
+            maximum_nominal_size=MaximumNominalSize.SIZE_20,
+            mineral_admixture=MineralAdmixture.FLY_ASH,
+            fine_aggregate_surface_moisture=1.5,
+        )
+
+    def test_compact_result_matches_dict(self):
+        result = self.design.compute_mix_design(compact=True)
+        self.assertIsInstance(result, MixResult)
+        as_dict = self.design.compute_mix_design()
+        self.assertEqual(result.to_dict(), as_dict)
+        components = as_dict["mix_per_m3"]["components"]
+        for comp in result.components:
+            self.assertEqual(comp.mass_kg, components[comp.name]["mass_kg"])
+            self.assertEqual(comp.volume_m3, components[comp.name]["volume_m3"])
+        self.assertEqual(result.water_cement_ratio, self.design.water_cement_ratio)
+        self.assertEqual(result.target_mean_strength, self.design.target_mean_compressive_strength)
+
+    def test_result_is_slotted(self):
+        result = self.design.compute_mix_design(compact=True)
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertFalse(hasattr(result.cement, "__dict__"))
+
+    def test_scaled_result_is_a_view(self):
+        base = self.design.compute_mix_design(compact=True)
+        scaled = base.scaled(4.0)
+        self.assertIs(scaled.values, base.values)
+        self.assertEqual(scaled.cement.mass_kg, base.cement.mass_kg * 4.0)
+        self.assertEqual(scaled.cement.specific_gravity, base.cement.specific_gravity)
+        self.assertEqual(scaled.coarse_aggregate_proportion, base.coarse_aggregate_proportion)
+        self.assertEqual(scaled.to_dict(), self.design.compute_mix_design_for_volume(4.0))
+        with self.assertRaises(ValueError):
+            base.scaled(0)
+
+    def test_volume_method_returns_compact_view(self):
+        scaled = self.design.compute_mix_design_for_volume(2.5, compact=True)
+        self.assertEqual(scaled.volume_m3, 2.5)
+        values = scaled.as_array()
+        self.assertEqual(values[3 * COMPONENTS.index("water")], scaled.water.mass_kg)
+
+    def test_cached_compact_results_are_copies(self):
+        design = ConcreteMixDesign(
+            concrete_grade=ConcreteGrade.M30,
+            exposure_condition=ExposureCondition.SEVERE,
+            specific_gravities=self.sg_list,
+            result_cache=MixDesignCache(),
+        )
+        first = design.compute_mix_design(compact=True)
+        first.values[0] = -1.0
+        second = design.compute_mix_design(compact=True)
+        self.assertNotEqual(second.cement.mass_kg, -1.0)
+
+    def test_volumes_method_matches_per_volume_results(self):
+        volumes = [0.5, 2.5, 7.25]
+        columns = self.design.compute_mix_design_for_volumes(volumes)
+        self.assertEqual(tuple(columns), VOLUME_COLUMNS)
+        self.assertEqual(list(columns["volume_m3"]), volumes)
+        for i, volume in enumerate(volumes):
+            expected = self.design.compute_mix_design_for_volume(volume)
+            for name, comp in expected["mix_for_volume_m3"]["components"].items():
+                self.assertEqual(columns[f"{name}_mass_kg"][i], comp["mass_kg"])
+                self.assertEqual(columns[f"{name}_volume_m3"][i], comp["volume_m3"])
+            for name, value in expected["aggregate_adjustments_kg"].items():
+                self.assertEqual(columns[name][i], value)
+
+    def test_volumes_method_computes_base_design_once(self):
+        self.design.compute_mix_design_for_volumes([1.0] * 100)
+        self.assertEqual(self.design.stage_recomputations["target_mean_strength"], 1)
+        self.assertEqual(len(self.design.compute_mix_design_for_volumes([])["cement_mass_kg"]), 0)
+        with self.assertRaises(ValueError):
+            self.design.compute_mix_design_for_volumes([1.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
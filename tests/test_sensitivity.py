@@ -0,0 +1,122 @@
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards import design_space
+from civilutils.indian_standards.batch import RESULT_COLUMNS, compute_mix_designs, design_spec, resolve_design_entry
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ChemicalAdmixture,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+    MineralAdmixture,
+)
+from civilutils.indian_standards.design_space import CONTINUOUS_INPUTS
+from civilutils.indian_standards.sensitivity import compute_sensitivities
+
+
+def make_design(**kwargs):
+    return ConcreteMixDesign(
+        concrete_grade=ConcreteGrade.M30,
+        exposure_condition=ExposureCondition.SEVERE,
+        specific_gravities=[
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ],
+        slump_mm=75,
+        coarse_aggregate_water_absorption=0.5,
+        fine_aggregate_water_absorption=1.0,
+        fine_aggregate_surface_moisture=2.0,
+        **kwargs,
+    )
+
+
+def smooth_evaluate(entry, inputs):
+    """evaluate_entry() with rounding disabled."""
+    with mock.patch.object(design_space, "round", lambda value, digits=None: value, create=True), \
+            mock.patch.object(design_space, "math", types.SimpleNamespace(floor=lambda value: value)):
+        return dict(zip(RESULT_COLUMNS, design_space.evaluate_entry(entry, *(inputs[n] for n in CONTINUOUS_INPUTS))))
+
+
+def batch_values(design):
+    """Results of the design computed through design_spec() and the batch engine."""
+    results = compute_mix_designs({name: [value] for name, value in design_spec(design).items()})
+    return {name: column[0] for name, column in results.items()}
+
+
+class TestSensitivities(unittest.TestCase):
+    def test_values_match_compute_mix_design(self):
+        design = make_design()
+        sensitivity = compute_sensitivities(design)
+        result = design.compute_mix_design(compact=True)
+        self.assertEqual(sensitivity.values["cement_mass_kg"], result.cement.mass_kg)
+        self.assertEqual(sensitivity.values["free_water_after_correction"], result.free_water_after_correction)
+        self.assertEqual(set(sensitivity.jacobian["water_mass_kg"]), set(CONTINUOUS_INPUTS))
+
+    def test_moisture_derivatives_are_exact(self):
+        sensitivity = compute_sensitivities(make_design())
+        fine = sensitivity.values["fine_aggregate_mass_kg"]
+        free_water = sensitivity.jacobian["free_water_after_correction"]
+        # 1 % surface moisture on the sand takes 1 % of the sand mass from the mixer water
+        self.assertAlmostEqual(free_water["fine_aggregate_surface_moisture"], -fine * 0.01)
+        self.assertAlmostEqual(free_water["fine_aggregate_water_absorption"], fine * 0.01)
+        self.assertEqual(sensitivity.jacobian["cement_mass_kg"]["fine_aggregate_surface_moisture"], 0.0)
+
+    def test_matches_finite_differences_of_unrounded_pipeline(self):
+        for kwargs in ({}, {"mineral_admixture": MineralAdmixture.FLY_ASH},
+                       {"chemical_admixture": ChemicalAdmixture.SUPERPLASTICIZER}):
+            design = make_design(**kwargs)
+            sensitivity = compute_sensitivities(design)
+            _, entry = resolve_design_entry(design_spec(design))
+            for name in CONTINUOUS_INPUTS:
+                step = abs(sensitivity.inputs[name]) * 1e-6 or 1e-6
+                up = dict(sensitivity.inputs, **{name: sensitivity.inputs[name] + step})
+                down = dict(sensitivity.inputs, **{name: sensitivity.inputs[name] - step})
+                high, low = smooth_evaluate(entry, up), smooth_evaluate(entry, down)
+                for output in RESULT_COLUMNS:
+                    expected = (high[output] - low[output]) / (2 * step)
+                    # the closed form is evaluated at the rounded point
+                    with self.subTest(design=kwargs, input=name, output=output):
+                        self.assertAlmostEqual(sensitivity.jacobian[output][name], expected,
+                                               delta=abs(expected) * 0.01 + 1e-6)
+
+    def test_slump_adjustment_is_carried(self):
+        design = make_design()
+        design.set_inputs(slump_mm=100, slump_adjustment_pct_per_25mm=0.05)
+        sensitivity = compute_sensitivities(design)
+        result = design.compute_mix_design(compact=True)
+        self.assertEqual(result.water.mass_kg, 205)
+        batch = batch_values(design)
+        for output in RESULT_COLUMNS:
+            self.assertEqual(sensitivity.values[output], batch[output])
+        self.assertEqual(sensitivity.values["water_mass_kg"], result.water.mass_kg)
+        self.assertEqual(sensitivity.values["free_water_after_correction"], result.free_water_after_correction)
+        self.assertAlmostEqual(sensitivity.jacobian["water_mass_kg"]["slump_mm"], 186 * 0.05 / 25)
+
+    def test_clamped_cement_has_no_slump_sensitivity(self):
+        design = make_design(chemical_admixture=ChemicalAdmixture.SUPERPLASTICIZER)
+        design.set_inputs(concrete_grade=ConcreteGrade.M20, exposure_condition=ExposureCondition.MILD, slump_mm=50)
+        sensitivity = compute_sensitivities(design)
+        self.assertEqual(sensitivity.values["cement_mass_kg"], 300.0)
+        self.assertEqual(sensitivity.jacobian["cement_mass_kg"]["slump_mm"], 0.0)
+        self.assertGreater(sensitivity.jacobian["water_mass_kg"]["slump_mm"], 0.0)
+
+    def test_outputs_filter_and_validation(self):
+        sensitivity = compute_sensitivities(make_design(), outputs=("water_mass_kg",))
+        self.assertEqual(list(sensitivity.jacobian), ["water_mass_kg"])
+        with self.assertRaises(ValueError):
+            compute_sensitivities(make_design(), outputs=("steel_mass_kg",))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+import asyncio
+import json
+import os
+import sys
+import unittest
+import warnings
+from unittest import mock
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.batch import compute_mix_designs
+from civilutils.indian_standards.metrics import disable_metrics, enable_metrics
+from civilutils import server as server_module
+from civilutils.server import MixDesignServer
+
+SPEC = {
+    "concrete_grade": "M30",
+    "exposure_condition": "Severe",
+    "cement_specific_gravity": 3.15,
+    "fine_aggregate_specific_gravity": 2.60,
+    "coarse_aggregate_specific_gravity": 2.70,
+    "water_specific_gravity": 1.00,
+    "admixture_specific_gravity": 1.145,
+}
+
+
+async def request(reader, writer, method, path, payload=None, close=False):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    head = f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n"
+    if close:
+        head += "Connection: close\r\n"
+    writer.write(head.encode() + b"\r\n" + body)
+    await writer.drain()
+    status_line, _, rest = (await reader.readuntil(b"\r\n\r\n")).decode().partition("\r\n")
+    headers = dict(line.split(": ", 1) for line in rest.strip().split("\r\n"))
+    data = await reader.readexactly(int(headers["Content-Length"]))
+    return int(status_line.split()[1]), headers, data
+
+
+class TestMixDesignServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = MixDesignServer(port=0, batch_window=0.01)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+        disable_metrics()
+
+    async def connect(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        self.addAsyncCleanup(self._close, writer)
+        return reader, writer
+
+    @staticmethod
+    async def _close(writer):
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def test_design_matches_batch_engine(self):
+        reader, writer = await self.connect()
+        status, _, data = await request(reader, writer, "POST", "/mix-design", SPEC)
+        self.assertEqual(status, 200)
+        result = json.loads(data)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = compute_mix_designs(SPEC)
+        self.assertEqual(result["cement_mass_kg"], expected["cement_mass_kg"][0])
+        self.assertEqual(result["water_cement_ratio"], expected["water_cement_ratio"][0])
+        self.assertEqual(result["concrete_grade"], "M30")
+
+    async def test_volume_endpoint_scales_quantities(self):
+        reader, writer = await self.connect()
+        _, _, per_m3 = await request(reader, writer, "POST", "/mix-design", SPEC)
+        status, _, data = await request(reader, writer, "POST", "/mix-design/volume", dict(SPEC, volume_m3=2.5))
+        self.assertEqual(status, 200)
+        per_m3, scaled = json.loads(per_m3), json.loads(data)
+        self.assertEqual(scaled["volume_m3"], 2.5)
+        self.assertAlmostEqual(scaled["cement_mass_kg"], per_m3["cement_mass_kg"] * 2.5)
+        self.assertEqual(scaled["water_cement_ratio"], per_m3["water_cement_ratio"])
+
+    async def test_concurrent_identical_requests_are_coalesced(self):
+        connections = [await self.connect() for _ in range(20)]
+        responses = await asyncio.gather(*(
+            request(reader, writer, "POST", "/mix-design", SPEC) for reader, writer in connections
+        ))
+        self.assertEqual({data for _, _, data in responses}, {responses[0][2]})
+        self.assertEqual(self.server.counters["designs"], 1)
+        self.assertEqual(self.server.counters["coalesced"], 19)
+
+    async def test_burst_is_evaluated_as_one_batch(self):
+        grades = ("M20", "M25", "M30", "M35", "M40")
+        connections = [await self.connect() for _ in grades]
+        responses = await asyncio.gather(*(
+            request(reader, writer, "POST", "/mix-design", dict(SPEC, concrete_grade=grade))
+            for grade, (reader, writer) in zip(grades, connections)
+        ))
+        self.assertEqual([json.loads(data)["concrete_grade"] for _, _, data in responses], list(grades))
+        self.assertEqual(self.server.counters["batches"], 1)
+        self.assertEqual(self.server.counters["designs"], len(grades))
+
+    async def test_keep_alive_and_close(self):
+        reader, writer = await self.connect()
+        for _ in range(3):
+            status, headers, _ = await request(reader, writer, "GET", "/health")
+            self.assertEqual(status, 200)
+            self.assertEqual(headers["Connection"], "keep-alive")
+        _, headers, _ = await request(reader, writer, "GET", "/health", close=True)
+        self.assertEqual(headers["Connection"], "close")
+        self.assertEqual(await reader.read(), b"")
+        self.assertEqual(self.server.counters["connections"], 1)
+
+    async def test_errors(self):
+        reader, writer = await self.connect()
+        status, _, data = await request(reader, writer, "POST", "/mix-design", dict(SPEC, concrete_grade="M99"))
+        self.assertEqual(status, 400)
+        self.assertIn("error", json.loads(data))
+        status, _, _ = await request(reader, writer, "POST", "/mix-design/volume", SPEC)
+        self.assertEqual(status, 400)
+        status, _, _ = await request(reader, writer, "POST", "/mix-design", dict(SPEC, volume_m3=-1))
+        self.assertEqual(status, 400)
+        status, _, _ = await request(reader, writer, "GET", "/mix-design")
+        self.assertEqual(status, 405)
+        status, _, _ = await request(reader, writer, "GET", "/nowhere")
+        self.assertEqual(status, 404)
+        # the connection survives client errors
+        status, _, _ = await request(reader, writer, "GET", "/health")
+        self.assertEqual(status, 200)
+        self.assertEqual(self.server.counters["errors"], 5)
+
+    async def test_invalid_numbers_are_rejected_before_batching(self):
+        payloads = [dict(SPEC, slump_mm="abc"), dict(SPEC, water_specific_gravity=0), dict(SPEC, slump_mm=True), SPEC]
+        connections = [await self.connect() for _ in payloads]
+        responses = await asyncio.gather(*(
+            request(reader, writer, "POST", "/mix-design", payload)
+            for payload, (reader, writer) in zip(payloads, connections)
+        ))
+        self.assertEqual([status for status, _, _ in responses], [400, 400, 400, 200])
+        self.assertIn("slump_mm", json.loads(responses[0][2])["error"])
+        reader, writer = await self.connect()
+        body = json.dumps(SPEC).replace("}", ', "slump_mm": NaN}').encode()
+        writer.write(f"POST /mix-design HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+        head = (await reader.readuntil(b"\r\n\r\n")).decode()
+        self.assertTrue(head.startswith("HTTP/1.1 400"))
+        length = int(head.split("Content-Length: ")[1].split("\r\n")[0])
+        self.assertIn("slump_mm", json.loads(await reader.readexactly(length))["error"])
+
+    async def test_null_inputs(self):
+        payloads = [dict(SPEC, cement_specific_gravity=None),
+                    dict(SPEC, fly_ash_specific_gravity=None, coarse_aggregate_water_absorption=None), SPEC]
+        connections = [await self.connect() for _ in payloads]
+        responses = await asyncio.gather(*(
+            request(reader, writer, "POST", "/mix-design", payload)
+            for payload, (reader, writer) in zip(payloads, connections)
+        ))
+        self.assertEqual([status for status, _, _ in responses], [400, 200, 200])
+        self.assertIn("cement_specific_gravity", json.loads(responses[0][2])["error"])
+        defaulted, expected = (json.loads(data) for _, _, data in responses[1:])
+        self.assertEqual(defaulted["cement_mass_kg"], expected["cement_mass_kg"])
+        self.assertEqual(defaulted["coarse_aggregate_water_absorption"], 0.0)
+
+    async def test_failing_row_does_not_fail_its_batch(self):
+        def compute(columns, table_version):
+            if 123.0 in columns["slump_mm"]:
+                raise ZeroDivisionError("float division by zero")
+            return compute_mix_designs(columns, table_version)
+
+        payloads = [dict(SPEC, slump_mm=123.0), SPEC, dict(SPEC, concrete_grade="M35")]
+        connections = [await self.connect() for _ in payloads]
+        with mock.patch.object(server_module, "compute_mix_designs", compute):
+            responses = await asyncio.gather(*(
+                request(reader, writer, "POST", "/mix-design", payload)
+                for payload, (reader, writer) in zip(payloads, connections)
+            ))
+        self.assertEqual([status for status, _, _ in responses], [400, 200, 200])
+        self.assertIn("division by zero", json.loads(responses[0][2])["error"])
+
+    async def test_content_length_must_be_an_integer(self):
+        reader, writer = await self.connect()
+        writer.write(b"POST /mix-design HTTP/1.1\r\nContent-Length: abc\r\n\r\n")
+        await writer.drain()
+        head = (await reader.readuntil(b"\r\n\r\n")).decode()
+        self.assertTrue(head.startswith("HTTP/1.1 400"))
+
+    async def test_metrics_endpoint(self):
+        enable_metrics()
+        reader, writer = await self.connect()
+        await request(reader, writer, "POST", "/mix-design", SPEC)
+        status, headers, data = await request(reader, writer, "GET", "/metrics")
+        self.assertEqual(status, 200)
+        self.assertTrue(headers["Content-Type"].startswith("text/plain"))
+        text = data.decode()
+        self.assertIn("civilutils_server_requests_total 2", text)
+        self.assertIn("civilutils_server_designs_total 1", text)
+        self.assertIn("# TYPE civilutils_stage_calls_total counter", text)
+
+
+class TestServerArguments(unittest.TestCase):
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(ValueError):
+            MixDesignServer(batch_window=-1)
+        with self.assertRaises(ValueError):
+            MixDesignServer(max_batch_size=0)
+        with self.assertRaises(ValueError):
+            MixDesignServer(table_version="IS 456")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import sys
+import unittest
+import warnings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.batch import compute_mix_designs
+from civilutils.indian_standards.concrete import (
+    ConcreteGrade,
+    ConcreteMixDesign,
+    ExposureCondition,
+    MineralAdmixture,
+    SpecificGravity,
+    Materials,
+)
+from civilutils.indian_standards.design_space import DESIGN_SPACE, design_index
+from civilutils.indian_standards.space_index import INDEXED_COLUMNS, DesignSpaceIndex
+
+SPECIFIC_GRAVITIES = {
+    "cement_specific_gravity": 3.15,
+    "fine_aggregate_specific_gravity": 2.60,
+    "coarse_aggregate_specific_gravity": 2.70,
+    "water_specific_gravity": 1.00,
+    "admixture_specific_gravity": 1.145,
+}
+
+SG_LIST = [
+    SpecificGravity(Materials.CEMENT, 3.15),
+    SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+    SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+    SpecificGravity(Materials.WATER, 1.00),
+    SpecificGravity(Materials.ADMIXTURE, 1.145),
+]
+
+
+class TestDesignSpaceIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.index = DesignSpaceIndex(slump_mm=100)
+
+    def brute_force(self, **ranges):
+        return [i for i in range(len(self.index))
+                if all((low is None or self.index.columns[name][i] >= low)
+                       and (high is None or self.index.columns[name][i] <= high)
+                       for name, (low, high) in ranges.items())]
+
+    def test_indexed_values_match_batch_results(self):
+        specs = [self.index.spec(i) for i in range(len(self.index))]
+        columns = {name: [spec[name] for spec in specs] for name in specs[0]}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = compute_mix_designs(dict(columns, **SPECIFIC_GRAVITIES))
+        for name in INDEXED_COLUMNS:
+            with self.subTest(name=name):
+                self.assertEqual(list(self.index.columns[name]), list(results[name]))
+
+    def test_range_queries_match_brute_force(self):
+        queries = [
+            {"cement_mass_kg": (340, 380), "water_cement_ratio": (None, 0.45)},
+            {"cement_mass_kg": (None, 300)},
+            {"water_mass_kg": (150, 170), "fly_ash_mass_kg": (1, None)},
+            {"coarse_aggregate_volume_proportion": (0.6, 0.62), "target_mean_strength_N_per_mm2": (38, 50)},
+            {"cement_mass_kg": (450, None)},
+            {"cement_mass_kg": (900, None)},
+        ]
+        for query in queries:
+            with self.subTest(query=query):
+                expected = self.brute_force(**query)
+                self.assertEqual(self.index.indices(**query), expected)
+                self.assertEqual(self.index.count(**query), len(expected))
+        self.assertEqual(self.index.count(cement_mass_kg=(900, None)), 0)
+
+    def test_axis_filters(self):
+        matches = self.index.indices(cement_mass_kg=(340, 380), concrete_grade="M30",
+                                     mineral_admixture=[None, "Fly Ash"], is_pumpable=True)
+        expected = [i for i in self.brute_force(cement_mass_kg=(340, 380))
+                    if self.index.combinations[i][0] == ConcreteGrade.M30
+                    and self.index.combinations[i][4]
+                    and self.index.combinations[i][6] in (None, MineralAdmixture.FLY_ASH)]
+        self.assertTrue(expected)
+        self.assertEqual(matches, expected)
+        self.assertEqual(len(self.index.indices(concrete_grade=ConcreteGrade.M30)), len(DESIGN_SPACE) // len(ConcreteGrade))
+
+    def test_specs_reproduce_the_design(self):
+        spec = self.index.query(cement_mass_kg=(340, 380), water_cement_ratio=(None, 0.45),
+                                exposure_condition=ExposureCondition.SEVERE)[0]
+        i = design_index(*(spec[name] for name in ("concrete_grade", "exposure_condition", "maximum_nominal_size",
+                                                   "fine_aggregate_zone", "is_pumpable", "chemical_admixture",
+                                                   "mineral_admixture")))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            design = ConcreteMixDesign(specific_gravities=SG_LIST, **spec)
+            result = design.compute_mix_design(compact=True)
+        self.assertEqual(result.component("cement").mass_kg, self.index.values(i)["cement_mass_kg"])
+        self.assertEqual(design.slump_mm, 100)
+
+    def test_invalid_filters(self):
+        with self.assertRaises(ValueError):
+            self.index.indices(cement=(300, 400))
+        with self.assertRaises(ValueError):
+            self.index.indices(cement_mass_kg=(400, 300))
+        with self.assertRaises(ValueError):
+            self.index.indices(concrete_grade="M99")
+
+
+if __name__ == "__main__":
+    unittest.main()
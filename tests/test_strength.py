@@ -0,0 +1,162 @@
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import unittest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+)
+from civilutils.indian_standards.archive import SQLiteArchive
+from civilutils.indian_standards.batch import RESULT_COLUMNS, compute_mix_designs, design_spec
+from civilutils.indian_standards.columnar import ColumnarReader, ColumnarWriter
+from civilutils.indian_standards.sensitivity import compute_sensitivities
+from civilutils.indian_standards.strength import CubeResult, RunningStatistics, StandardDeviationEstimator
+from civilutils.indian_standards.sweep import run_sweep
+
+
+def make_design(**kwargs):
+    return ConcreteMixDesign(
+        concrete_grade=ConcreteGrade.M30,
+        exposure_condition=ExposureCondition.SEVERE,
+        specific_gravities=[
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ],
+        **kwargs,
+    )
+
+
+def cube_results(plant, grade, n, mean, std, seed=0):
+    rng = random.Random(seed)
+    return [CubeResult(plant, grade, rng.gauss(mean, std)) for _ in range(n)]
+
+
+class TestStandardDeviationEstimator(unittest.TestCase):
+    def test_matches_sample_standard_deviation(self):
+        results = cube_results("North", ConcreteGrade.M30, 500, 38.0, 4.2)
+        estimator = StandardDeviationEstimator()
+        self.assertEqual(estimator.ingest(results), 500)
+        expected = statistics.stdev(r.strength for r in results)
+        self.assertAlmostEqual(estimator.standard_deviation("North", "M30"), expected, places=9)
+        self.assertEqual(estimator.count("North", ConcreteGrade.M30), 500)
+
+    def test_window_keeps_latest_results(self):
+        results = (cube_results("North", "M30", 200, 38.0, 6.0, seed=1)
+                   + cube_results("North", "M30", 100, 38.0, 2.0, seed=2))
+        estimator = StandardDeviationEstimator(window=100)
+        estimator.ingest(results)
+        expected = statistics.stdev(r.strength for r in results[-100:])
+        self.assertAlmostEqual(estimator.standard_deviation("North", "M30"), expected, places=9)
+        self.assertEqual(estimator.count("North", "M30"), 100)
+
+    def test_plants_and_grades_are_separate(self):
+        estimator = StandardDeviationEstimator()
+        estimator.ingest(cube_results("North", "M30", 40, 38.0, 3.0)
+                         + cube_results("South", "M30", 40, 38.0, 6.0, seed=3)
+                         + cube_results("North", "M25", 10, 31.0, 4.0))
+        self.assertLess(estimator.standard_deviation("North", "M30"), estimator.standard_deviation("South", "M30"))
+        # fewer than 30 results: no site value yet
+        self.assertIsNone(estimator.standard_deviation("North", "M25"))
+        self.assertIsNone(estimator.standard_deviation("East", "M30"))
+
+    def test_remove_restores_statistics(self):
+        running = RunningStatistics()
+        for value in (30.0, 35.0, 40.0, 50.0):
+            running.add(value)
+        running.remove(30.0)
+        self.assertAlmostEqual(running.mean, statistics.mean((35.0, 40.0, 50.0)))
+        self.assertAlmostEqual(running.standard_deviation, statistics.stdev((35.0, 40.0, 50.0)))
+
+    def test_apply_sets_target_mean_strength(self):
+        design = make_design()
+        design.compute_mix_design()
+        self.assertEqual(design.standard_deviation, 5.0)
+        estimator = StandardDeviationEstimator()
+        estimator.ingest(cube_results("North", "M30", 60, 38.0, 3.0))
+        site = estimator.apply(design, "North")
+        design.compute_mix_design()
+        self.assertEqual(design.standard_deviation, site)
+        self.assertAlmostEqual(design.target_mean_compressive_strength, 30 + 1.65 * site)
+        self.assertEqual(design.last_recomputed_stages, ("target_mean_strength",))
+        # no estimate for the plant: back to the table value
+        estimator.apply(design, "South")
+        design.compute_mix_design()
+        self.assertEqual(design.standard_deviation, 5.0)
+
+    def test_apply_without_spread_uses_table_value(self):
+        design = make_design()
+        estimator = StandardDeviationEstimator()
+        estimator.ingest(CubeResult("North", "M30", 38.0) for _ in range(30))
+        self.assertEqual(estimator.standard_deviation("North", "M30"), 0.0)
+        self.assertIsNone(estimator.apply(design, "North"))
+        design.compute_mix_design()
+        self.assertEqual(design.standard_deviation, 5.0)
+
+    def test_site_standard_deviation_reaches_design_space_paths(self):
+        design = make_design(site_standard_deviation=2.0)
+        result = design.compute_mix_design(compact=True)
+        self.assertAlmostEqual(design.target_mean_compressive_strength, 33.3)
+        spec = design_spec(design)
+        columns = {name: [value] for name, value in spec.items()}
+        batch = compute_mix_designs(columns)
+        sweep = run_sweep(columns, max_workers=1)
+        sensitivity = compute_sensitivities(design)
+        with SQLiteArchive(":memory:") as archive:
+            archive.insert_designs([design])
+            archived = archive.query()[0]
+        with tempfile.TemporaryDirectory() as path:
+            with ColumnarWriter(path) as writer:
+                writer.append_designs([design])
+            with ColumnarReader(path) as reader:
+                stored = {name: reader.column(name)[0] for name in RESULT_COLUMNS}
+        for name in RESULT_COLUMNS:
+            with self.subTest(name=name):
+                self.assertEqual(sweep[name][0], batch[name][0])
+                self.assertEqual(sensitivity.values[name], batch[name][0])
+                self.assertEqual(getattr(archived, name), batch[name][0])
+                self.assertEqual(stored[name], batch[name][0])
+        self.assertEqual(batch["target_mean_strength_N_per_mm2"][0], design.target_mean_compressive_strength)
+        self.assertEqual(batch["cement_mass_kg"][0], result.component("cement").mass_kg)
+        self.assertEqual(batch["free_water_after_correction"][0], result.free_water_after_correction)
+
+    def test_async_ingest(self):
+        results = cube_results("North", "M30", 50, 38.0, 4.0)
+
+        async def feed():
+            for result in results:
+                await asyncio.sleep(0)
+                yield result
+
+        estimator = StandardDeviationEstimator()
+        self.assertEqual(asyncio.run(estimator.aingest(feed())), 50)
+        self.assertAlmostEqual(estimator.standard_deviation("North", "M30"),
+                               statistics.stdev(r.strength for r in results))
+
+    def test_invalid_input_raises(self):
+        estimator = StandardDeviationEstimator()
+        for plant, grade, strength in (("North", "M99", 30.0), ("North", "M30", -1.0),
+                                       ("North", "M30", "weak"), ("North", "M30", float("nan"))):
+            with self.subTest(grade=grade, strength=strength):
+                with self.assertRaises(ValueError):
+                    estimator.add(plant, grade, strength)
+        with self.assertRaises(ValueError):
+            StandardDeviationEstimator(window=10)
+        with self.assertRaises(ValueError):
+            make_design(site_standard_deviation=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import unittest
+import warnings
+from multiprocessing import shared_memory
+from unittest import mock
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteGrade,
+    ExposureCondition,
+    MineralAdmixture,
+)
+from civilutils.indian_standards.batch import compute_mix_designs
+from civilutils.indian_standards import sweep
+from civilutils.indian_standards.sweep import run_sweep, sweep_grid
+
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        self.specs = sweep_grid(
+            concrete_grade=list(ConcreteGrade),
+            exposure_condition=list(ExposureCondition),
+            slump_mm=[25.0, 75.0, None],
+            mineral_admixture=[None, MineralAdmixture.FLY_ASH],
+            mineral_admixture_percentage=[None, 20.0],
+            coarse_aggregate_specific_gravity=[2.65, 2.74],
+            cement_specific_gravity=3.15,
+            fine_aggregate_specific_gravity=2.60,
+            water_specific_gravity=1.00,
+            admixture_specific_gravity=1.145,
+        )
+
+    def test_sweep_grid_expands_cartesian_product(self):
+        self.assertEqual(len(self.specs["concrete_grade"]), 10 * 5 * 3 * 2 * 2 * 2)
+        self.assertEqual(self.specs["cement_specific_gravity"], 3.15)
+
+    def test_matches_batch_engine_in_input_order(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            expected = compute_mix_designs(self.specs)
+            results = run_sweep(self.specs, max_workers=2, chunk_size=97)
+        self.assertEqual(results, expected)
+
+    def test_empty_sweep(self):
+        specs = dict(self.specs)
+        for name, value in specs.items():
+            if isinstance(value, list):
+                specs[name] = []
+        results = run_sweep(specs, max_workers=1)
+        self.assertEqual(len(results["cement_mass_kg"]), 0)
+
+    def test_input_block_is_released_when_output_block_fails(self):
+        created = []
+        real = shared_memory.SharedMemory
+
+        def create(*args, **kwargs):
+            if created:
+                raise OSError("no space left on device")
+            created.append(real(*args, **kwargs))
+            return created[-1]
+
+        with mock.patch.object(sweep.shared_memory, "SharedMemory", create):
+            with self.assertRaisesRegex(OSError, "no space"):
+                run_sweep(self.specs, max_workers=1)
+        self.assertEqual(len(created), 1)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=created[0].name)
+
+
+if __name__ == "__main__":
+    unittest.main()
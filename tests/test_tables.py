@@ -0,0 +1,155 @@
+import os
+import sys
+import unittest
+import warnings
+from itertools import product
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    MaximumNominalSize,
+    ExposureCondition,
+    SpecificGravity,
+    FineAggregateZone,
+    Materials,
+    COARSE_AGGREGATE_PROPORTION_BY_SIZE_AND_ZONE,
+    DEFAULT_TABLE_VERSION,
+    TABLE_SETS,
+    get_table_set,
+)
+from civilutils.indian_standards.batch import compute_mix_designs
+from civilutils.indian_standards.cache import MixDesignCache
+from civilutils.indian_standards.design_space import DESIGN_SPACE, design_index, get_design_space
+
+
+SG_LIST = [
+    SpecificGravity(Materials.CEMENT, 3.15),
+    SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+    SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+    SpecificGravity(Materials.WATER, 1.00),
+    SpecificGravity(Materials.ADMIXTURE, 1.145),
+]
+
+SG_COLUMNS = {
+    "cement_specific_gravity": 3.15,
+    "fine_aggregate_specific_gravity": 2.60,
+    "coarse_aggregate_specific_gravity": 2.70,
+    "water_specific_gravity": 1.00,
+    "admixture_specific_gravity": 1.145,
+}
+
+
+def make_design(grade=ConcreteGrade.M25, size=MaximumNominalSize.SIZE_20, **kwargs):
+    return ConcreteMixDesign(
+        concrete_grade=grade,
+        maximum_nominal_size=size,
+        fine_aggregate_zone=FineAggregateZone.ZONE_II,
+        exposure_condition=ExposureCondition.MODERATE,
+        is_pumpable=False,
+        specific_gravities=SG_LIST,
+        **kwargs,
+    )
+
+
+class TestTableSets(unittest.TestCase):
+    def test_registry_contains_both_editions(self):
+        self.assertIn("IS 10262:2009", TABLE_SETS)
+        self.assertIn("IS 10262:2019", TABLE_SETS)
+        self.assertEqual(DEFAULT_TABLE_VERSION, "IS 10262:2009")
+
+    def test_unknown_version_raises(self):
+        with self.assertRaises(ValueError):
+            get_table_set("IS 10262:1982")
+        with self.assertRaises(ValueError):
+            make_design(table_version="IS 10262:1982")
+
+    def test_compiled_tables_match_source_tables(self):
+        tables = get_table_set("IS 10262:2009")
+        for size, zone in product(MaximumNominalSize, FineAggregateZone):
+            self.assertEqual(tables.get_coarse_aggregate_proportion(size, zone),
+                             COARSE_AGGREGATE_PROPORTION_BY_SIZE_AND_ZONE[size][zone])
+        self.assertIsNone(tables.get_target_strength_margin(ConcreteGrade.M25))
+        self.assertIsInstance(tables.water_content, tuple)
+
+    def test_2019_target_strength_uses_higher_of_both_rules(self):
+        tables = get_table_set("IS 10262:2019")
+        self.assertEqual(tables.get_target_strength_margin(ConcreteGrade.M20), 5.5)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            design = make_design(grade=ConcreteGrade.M20, table_version="IS 10262:2019")
+            design.compute_mix_design()
+        # 20 + 1.65 * 4.0 = 26.6 is above 20 + 5.5
+        self.assertAlmostEqual(design.target_mean_compressive_strength, 26.6)
+
+    def test_versions_differ_in_aggregate_proportions(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            size = MaximumNominalSize.SIZE_10
+            old = make_design(size=size).compute_mix_design(compact=True)
+            new = make_design(size=size, table_version="IS 10262:2019").compute_mix_design(compact=True)
+        self.assertNotEqual(old.coarse_aggregate_proportion, new.coarse_aggregate_proportion)
+
+    def test_tables_follow_table_version(self):
+        design = make_design(size=MaximumNominalSize.SIZE_10)
+        self.assertIs(design.tables, get_table_set(DEFAULT_TABLE_VERSION))
+        design.table_version = "IS 10262:2019"
+        self.assertIs(design.tables, get_table_set("IS 10262:2019"))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            assigned = design.compute_mix_design(compact=True)
+            expected = make_design(size=MaximumNominalSize.SIZE_10,
+                                   table_version="IS 10262:2019").compute_mix_design(compact=True)
+        self.assertEqual(assigned.coarse_aggregate_proportion, expected.coarse_aggregate_proportion)
+
+    def test_cache_keys_on_table_version(self):
+        cache = MixDesignCache()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            make_design(result_cache=cache).compute_mix_design()
+            make_design(result_cache=cache, table_version="IS 10262:2019").compute_mix_design()
+        self.assertEqual(cache.stats()["misses"], 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_design_spaces_are_shared_per_version(self):
+        self.assertIs(get_design_space(), DESIGN_SPACE)
+        self.assertIs(get_design_space("IS 10262:2019"), get_design_space("IS 10262:2019"))
+
+    def test_batch_matches_scalar_for_2019_tables(self):
+        specs = dict(SG_COLUMNS)
+        grades = list(ConcreteGrade)
+        specs.update(
+            concrete_grade=grades,
+            exposure_condition=ExposureCondition.SEVERE,
+            maximum_nominal_size=MaximumNominalSize.SIZE_40,
+            fine_aggregate_zone=FineAggregateZone.ZONE_I,
+            is_pumpable=True,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = compute_mix_designs(specs, table_version="IS 10262:2019")
+            for i, grade in enumerate(grades):
+                design = ConcreteMixDesign(
+                    concrete_grade=grade,
+                    maximum_nominal_size=MaximumNominalSize.SIZE_40,
+                    fine_aggregate_zone=FineAggregateZone.ZONE_I,
+                    exposure_condition=ExposureCondition.SEVERE,
+                    is_pumpable=True,
+                    specific_gravities=SG_LIST,
+                    table_version="IS 10262:2019",
+                )
+                result = design.compute_mix_design(compact=True)
+                self.assertEqual(results["target_mean_strength_N_per_mm2"][i], result.target_mean_strength)
+                self.assertEqual(results["coarse_aggregate_mass_kg"][i], result.coarse_aggregate.mass_kg)
+                self.assertEqual(results["cement_mass_kg"][i], result.cement.mass_kg)
+
+    def test_design_index_is_version_independent(self):
+        index = design_index(ConcreteGrade.M30, ExposureCondition.MILD, MaximumNominalSize.SIZE_10,
+                             FineAggregateZone.ZONE_III, False, None, None)
+        self.assertLess(index, len(get_design_space("IS 10262:2019")))
+
+
+if __name__ == "__main__":
+    unittest.main()
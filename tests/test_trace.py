@@ -0,0 +1,100 @@
+import os
+import sys
+import io
+import contextlib
+import logging
+import unittest
+import warnings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    MineralAdmixture,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+)
+from civilutils.indian_standards.cache import MixDesignCache
+from civilutils.indian_standards.trace import (
+    ConsoleRenderer,
+    LoggingSink,
+    TraceCollector,
+)
+
+
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        self.sg_list = [
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ]
+
+    def make_design(self, **kwargs):
+        return ConcreteMixDesign(
+            concrete_grade=ConcreteGrade.M30,
+            exposure_condition=ExposureCondition.SEVERE,
+            specific_gravities=self.sg_list,
+            **kwargs
+        )
+
+    def test_collector_receives_every_stage_with_values(self):
+        collector = TraceCollector()
+        design = self.make_design(trace_sink=collector)
+        result = design.compute_mix_design()
+        stages = [event.stage for event in collector.events]
+        self.assertEqual(stages, [
+            "calculation_started", "target_mean_strength", "water_cement_ratio",
+            "water_content", "cement_content", "aggregate_proportions", "mix_quantities",
+        ])
+        self.assertEqual(collector.stage("water_cement_ratio")["water_cement_ratio"], design.water_cement_ratio)
+        self.assertEqual(collector.stage("mix_quantities")["cement_mass_kg"],
+                         result["mix_per_m3"]["components"]["cement"]["mass_kg"])
+        self.assertIsNone(collector.stage("cement_with_fly_ash"))
+
+    def test_fly_ash_and_volume_events(self):
+        collector = TraceCollector()
+        design = self.make_design(trace_sink=collector, mineral_admixture=MineralAdmixture.FLY_ASH)
+        design.compute_mix_design_for_volume(2.0)
+        fly_ash = collector.stage("cement_with_fly_ash")
+        self.assertEqual(fly_ash["fly_ash_content"], design.fly_ash_content)
+        self.assertEqual(collector.stage("volume_quantities")["volume_m3"], 2.0)
+
+    def test_console_renderer_reproduces_display_output(self):
+        displayed = io.StringIO()
+        with contextlib.redirect_stdout(displayed):
+            self.make_design().compute_mix_design(display_result=True)
+        rendered = io.StringIO()
+        self.make_design(trace_sink=ConsoleRenderer(file=rendered)).compute_mix_design()
+        self.assertEqual(rendered.getvalue(), displayed.getvalue())
+
+    def test_logging_sink(self):
+        design = self.make_design(trace_sink=LoggingSink(level=logging.INFO))
+        with self.assertLogs("civilutils.trace", level="INFO") as logs:
+            design.compute_mix_design()
+        self.assertTrue(any("water_content" in line for line in logs.output))
+
+    def test_tracing_bypasses_cache(self):
+        cache = MixDesignCache()
+        collector = TraceCollector()
+        design = self.make_design(result_cache=cache, trace_sink=collector)
+        design.compute_mix_design()
+        design.compute_mix_design()
+        self.assertEqual(cache.stats()["hits"] + cache.stats()["misses"], 0)
+        self.assertEqual(sum(e.stage == "mix_quantities" for e in collector.events), 2)
+
+    def test_no_output_without_sink(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.make_design().compute_mix_design()
+        self.assertEqual(out.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import random
+import sys
+import unittest
+import warnings
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from civilutils.indian_standards.batch import compute_mix_designs, design_spec
+from civilutils.indian_standards.concrete import (
+    ConcreteMixDesign,
+    ConcreteGrade,
+    ExposureCondition,
+    SpecificGravity,
+    Materials,
+    MineralAdmixture,
+)
+from civilutils.indian_standards.uncertainty import Normal, Triangular, Uniform, monte_carlo
+
+
+def make_design(**kwargs):
+    return ConcreteMixDesign(
+        concrete_grade=ConcreteGrade.M30,
+        exposure_condition=ExposureCondition.SEVERE,
+        specific_gravities=[
+            SpecificGravity(Materials.CEMENT, 3.15),
+            SpecificGravity(Materials.FINE_AGGREGATE, 2.60),
+            SpecificGravity(Materials.COARSE_AGGREGATE, 2.70),
+            SpecificGravity(Materials.WATER, 1.00),
+            SpecificGravity(Materials.ADMIXTURE, 1.145),
+        ],
+        fine_aggregate_water_absorption=1.0,
+        **kwargs,
+    )
+
+
+DISTRIBUTIONS = {
+    "fine_aggregate_surface_moisture": Normal(2.0, 0.5, low=0.0),
+    "fine_aggregate_specific_gravity": Uniform(2.55, 2.65),
+    "slump_mm": Triangular(50.0, 75.0, 100.0),
+}
+
+
+class TestMonteCarlo(unittest.TestCase):
+    def test_degenerate_distributions_reproduce_design(self):
+        design = make_design(mineral_admixture=MineralAdmixture.FLY_ASH, fine_aggregate_surface_moisture=2.0)
+        result = monte_carlo(design, {"fine_aggregate_surface_moisture": Normal(2.0, 0.0)}, samples=1000, seed=1)
+        expected = compute_mix_designs(design_spec(design))
+        for name, output in result.outputs.items():
+            self.assertEqual(output.minimum, expected[name][0])
+            self.assertEqual(output.maximum, expected[name][0])
+            self.assertEqual(set(output.percentiles.values()), {expected[name][0]})
+            self.assertAlmostEqual(output.std, 0.0)
+            self.assertEqual(sum(output.histogram), 1000)
+
+    def test_nominal_matches_compute_mix_design(self):
+        design = make_design(site_standard_deviation=2.0, slump_mm=100, fine_aggregate_surface_moisture=2.0)
+        design.slump_adjustment_pct_per_25mm = 0.05
+        result = design.compute_mix_design(compact=True)
+        nominal = monte_carlo(design, {"fine_aggregate_surface_moisture": Normal(2.0, 0.0)},
+                              outputs=("target_mean_strength_N_per_mm2", "water_mass_kg", "cement_mass_kg",
+                                       "fine_aggregate_mass_kg", "free_water_after_correction"),
+                              samples=100, seed=1).outputs
+        self.assertEqual(nominal["target_mean_strength_N_per_mm2"].minimum, design.target_mean_compressive_strength)
+        for name in ("water", "cement", "fine_aggregate"):
+            self.assertEqual(nominal[f"{name}_mass_kg"].minimum, result.component(name).mass_kg)
+        self.assertEqual(nominal["free_water_after_correction"].maximum, result.free_water_after_correction)
+
+    def test_seed_reproduces_results_for_any_chunk_size(self):
+        first = monte_carlo(make_design(), DISTRIBUTIONS, samples=5000, seed=7, chunk_size=4096)
+        second = monte_carlo(make_design(), DISTRIBUTIONS, samples=5000, seed=7, chunk_size=333)
+        for name, output in first.outputs.items():
+            self.assertEqual(output.minimum, second.outputs[name].minimum)
+            self.assertEqual(output.maximum, second.outputs[name].maximum)
+            self.assertAlmostEqual(output.mean, second.outputs[name].mean)
+        other = monte_carlo(make_design(), DISTRIBUTIONS, samples=5000, seed=8)
+        self.assertNotEqual(first.outputs["fine_aggregate_mass_kg"].mean, other.outputs["fine_aggregate_mass_kg"].mean)
+
+    def test_statistics_match_exact_evaluation(self):
+        design, samples, seed = make_design(), 20000, 3
+        result = monte_carlo(design, DISTRIBUTIONS, samples=samples, seed=seed, percentiles=(5, 50, 95), chunk_size=3000)
+        # regenerate the same samples and evaluate them with the batch engine
+        spec = design_spec(design)
+        for name in sorted(DISTRIBUTIONS):
+            spec[name] = DISTRIBUTIONS[name].sample(random.Random(f"{seed}:{name}"), samples)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            exact = compute_mix_designs(spec)
+        for name, output in result.outputs.items():
+            values = sorted(exact[name])
+            self.assertEqual(output.minimum, values[0])
+            self.assertEqual(output.maximum, values[-1])
+            self.assertAlmostEqual(output.mean, sum(values) / samples, places=6)
+            tolerance = (values[-1] - values[0]) * 0.01 + 1e-9
+            for p, value in output.percentiles.items():
+                self.assertAlmostEqual(value, values[int(p / 100 * (samples - 1))], delta=tolerance)
+            self.assertEqual(sum(output.histogram), samples)
+            self.assertEqual(len(output.bin_edges), len(output.histogram) + 1)
+
+    def test_clipped_normal_stays_within_bounds(self):
+        values = Normal(0.1, 1.0, low=0.0, high=0.5).sample(random.Random(1), 1000)
+        self.assertTrue(all(0.0 <= v <= 0.5 for v in values))
+
+    def test_invalid_arguments_raise(self):
+        with self.assertRaises(ValueError):
+            monte_carlo(make_design(), {"concrete_grade": Uniform(0, 1)})
+        with self.assertRaises(ValueError):
+            monte_carlo(make_design(), {"slump_mm": Normal(50, -1)})
+        with self.assertRaises(ValueError):
+            monte_carlo(make_design(), {"slump_mm": Triangular(50, 120, 100)})
+        with self.assertRaises(ValueError):
+            monte_carlo(make_design(), {}, outputs=("steel_mass_kg",))
+        with self.assertRaises(ValueError):
+            monte_carlo(make_design(), {}, percentiles=(101,))
+        with self.assertRaises(ValueError):
+            monte_carlo(make_design(), {}, samples=0)
+
+
+if __name__ == "__main__":
+    unittest.main()